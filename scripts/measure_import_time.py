@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Measure the cold import time of negmas_negolog.
+
+Each statement is run in fresh interpreters (so nothing is cached in
+``sys.modules``) and the median wall time is reported. With ``--target``, the
+script exits with status 1 if the plain package import is slower than the
+target, so it can be used as a CI gate.
+
+Usage:
+    python scripts/measure_import_time.py
+    python scripts/measure_import_time.py --repeat 7 --target 2.5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Statements measured, from the cheapest to the most expensive. Importing the
+# negmas registry is the floor: negmas_negolog registers its agents in it.
+STATEMENTS = {
+    "negmas": "import negmas.registry",
+    "package": "import negmas_negolog",
+    "one agent": "from negmas_negolog import BoulwareAgent",
+    "all agents": "from negmas_negolog.agents import *",
+}
+
+# Suggested budget for ``import negmas_negolog`` in seconds
+DEFAULT_TARGET = 2.5
+
+
+def measure(statement: str, repeat: int) -> float:
+    """Median wall time (seconds) of running ``statement`` in a new interpreter."""
+    # Interpreter startup is measured separately and subtracted
+    baseline = _median_run("pass", repeat)
+    return max(_median_run(statement, repeat) - baseline, 0.0)
+
+
+def _median_run(statement: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", statement], check=True, capture_output=True
+        )
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per statement")
+    parser.add_argument(
+        "--target",
+        type=float,
+        default=None,
+        help=f"fail if 'import negmas_negolog' exceeds this (e.g. {DEFAULT_TARGET})",
+    )
+    args = parser.parse_args()
+
+    results = {name: measure(stmt, args.repeat) for name, stmt in STATEMENTS.items()}
+    for name, seconds in results.items():
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms  ({STATEMENTS[name]})")
+
+    if args.target is not None and results["package"] > args.target:
+        print(
+            f"import negmas_negolog took {results['package']:.2f}s "
+            f"(target {args.target:.2f}s)"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
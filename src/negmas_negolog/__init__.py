@@ -16,48 +16,97 @@ Example usage:
     >>> result = mechanism.run()
 """
 
-# Base wrapper classes and preference adapter
-from negmas_negolog.common import (
-    NegologNegotiatorWrapper,
-    NegologPreferenceAdapter,
-)
+from __future__ import annotations
 
-# All agent wrappers from individual modules
-from negmas_negolog.agents import (
-    # Time-based agents
-    BoulwareAgent,
-    ConcederAgent,
-    LinearAgent,
-    # Competition agents
-    MICROAgent,
-    Atlas3Agent,
-    NiceTitForTat,
-    YXAgent,
-    ParsCatAgent,
-    PonPokoAgent,
-    AgentGG,
-    SAGAAgent,
-    CUHKAgent,
-    AgentKN,
-    Rubick,
-    AhBuNeAgent,
-    ParsAgent,
-    RandomDance,
-    AgentBuyog,
-    Kawaii,
-    Caduceus2015,
-    Caduceus,
-    HardHeaded,
-    IAMhaggler,
-    LuckyAgent2022,
-    HybridAgent,
-)
+import importlib
+from importlib.metadata import version as _get_version
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from negmas_negolog.agents import (
+        AgentBuyog,
+        AgentGG,
+        AgentKN,
+        AhBuNeAgent,
+        Atlas3Agent,
+        BoulwareAgent,
+        Caduceus,
+        Caduceus2015,
+        ConcederAgent,
+        CUHKAgent,
+        HardHeaded,
+        HybridAgent,
+        IAMhaggler,
+        Kawaii,
+        LinearAgent,
+        LuckyAgent2022,
+        MICROAgent,
+        NiceTitForTat,
+        ParsAgent,
+        ParsCatAgent,
+        PonPokoAgent,
+        RandomDance,
+        Rubick,
+        SAGAAgent,
+        YXAgent,
+    )
+    from negmas_negolog.cache import (
+        AgentStateCache,
+        BidSpaceCache,
+        UtilityCache,
+        agent_state_cache,
+        bid_space_cache,
+    )
+    from negmas_negolog.common import (
+        NegologNegotiatorWrapper,
+        NegologPreferenceAdapter,
+        OutcomeBidCodec,
+    )
+    from negmas_negolog.instrumentation import LatencyRecorder
+    from negmas_negolog.remote import AgentHostPool, RemoteAgent, default_host_pool
+
+# Public names are imported on first access (PEP 562 module ``__getattr__``).
+# Importing the wrappers pulls in NegoLog and each agent's dependencies
+# (scikit-learn, numba, scipy, ...), which dominates the import time.
+_LAZY_ATTRS = {
+    # Base wrapper classes and preference adapter
+    "NegologNegotiatorWrapper": "negmas_negolog.common",
+    "NegologPreferenceAdapter": "negmas_negolog.common",
+    "OutcomeBidCodec": "negmas_negolog.common",
+    # Caches
+    "AgentStateCache": "negmas_negolog.cache",
+    "agent_state_cache": "negmas_negolog.cache",
+    "BidSpaceCache": "negmas_negolog.cache",
+    "UtilityCache": "negmas_negolog.cache",
+    "bid_space_cache": "negmas_negolog.cache",
+    # Latency instrumentation
+    "LatencyRecorder": "negmas_negolog.instrumentation",
+    # Out-of-process agents
+    "AgentHostPool": "negmas_negolog.remote",
+    "RemoteAgent": "negmas_negolog.remote",
+    "default_host_pool": "negmas_negolog.remote",
+}
 
 __all__ = [
     # Base wrapper class
     "NegologNegotiatorWrapper",
     # Preference adapter
     "NegologPreferenceAdapter",
+    "OutcomeBidCodec",
+    # Bid-space cache
+    "BidSpaceCache",
+    "bid_space_cache",
+    # Utility memoization
+    "UtilityCache",
+    # Agent-state reuse
+    "AgentStateCache",
+    "agent_state_cache",
+    # Latency instrumentation
+    "LatencyRecorder",
+    # Out-of-process agents
+    "AgentHostPool",
+    "RemoteAgent",
+    "default_host_pool",
     # Time-based agents
     "BoulwareAgent",
     "ConcederAgent",
@@ -87,10 +136,29 @@ __all__ = [
     "HybridAgent",
 ]
 
-from importlib.metadata import version as _get_version
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining ``name`` on first access."""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name])
+    elif name in __all__:
+        # All other public names are agent wrappers
+        module = importlib.import_module("negmas_negolog.agents")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = _get_version("negmas-negolog")
 
 # Auto-register agents in the negmas registry (if available)
-# This import triggers the registration via registry_init._register_negolog_agents()
-from negmas_negolog import registry_init as _registry_init  # noqa: F401
+# This import triggers the registration via registry_init._register_negolog_agents().
+# It stays last so that the module ``__getattr__`` is defined if a registry
+# without deferred entries makes it import the wrapper classes.
+from negmas_negolog import registry_init as _registry_init  # noqa: E402, F401
@@ -2,6 +2,8 @@ import math
 import random
 from typing import Dict, Optional
 
+import numpy as np
+
 import nenv
 from agents.AgentBuyog.Regression import Regression
 from agents.AgentBuyog.OpponentInfo import OpponentInfo
@@ -324,20 +326,20 @@ class AgentBuyog(nenv.AbstractAgent):
         :param estimated_preference: Estimated opponent preferences
         :return: Utility of the agent
         """
-        best_social_welfare = 0
-        best_utility_me = 0
+        my_utilities = self.preference.bid_utilities
+        social_welfare = my_utilities + estimated_preference.get_utilities(
+            self.preference.bid_indices
+        )
 
-        for bid in self.preference.bids:
-            my_utility = bid.utility
-            opp_utility = estimated_preference.get_utility(bid)
+        if len(social_welfare) == 0:
+            return 0
 
-            social_welfare = my_utility + opp_utility
+        best = int(np.argmax(social_welfare))
 
-            if social_welfare > best_social_welfare:
-                best_social_welfare = social_welfare
-                best_utility_me = my_utility
+        if social_welfare[best] > 0:
+            return float(my_utilities[best])
 
-        return best_utility_me
+        return 0
 
     def determineDifference(
         self, senderInfo: OpponentInfo, first: BidDetails, second: BidDetails
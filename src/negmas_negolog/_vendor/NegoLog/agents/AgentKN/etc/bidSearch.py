@@ -86,11 +86,11 @@ class bidSearch:
         relativeUtility = 0.
 
         value_relative_utility = self.negotiatingInfo.value_relative_utility
-        issues = self.negotiatingInfo.issues.copy()
+        issues = list(self.negotiatingInfo.issues)
         np.random.shuffle(issues)
 
         for issue in issues:
-            randomValues = issue.values.copy()
+            randomValues = list(issue.values)
             np.random.shuffle(randomValues)
 
             for value in randomValues:
@@ -116,7 +116,7 @@ class bidSearch:
         currentTempreature = self.START_TEMPERATURE
         newCost = 1.0
         current_cost = 1.0
-        issues = self.pref.issues.copy()
+        issues = list(self.pref.issues)
 
         while currentTempreature > self.END_TEMPERATURE:
             next_bid = current_bid.copy()
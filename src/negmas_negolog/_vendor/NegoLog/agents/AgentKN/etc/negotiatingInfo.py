@@ -77,7 +77,7 @@ class negotiatingInfo:
 
     def __init__(self, preference: nenv.Preference):
         self.pref = preference
-        self.issues = self.pref.issues.copy()
+        self.issues = list(self.pref.issues)
         self.round = 0
         self.negotiator_num = 0
         self.isLinerUtilitySpace = True
@@ -89,11 +89,11 @@ class bidSearch:
         relativeUtility = 0.
 
         value_relative_utility = self.negotiatingInfo.value_relative_utility
-        issues = self.negotiatingInfo.issues.copy()
+        issues = list(self.negotiatingInfo.issues)
         np.random.shuffle(issues)
 
         for issue in issues:
-            randomValues = issue.values.copy()
+            randomValues = list(issue.values)
             np.random.shuffle(randomValues)
 
             for value in randomValues:
@@ -119,7 +119,7 @@ class bidSearch:
         currentTempreature = self.START_TEMPERATURE
         newCost = 1.0
         current_cost = 1.0
-        issues = self.pref.issues.copy()
+        issues = list(self.pref.issues)
 
         while currentTempreature > self.END_TEMPERATURE:
             next_bid = current_bid.copy()
@@ -168,10 +168,10 @@ class bidSearch:
         target_bid_util = 0.
         randomnr = random.Random()
         values = []
-        issues = self.pref.issues.copy()
+        issues = list(self.pref.issues)
 
         for issue in issues:
-            values = issue.values.copy()
+            values = list(issue.values)
             for value in values:
                 current_bid[issue] = value
                 current_bid_util = self.pref.get_utility(current_bid)
@@ -203,7 +203,7 @@ class bidSearch:
         randomOrderOpponents = self.negotiatingInfo.opponents.copy()
         np.random.shuffle(randomOrderOpponents)
 
-        randomOrderIssues = self.pref.issues.copy()
+        randomOrderIssues = list(self.pref.issues)
         np.random.shuffle(randomOrderIssues)
 
         for issue in randomOrderIssues:
@@ -219,10 +219,10 @@ class bidSearch:
         current_bid = baseBid.copy()
         critical_issues = []
         values = []
-        issues = self.pref.issues.copy()
+        issues = list(self.pref.issues)
 
         for issue in issues:
-            values = issue.values.copy()
+            values = list(issue.values)
 
             for value in values:
                 current_bid[issue] = value
@@ -32,7 +32,7 @@ class negotiatingInfo:
 
     def __init__(self, preference: nenv.Preference):
         self.pref = preference
-        self.issues = self.pref.issues.copy()
+        self.issues = list(self.pref.issues)
         self.BOU = 0.
         self.MPBU = 0.
         self.time_scale = 0.
@@ -162,7 +162,7 @@ class negotiatingInfo:
 
         max_value = None
 
-        randomOrderValues = issue.values.copy()
+        randomOrderValues = list(issue.values)
         np.random.shuffle(randomOrderValues)
 
         for value in randomOrderValues:
@@ -180,7 +180,7 @@ class negotiatingInfo:
 
         max_value = None
 
-        randomOrderValues = issue.values.copy()
+        randomOrderValues = list(issue.values)
         np.random.shuffle(randomOrderValues)
 
         for value in randomOrderValues:
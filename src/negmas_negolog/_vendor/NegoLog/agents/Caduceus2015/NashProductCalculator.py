@@ -1,4 +1,5 @@
 from typing import List, Optional
+import numpy as np
 from agents.Caduceus2015.SaneUtilitySpace import SaneUtilitySpace
 import nenv
 
@@ -18,18 +19,19 @@ class NashProductCalculator:
             utilitySpace.normalize()
 
     def calculate(self, pref: nenv.Preference):
-        tempProduct = 1.
+        index_matrix = pref.bid_indices
 
-        count = 0
+        if len(index_matrix) == 0 or len(self.utilitySpaces) == 0:
+            return
 
-        for i, currentBid in enumerate(pref.bids):
-            for utilitySpace in self.utilitySpaces:
-                u = utilitySpace.get_utility(currentBid)
-                tempProduct *= u
+        # The product runs over all bids and utility spaces without being reset, as in the original bid-by-bid loop
+        factors = np.column_stack([utilitySpace.get_utilities(index_matrix) for utilitySpace in self.utilitySpaces])
+        products = np.cumprod(factors.ravel())[len(self.utilitySpaces) - 1::len(self.utilitySpaces)]
 
-            if tempProduct == 1.:
-                count += 1
+        improving = np.flatnonzero(products > self.nashProduct)
 
-            if tempProduct > self.nashProduct:
-                self.nashProduct = tempProduct
-                self.nashBid = currentBid
+        if len(improving) > 0:
+            best = int(improving[np.argmax(products[improving])])
+
+            self.nashProduct = float(products[best])
+            self.nashBid = pref.bids[best]
@@ -1,5 +1,5 @@
-import math
 from typing import List, Optional
+import numpy as np
 import nenv
 from nenv import Bid, Action, Offer
 
@@ -166,42 +166,23 @@ class HybridAgentWithOppModel(nenv.AbstractAgent):
         if len(bids) == 0:
             return target_bid
 
-        selected_bid: Optional[nenv.Bid] = None
-
         if len(self.my_last_bids) <= self.repetition_limit:
             last_bids = self.my_last_bids
         else:
             last_bids = self.my_last_bids[-self.repetition_limit :]
 
-        # Select the highest estimated Nash product bid by avoiding repetition
-        for bid in bids:
-            if bid in last_bids:
-                continue
-
-            nash = bid.utility * estimated_preference.get_utility(bid)
-
-            if (
-                selected_bid is None
-                or nash
-                > selected_bid.utility * estimated_preference.get_utility(selected_bid)
-            ):
-                selected_bid = bid
+        nash = np.array([bid.utility for bid in bids]) * estimated_preference.get_utilities(
+            estimated_preference.get_index_matrix(bids)
+        )
 
-        if selected_bid is not None:
-            return selected_bid
+        # Select the highest estimated Nash product bid by avoiding repetition
+        candidates = np.flatnonzero([bid not in last_bids for bid in bids])
 
         # Select the highest estimated Nash product bid without avoiding repetition
-        for bid in bids:
-            nash = bid.utility * estimated_preference.get_utility(bid)
-
-            if (
-                selected_bid is None
-                or nash
-                > selected_bid.utility * estimated_preference.get_utility(selected_bid)
-            ):
-                selected_bid = bid
+        if len(candidates) == 0:
+            candidates = np.arange(len(bids))
 
-        return selected_bid
+        return bids[int(candidates[np.argmax(nash[candidates])])]
 
     def get_bids_at_circle(
         self,
@@ -215,15 +196,19 @@ class HybridAgentWithOppModel(nenv.AbstractAgent):
             my_utility, self.window_lower_bound, self.window_upper_bound
         )
 
-        window_bids = []
-
-        for bid in bids:
-            distance = math.sqrt(
-                math.pow(my_utility - bid.utility, 2.0)
-                + math.pow(opp_utility - estimated_preference.get_utility(bid), 2.0)
+        if len(bids) == 0:
+            return []
+
+        distances = np.sqrt(
+            np.square(my_utility - np.array([bid.utility for bid in bids]))
+            + np.square(
+                opp_utility
+                - estimated_preference.get_utilities(
+                    estimated_preference.get_index_matrix(bids)
+                )
             )
+        )
 
-            if distance <= max(self.window_upper_bound, self.window_lower_bound):
-                window_bids.append(bid)
+        radius = max(self.window_upper_bound, self.window_lower_bound)
 
-        return window_bids
+        return [bid for bid, distance in zip(bids, distances) if distance <= radius]
@@ -81,12 +81,12 @@ class BidSearch:
 
         valueRelativeUtility = self.negotiatingInfo.valueRelativeUtility
 
-        randomIssues = self.pref.issues
+        randomIssues = list(self.pref.issues)
         random.shuffle(randomIssues)
         randomValues: list
 
         for issue in randomIssues:
-            randomValues = issue.values
+            randomValues = list(issue.values)
             random.shuffle(randomValues)
 
             for value in randomValues:
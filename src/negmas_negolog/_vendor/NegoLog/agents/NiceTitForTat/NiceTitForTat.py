@@ -1,6 +1,7 @@
 import math
 import random
 from typing import Optional
+import numpy as np
 import nenv
 from nenv import Action, Bid
 from agents.NiceTitForTat.helpers.BidHistory import BidHistory, BidDetails
@@ -173,22 +174,20 @@ class NiceTitForTat(nenv.AbstractAgent):
             This method finds the utility of the agent where the estimated Nash product is maximum.
         :return: The utility of the agent
         """
-        best_nash_product = 0.0
-        best_utility_me = 0.0
-
         opp_preference = self.opponent_model.preference
 
-        for bid in self.preference.bids:
-            utility_me = bid.utility
-            utility_opp = opp_preference.get_utility(bid)
+        utilities_me = self.preference.bid_utilities
+        nash_products = opp_preference.get_utilities(self.preference.bid_indices) * utilities_me
+
+        if len(nash_products) == 0:
+            return 0.0
 
-            nash_product = utility_opp * utility_me
+        best = int(np.argmax(nash_products))
 
-            if nash_product > best_nash_product:
-                best_nash_product = nash_product
-                best_utility_me = utility_me
+        if nash_products[best] > 0.0:
+            return float(utilities_me[best])
 
-        return best_utility_me
+        return 0.0
 
     def get_nash_multiplier(self, gap: float):
         mult = 1.4 - 0.6 * gap
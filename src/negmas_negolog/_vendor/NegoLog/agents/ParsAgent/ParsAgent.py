@@ -336,7 +336,7 @@ class ParsAgent(nenv.AbstractAgent):
         newBid = sugestBid.copy()
         index = self.chooseWorstIssue()
 
-        values = self.preference.issues[index].values.copy()
+        values = list(self.preference.issues[index].values)
 
         random.shuffle(values)
 
@@ -1,30 +1,63 @@
 """
     This module contains build-in agents in Negotiation ENVironment
+
+    The agents are imported on first access (PEP 562 module *__getattr__*), so that importing one agent module does
+    not import all the others and their dependencies.
+"""
+
+import importlib
+
+_AGENT_MODULES = {
+    "HybridAgent": "agents.HybridAgent.HybridAgent",
+    "HybridAgentWithOppModel": "agents.HybridAgent.HybridAgentWithOppModel",
+    "BoulwareAgent": "agents.boulware.Boulware",
+    "ConcederAgent": "agents.conceder.Conceder",
+    "MICROAgent": "agents.MICRO.MICRO",
+    "Atlas3Agent": "agents.Atlas3.Atlas3Agent",
+    "NiceTitForTat": "agents.NiceTitForTat.NiceTitForTat",
+    "YXAgent": "agents.YXAgent.YXAgent",
+    "ParsCatAgent": "agents.ParsCat.ParsCat",
+    "PonPokoAgent": "agents.PonPoko.PonPoko",
+    "AgentGG": "agents.AgentGG.AgentGG",
+    "SAGAAgent": "agents.SAGA.SAGAAgent",
+    "CUHKAgent": "agents.CUHKAgent.CUHKAgent",
+    "AgentKN": "agents.AgentKN.AgentKN",
+    "Rubick": "agents.Rubick.Rubick",
+    "AhBuNeAgent": "agents.AhBuNeAgent.AhBuNeAgent",
+    "ParsAgent": "agents.ParsAgent.ParsAgent",
+    "RandomDance": "agents.RandomDance.RandomDance",
+    "AgentBuyog": "agents.AgentBuyog.AgentBuyog",
+    "Kawaii": "agents.Kawaii.Kawaii",
+    "Caduceus2015": "agents.Caduceus2015.Caduceus",
+    "Caduceus": "agents.Caduceus.Caduceus",
+    "HardHeaded": "agents.HardHeaded.KLH",
+    "IAMhaggler": "agents.IAMhaggler.IAMhaggler",
+    "LinearAgent": "agents.LinearAgent.LinearAgent",
+    "LuckyAgent2022": "agents.LuckyAgent2022.LuckyAgent2022",
+}
 """
+    Module of each agent class
+"""
+
+__all__ = list(_AGENT_MODULES.keys())
+
+
+def __getattr__(name: str):
+    """
+        This method imports the module of the given agent on first access.
+
+        :param name: Class name of the agent
+        :return: Agent class
+    """
+    if name not in _AGENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_AGENT_MODULES[name]), name)
+
+    globals()[name] = value
+
+    return value
+
 
-from agents.HybridAgent.HybridAgent import HybridAgent
-from agents.HybridAgent.HybridAgentWithOppModel import HybridAgentWithOppModel
-from agents.boulware.Boulware import BoulwareAgent
-from agents.conceder.Conceder import ConcederAgent
-from agents.MICRO.MICRO import MICROAgent
-from agents.Atlas3.Atlas3Agent import Atlas3Agent
-from agents.NiceTitForTat.NiceTitForTat import NiceTitForTat
-from agents.YXAgent.YXAgent import YXAgent
-from agents.ParsCat.ParsCat import ParsCatAgent
-from agents.PonPoko.PonPoko import PonPokoAgent
-from agents.AgentGG.AgentGG import AgentGG
-from agents.SAGA.SAGAAgent import SAGAAgent
-from agents.CUHKAgent.CUHKAgent import CUHKAgent
-from agents.AgentKN.AgentKN import AgentKN
-from agents.Rubick.Rubick import Rubick
-from agents.AhBuNeAgent.AhBuNeAgent import AhBuNeAgent
-from agents.ParsAgent.ParsAgent import ParsAgent
-from agents.RandomDance.RandomDance import RandomDance
-from agents.AgentBuyog.AgentBuyog import AgentBuyog
-from agents.Kawaii.Kawaii import Kawaii
-from agents.Caduceus2015.Caduceus import Caduceus2015
-from agents.Caduceus.Caduceus import Caduceus
-from agents.HardHeaded.KLH import HardHeaded
-from agents.IAMhaggler.IAMhaggler import IAMhaggler
-from agents.LinearAgent.LinearAgent import LinearAgent
-from agents.LuckyAgent2022.LuckyAgent2022 import LuckyAgent2022
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,154 @@
-from typing import Dict, Union
+import weakref
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 from nenv.Issue import Issue
 
 
+class BidDomain:
+    """
+        BidDomain is the descriptor shared by all bids over the same issues. It holds the issues (in bid order) and the
+        value-index tables, so that a bid only needs to store one value index per issue.
+
+        Descriptors are shared through *BidDomain.of*. They are identified by the issue objects themselves (not by
+        issue names), so bids of different domains whose issues have the same names never share a descriptor.
+    """
+    __slots__ = ("issues", "positions", "values", "value_indices", "__weakref__")
+
+    issues: Tuple[Issue, ...]                  #: Issues of the bids in order
+    positions: Dict[Issue, int]                #: Position of each issue
+    values: List[List[str]]                    #: Values of each issue, indexed by value index
+    value_indices: List[Dict[str, int]]        #: Value index of each value of each issue
+
+    __domains = weakref.WeakValueDictionary()  # Shared descriptors by issue identities
+
+    def __init__(self, issues: Iterable[Issue]):
+        """
+            Constructor. Use *BidDomain.of* to get a shared descriptor instead.
+
+            :param issues: Issues of the bids in order. Issue names (str) are also accepted.
+        """
+        self.issues = tuple(issues)
+        self.positions = {issue: i for i, issue in enumerate(self.issues)}
+        self.values = [list(getattr(issue, "values", ())) for issue in self.issues]
+        self.value_indices = [{value: j for j, value in enumerate(values)} for values in self.values]
+
+    @classmethod
+    def of(cls, issues: Iterable[Issue]) -> "BidDomain":
+        """
+            Get the shared descriptor of the given issues, creating it on the first call.
+
+            :param issues: Issues of the bids in order
+            :return: Shared BidDomain object
+        """
+        issues = tuple(issues)
+        key = tuple(map(id, issues))
+
+        domain = cls.__domains.get(key)
+
+        if domain is None:
+            domain = cls(issues)
+            cls.__domains[key] = domain
+
+        return domain
+
+    def index_of(self, position: int, value: str) -> int:
+        """
+            Get the value index of a value. Values that are not in the issue (e.g., values set by an agent) are
+            appended to the issue's value table, so the encoding stays one-to-one.
+
+            :param position: Position of the issue
+            :param value: Value
+            :return: Value index
+        """
+        table = self.value_indices[position]
+        index = table.get(value)
+
+        if index is None:
+            index = len(self.values[position])
+            self.values[position].append(value)
+            table[value] = index
+
+        return index
+
+    def encode(self, values: Iterable[str]) -> Tuple[int, ...]:
+        """
+            Encode the values of a bid (in issue order) as value indices.
+
+            :param values: Value of each issue
+            :return: Value index of each issue
+        """
+        return tuple(self.index_of(i, value) for i, value in enumerate(values))
+
+    def decode(self, indices: Sequence[int]) -> Tuple[str, ...]:
+        """
+            Decode value indices into values.
+
+            :param indices: Value index of each issue
+            :return: Value of each issue
+        """
+        return tuple(values[j] for values, j in zip(self.values, indices))
+
+
+class BidContent(MutableMapping):
+    """
+        Dictionary view of the offer content of a bid. It behaves like the *Dict[Issue, str]* that the *content* of
+        a bid used to be: it can be indexed by Issue object or issue name, iterated, copied and modified. Changes are
+        written to the bid.
+    """
+    __slots__ = ("_bid",)
+
+    def __init__(self, bid: "Bid"):
+        self._bid = bid
+
+    def __getitem__(self, issue):
+        return self._bid[issue]
+
+    def __setitem__(self, issue, value):
+        self._bid[issue] = value
+
+    def __delitem__(self, issue):
+        content = dict(self.items())
+        del content[issue]
+        self._bid._set_content(content)
+
+    def __iter__(self):
+        return iter(self._bid.domain.issues)
+
+    def __len__(self):
+        return len(self._bid.domain.issues)
+
+    def __contains__(self, issue):
+        return issue in self._bid.domain.positions
+
+    def items(self):
+        bid = self._bid
+        return list(zip(bid.domain.issues, bid.domain.decode(bid.indices)))
+
+    def values(self):
+        return list(self._bid.domain.decode(self._bid.indices))
+
+    def copy(self) -> Dict[Issue, str]:
+        """
+            :return: Offer content as a new dictionary
+        """
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, BidContent):
+            return self._bid == other._bid
+
+        if isinstance(other, Mapping):
+            return self.copy() == dict(other.items())
+
+        return False
+
+    def __str__(self):
+        return self.copy().__str__()
+
+    def __repr__(self):
+        return self.copy().__repr__()
+
+
 class IssueIterator:
     """
         This class helps to iterate Issue-Value pairs over a given bid. You can iterate over Bid object as shown below:
@@ -11,36 +158,100 @@ class IssueIterator:
             >>> for issue, value in bid:
             >>>     ...
     """
-    def __init__(self, content: dict):
+    def __init__(self, content: Mapping):
         self.content = content
         self.index = 0
+        self.__items = iter(list(content.items()))
+
+    def __iter__(self):
+        return self
 
     def __next__(self):
-        if self.index < len(self.content):
-            self.index += 1
+        issue_value = next(self.__items)
 
-            return list(self.content.keys())[self.index - 1], self.content[list(self.content.keys())[self.index - 1]]
+        self.index += 1
 
-        raise StopIteration
+        return issue_value
 
 
 class Bid:
     """
         Bid class can hold the offer content and corresponding utility value.
+
+        The offer content is stored compactly as one value index per issue against a shared *BidDomain*, and the hash
+        is computed once. *content* provides a dictionary view of it for the agents.
     """
-    content: Dict[Issue, str]  #: Corresponding offer content as dictionary.
+    __slots__ = ("_domain", "_indices", "_hash", "_content", "utility")
+
     utility: float             #: Utility value of the bid. It may be unassigned (-1).
 
-    def __init__(self, content: dict, utility: float = -1):
+    def __init__(self, content: Mapping, utility: float = -1):
         """
             Constructor
 
             :param content: Offer content as a dictionary
             :param utility: Utility value of the bid. Default value = -1, means that the utility value was not assigned.
         """
-        self.content = content
+        self._content = None
+        self._set_content(content)
         self.utility = utility
 
+    @classmethod
+    def from_indices(cls, domain: BidDomain, indices: Tuple[int, ...], utility: float = -1) -> "Bid":
+        """
+            Create a bid directly from value indices, without building a dictionary.
+
+            :param domain: Shared domain descriptor
+            :param indices: Value index of each issue, as a tuple
+            :param utility: Utility value of the bid
+            :return: Bid object
+        """
+        bid = cls.__new__(cls)
+        bid._domain = domain
+        bid._indices = indices
+        bid._hash = hash(domain.decode(indices))
+        bid._content = None
+        bid.utility = utility
+
+        return bid
+
+    def _set_content(self, content: Mapping):
+        """
+            Replace the offer content of the bid.
+
+            :param content: Offer content as a dictionary
+            :return: Nothing
+        """
+        domain = BidDomain.of(content.keys())
+
+        self._domain = domain
+        self._indices = domain.encode(content.values())
+        self._hash = hash(domain.decode(self._indices))
+
+    @property
+    def content(self) -> BidContent:
+        """
+            :return: Offer content as a dictionary view
+        """
+        if self._content is None:
+            self._content = BidContent(self)
+
+        return self._content
+
+    @property
+    def domain(self) -> BidDomain:
+        """
+            :return: Shared domain descriptor of the bid
+        """
+        return self._domain
+
+    @property
+    def indices(self) -> Tuple[int, ...]:
+        """
+            :return: Value index of each issue
+        """
+        return self._indices
+
     def __eq__(self, other: Union[int, float, Dict[Issue, str], object]):
         """
             '==' operator implementation for the Bid class. A bid object can be compared with:
@@ -56,11 +267,14 @@ class Bid:
         if isinstance(other, int) or isinstance(other, float):
             return other == self.utility
 
-        if (not isinstance(other, Bid)) and (not isinstance(other, dict)):
+        if isinstance(other, Bid):
+            if other._domain is self._domain:
+                return other._indices == self._indices
+        elif not isinstance(other, Mapping):
             return False
 
-        for issue in self.content.keys():
-            if other[issue] != self.content[issue]:
+        for issue, value in zip(self._domain.issues, self._domain.decode(self._indices)):
+            if other[issue] != value:
                 return False
 
         return True
@@ -90,7 +304,9 @@ class Bid:
             :param issue: Issue object or issue name as string
             :return: Corresponding value
         """
-        return self.content[issue]
+        position = self._domain.positions[issue]
+
+        return self._domain.values[position][self._indices[position]]
 
     def __setitem__(self, key, value):
         """
@@ -107,7 +323,19 @@ class Bid:
             :param value: New value that will be assigned
             :return: Nothing
         """
-        self.content[key] = value
+        position = self._domain.positions.get(key)
+
+        if position is None:  # New issue
+            content = self.content.copy()
+            content[key] = value
+            self._set_content(content)
+            return
+
+        indices = list(self._indices)
+        indices[position] = self._domain.index_of(position, value)
+
+        self._indices = tuple(indices)
+        self._hash = hash(self._domain.decode(self._indices))
 
     def __hash__(self):
         """
@@ -115,7 +343,7 @@ class Bid:
 
             :return: Hash value of the bid
         """
-        return self.content.__str__().__hash__()
+        return self._hash
 
     def __str__(self):
         """
@@ -123,7 +351,7 @@ class Bid:
 
             :return: Offer content as string
         """
-        return self.content.__str__()
+        return self.content.copy().__str__()
 
     def __repr__(self):
         """
@@ -131,7 +359,7 @@ class Bid:
 
             :return: Offer content
         """
-        return self.content.__repr__()
+        return self.content.copy().__repr__()
 
     def __ge__(self, other):
         """
@@ -190,7 +418,16 @@ class Bid:
 
             :return: Copy of the Bid object with utility value.
         """
-        return Bid(self.content.copy(), self.utility)
+        return Bid.from_indices(self._domain, self._indices, self.utility)
+
+    def __reduce__(self):
+        """
+            Bids are pickled (and deep-copied) as their offer content, so the unpickled bid is attached to the shared
+            descriptor of the unpickled issues.
+
+            :return: Constructor and its arguments
+        """
+        return Bid, (self.content.copy(), self.utility)
 
     def copy(self):
         """
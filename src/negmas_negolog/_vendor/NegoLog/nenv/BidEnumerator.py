@@ -0,0 +1,315 @@
+import heapq
+from typing import List, Tuple, Iterator
+import numpy as np
+from nenv.Issue import Issue
+from nenv.Bid import Bid, BidDomain
+
+
+class BestFirstBidEnumerator:
+    """
+        BestFirstBidEnumerator lazily enumerates the bids of an **additive** preference in utility order without
+        materializing the bid space.
+
+        The values of each issue are sorted by their weighted utility. A bid is then a vector of ranks, and a
+        priority-queue (best-first) search starting from the all-best vector yields the bids one by one. Each vector
+        has a unique parent (the last non-zero rank decremented), so every bid is generated exactly once and the
+        queue only holds the current frontier.
+
+        :Example:
+            Example of iterating the ten best bids
+
+            >>> enumerator = BestFirstBidEnumerator(contributions)
+            >>> for utility, indices in itertools.islice(enumerator, 10):
+            >>>     ...
+    """
+    __contributions: List[List[float]]      #: Weighted utility of each value, for each issue
+    __orders: List[List[int]]               #: Value indices of each issue, sorted in enumeration order
+    __offset: float                         #: Constant added to each utility
+    __descending: bool                      #: Enumeration direction
+    __heap: list                            #: Priority queue of the frontier
+    __counter: int                          #: Tie-breaker of the priority queue
+
+    def __init__(self, contributions: List[List[float]], offset: float = 0., descending: bool = True):
+        """
+            Constructor
+
+            :param contributions: Weighted utility (i.e., *issue weight x value weight*) of each value, for each issue
+            :param offset: Constant added to each utility. *Default 0.0*
+            :param descending: Enumerate from the best bid (*True*) or from the worst bid (*False*). *Default True*
+        """
+        self.__contributions = contributions
+        self.__offset = offset
+        self.__descending = descending
+        self.__orders = [sorted(range(len(values)), key=lambda j: values[j], reverse=descending)
+                         for values in contributions]
+        self.__heap = []
+        self.__counter = 0
+
+        if all(len(values) > 0 for values in contributions):
+            self.__push((0,) * len(contributions), 0)
+
+    def __utility(self, indices: Tuple[int, ...]) -> float:
+        """
+            Utility of the given value indices, summed in issue order as *Preference.get_utility* does.
+
+            :param indices: Value index of each issue
+            :return: Utility value
+        """
+        utility = self.__offset
+
+        for values, j in zip(self.__contributions, indices):
+            utility += values[j]
+
+        return utility
+
+    def __push(self, ranks: Tuple[int, ...], last: int):
+        """
+            Push a rank vector into the priority queue.
+
+            :param ranks: Rank of the selected value of each issue
+            :param last: The last issue whose rank was increased
+            :return: Nothing
+        """
+        indices = tuple(order[r] for order, r in zip(self.__orders, ranks))
+        utility = self.__utility(indices)
+
+        heapq.heappush(self.__heap, (-utility if self.__descending else utility, self.__counter, ranks, last,
+                                     indices, utility))
+
+        self.__counter += 1
+
+    def __iter__(self) -> Iterator[Tuple[float, Tuple[int, ...]]]:
+        return self
+
+    def __next__(self) -> Tuple[float, Tuple[int, ...]]:
+        """
+            Get the next bid in utility order.
+
+            :return: Utility value and value index of each issue
+        """
+        if len(self.__heap) == 0:
+            raise StopIteration
+
+        _, _, ranks, last, indices, utility = heapq.heappop(self.__heap)
+
+        # Children: increase the rank of any issue at or after the last increased one
+        for i in range(last, len(ranks)):
+            if ranks[i] + 1 < len(self.__orders[i]):
+                self.__push(ranks[:i] + (ranks[i] + 1,) + ranks[i + 1:], i)
+
+        return utility, indices
+
+    @property
+    def exhausted(self) -> bool:
+        """
+            Whether all bids have been enumerated
+
+            :return: True if there is no more bid
+        """
+        return len(self.__heap) == 0
+
+
+class LazyBidSpace:
+    """
+        LazyBidSpace answers the utility queries of *Preference* on huge additive domains without generating all
+        bids. The issues are split into two halves with similar numbers of value combinations, and the partial
+        utilities of each half are computed once. A bid is a pair of partial utilities, so the bid closest to a
+        target utility is found by a binary search on one half for each combination of the other half
+        (*meet-in-the-middle*).
+
+        A domain of *N* bids keeps about *2 x sqrt(N)* partial utilities, and each query takes *O(sqrt(N) log N)*
+        time, wherever the target utility is. Bid objects are only created for the bids that are returned.
+    """
+    __issues: List[Issue]                            #: Issues of the domain
+    __domain: BidDomain                              #: Shared descriptor of the created bids
+    __contributions: List[List[float]]               #: Weighted utility of each value, for each issue
+    __offset: float                                  #: Constant added to each utility
+    __left: List[int]                                #: Issue positions of the first half
+    __right: List[int]                               #: Issue positions of the second half
+    __left_utilities: np.ndarray                     #: Partial utilities of the first half
+    __right_utilities: np.ndarray                    #: Partial utilities of the second half (ascending)
+    __right_positions: np.ndarray                    #: Combination of the second half for each sorted utility
+    __max_indices: Tuple[int, ...]                   #: Value indices of the best bid
+    __min_indices: Tuple[int, ...]                   #: Value indices of the worst bid
+
+    def __init__(self, issues: List[Issue], contributions: List[List[float]], offset: float = 0.):
+        """
+            Constructor
+
+            :param issues: Issues of the domain
+            :param contributions: Weighted utility of each value, for each issue (in *issue.values* order)
+            :param offset: Constant added to each utility. *Default 0.0*
+        """
+        self.__issues = issues
+        self.__domain = BidDomain.of(issues)
+        self.__contributions = contributions
+        self.__offset = offset
+
+        # Balance the number of combinations of both halves, starting from the largest issues
+        self.__left, self.__right = [], []
+        left_size, right_size = 1, 1
+
+        for i in sorted(range(len(contributions)), key=lambda i: len(contributions[i]), reverse=True):
+            if left_size <= right_size:
+                self.__left.append(i)
+                left_size *= len(contributions[i])
+            else:
+                self.__right.append(i)
+                right_size *= len(contributions[i])
+
+        self.__left.sort()
+        self.__right.sort()
+
+        self.__left_utilities = self.__partial_utilities(self.__left)
+
+        right_utilities = self.__partial_utilities(self.__right)
+        self.__right_positions = np.argsort(right_utilities, kind="stable")
+        self.__right_utilities = right_utilities[self.__right_positions]
+
+        self.__max_indices = tuple(max(range(len(values)), key=lambda j: values[j]) for values in contributions)
+        self.__min_indices = tuple(min(range(len(values)), key=lambda j: values[j]) for values in contributions)
+
+    def __partial_utilities(self, positions: List[int]) -> np.ndarray:
+        """
+            Partial utility of each value combination of the given issues. The combinations are ordered as
+            *itertools.product* of the value indices.
+
+            :param positions: Issue positions
+            :return: Partial utilities
+        """
+        utilities = np.zeros(1)
+
+        for i in positions:
+            utilities = np.add.outer(utilities, np.asarray(self.__contributions[i], dtype=float)).ravel()
+
+        return utilities
+
+    def __indices(self, left_position: int, right_position: int) -> Tuple[int, ...]:
+        """
+            Value indices of the bid which combines the given combinations of both halves.
+
+            :param left_position: Combination of the first half
+            :param right_position: Combination of the second half (in *__right_utilities* order)
+            :return: Value index of each issue
+        """
+        indices = [0] * len(self.__contributions)
+
+        for positions, position in ((self.__left, int(left_position)),
+                                    (self.__right, int(self.__right_positions[right_position]))):
+            for i in reversed(positions):
+                position, indices[i] = divmod(position, len(self.__contributions[i]))
+
+        return tuple(indices)
+
+    def __utility(self, indices: Tuple[int, ...]) -> float:
+        """
+            Utility of the given value indices, summed in issue order as *Preference.get_utility* does.
+
+            :param indices: Value index of each issue
+            :return: Utility value
+        """
+        utility = self.__offset
+
+        for values, j in zip(self.__contributions, indices):
+            utility += values[j]
+
+        return utility
+
+    def __bid(self, indices: Tuple[int, ...]) -> Bid:
+        """
+            Create a Bid object from the value indices.
+
+            :param indices: Value index of each issue
+            :return: Bid object
+        """
+        return Bid.from_indices(self.__domain, indices, self.__utility(indices))
+
+    def __closest(self, target_utility: float) -> Tuple[float, Tuple[int, ...]]:
+        """
+            Find the bid whose utility is the closest to the target utility. On equal distance, the bid with the
+            higher utility is selected as *Preference.get_bid_at* does.
+
+            :param target_utility: Target utility
+            :return: Utility and value indices of the closest bid
+        """
+        # The closest partial utilities of the second half, below and above the remaining utility
+        remaining = target_utility - self.__offset - self.__left_utilities
+        above = np.searchsorted(self.__right_utilities, remaining)
+        above = np.minimum(above, len(self.__right_utilities) - 1)
+        below = np.maximum(above - 1, 0)
+
+        left_positions = np.concatenate((np.arange(len(remaining)), np.arange(len(remaining))))
+        right_positions = np.concatenate((below, above))
+        utilities = self.__offset + self.__left_utilities[left_positions] + self.__right_utilities[right_positions]
+
+        best = np.lexsort((-utilities, np.abs(utilities - target_utility)))[0]
+        indices = self.__indices(left_positions[best], right_positions[best])
+
+        return self.__utility(indices), indices
+
+    @property
+    def max_util_bid(self) -> Bid:
+        """
+            The bid with the maximum utility
+
+            :return: A new Bid object
+        """
+        return self.__bid(self.__max_indices)
+
+    @property
+    def min_util_bid(self) -> Bid:
+        """
+            The bid with the minimum utility
+
+            :return: A new Bid object
+        """
+        return self.__bid(self.__min_indices)
+
+    def get_bid_at(self, target_utility: float) -> Bid:
+        """
+            This method returns the closest bid to provided target utility.
+
+            :param target_utility: Target utility
+            :return: The closest bid
+        """
+        return self.__bid(self.__closest(target_utility)[1])
+
+    def get_bids_at_range(self, lower_bound: float = 0., upper_bound: float = 1.) -> List[Bid]:
+        """
+            This method provides the bids between the closest bid to the lower bound and the closest bid to the upper
+            bound (both included), in descending order, as *Preference.get_bids_at_range* does.
+
+            :param lower_bound: The lower bound of the range
+            :param upper_bound: The upper bound of the range
+            :return: List of bids in that range.
+        """
+        upper_utility, _ = self.__closest(upper_bound)
+        lower_utility, _ = self.__closest(lower_bound)
+
+        if lower_utility > upper_utility:
+            return []
+
+        # Candidates with a small margin, since the partial utilities are summed in a different order
+        remaining = -self.__offset - self.__left_utilities
+        starts = np.searchsorted(self.__right_utilities, remaining + lower_utility - 1e-9, side="left")
+        ends = np.searchsorted(self.__right_utilities, remaining + upper_utility + 1e-9, side="right")
+        counts = ends - starts
+
+        left_positions = np.repeat(np.arange(len(remaining)), counts)
+        right_positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) \
+            + np.repeat(starts, counts)
+
+        bids = [self.__bid(self.__indices(i, j)) for i, j in zip(left_positions, right_positions)]
+        bids = [bid for bid in bids if lower_utility <= bid.utility <= upper_utility]
+        bids.sort(key=lambda bid: bid.utility, reverse=True)
+
+        return bids
+
+    @property
+    def number_of_partial_utilities(self) -> int:
+        """
+            The number of partial utilities kept for both halves of the issues
+
+            :return: Number of partial utilities
+        """
+        return len(self.__left_utilities) + len(self.__right_utilities)
@@ -0,0 +1,138 @@
+from collections.abc import Sequence
+from typing import List, Optional
+import numpy as np
+from nenv.Bid import Bid, BidDomain
+
+
+def cartesian_indices(cardinalities: List[int]) -> np.ndarray:
+    """
+        This method enumerates all value combinations of the issues as a value-index matrix. The rows follow the order
+        in which *Preference.bids* used to generate the bids (the first issue varies fastest), so that a stable sort
+        keeps the same order among the bids with equal utility.
+
+        :param cardinalities: Number of values of each issue
+        :return: Value-index matrix, one row per bid and one column per issue
+    """
+    n_bids = int(np.prod(cardinalities, dtype=np.int64))
+    matrix = np.empty((n_bids, len(cardinalities)), dtype=np.min_scalar_type(max(cardinalities, default=1)))
+
+    positions = np.arange(n_bids, dtype=np.int64)
+    stride = 1
+
+    for i, cardinality in enumerate(cardinalities):
+        matrix[:, i] = (positions // stride) % cardinality
+        stride *= cardinality
+
+    return matrix
+
+
+class BidList(Sequence):
+    """
+        BidList is a read-only list of bids backed by a value-index matrix and a utility array. The Bid objects are
+        created on first access and then reused, so that the agents which only look at a handful of bids never pay for
+        the rest of the bid space.
+
+        *indices* and *utilities* provide the bid list as arrays for the vectorized operations (e.g.,
+        *Preference.get_utilities*). *view* provides a part of the list without copying: the view shares the arrays
+        and the created Bid objects with this list.
+    """
+    _domain: BidDomain                  #: Shared descriptor of the bids
+    _indices: np.ndarray                #: Value-index matrix, one row per bid
+    _utilities: np.ndarray              #: Utility value of each bid
+    _bids: List[Optional[Bid]]          #: Materialized Bid objects (shared with the views)
+    _offset: int                        #: Position of the first bid in *_bids*
+
+    def __init__(self, domain: BidDomain, indices: np.ndarray, utilities: np.ndarray):
+        """
+            Constructor
+
+            :param domain: Shared descriptor of the bids
+            :param indices: Value-index matrix, one row per bid (value indices in *issue.values* order)
+            :param utilities: Utility value of each row of the matrix
+        """
+        self._domain = domain
+        self._indices = indices
+        self._utilities = utilities
+        self._bids = [None] * len(utilities)
+        self._offset = 0
+
+    @property
+    def domain(self) -> BidDomain:
+        """
+            :return: Shared descriptor of the bids
+        """
+        return self._domain
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+            :return: Value-index matrix of the bids, in list order
+        """
+        return self._indices
+
+    @property
+    def utilities(self) -> np.ndarray:
+        """
+            :return: Utility values of the bids, in list order
+        """
+        return self._utilities
+
+    def _bid_at(self, i: int) -> Bid:
+        """
+            Get the bid at the given position, creating it on the first access.
+
+            :param i: Position
+            :return: Bid object
+        """
+        bid = self._bids[self._offset + i]
+
+        if bid is None:
+            bid = Bid.from_indices(self._domain, tuple(self._indices[i].tolist()), float(self._utilities[i]))
+            self._bids[self._offset + i] = bid
+
+        return bid
+
+    def view(self, start: int, stop: int) -> "BidList":
+        """
+            Get the bids in the range *[start, stop)* without copying them.
+
+            :param start: Position of the first bid
+            :param stop: Position after the last bid
+            :return: BidList sharing the arrays and the Bid objects of this list
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+
+        view = BidList.__new__(BidList)
+        view._domain = self._domain
+        view._indices = self._indices[start:stop]
+        view._utilities = self._utilities[start:stop]
+        view._bids = self._bids
+        view._offset = self._offset + start
+
+        return view
+
+    def __len__(self) -> int:
+        return len(self._utilities)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._bid_at(i) for i in range(*item.indices(len(self)))]
+
+        if item < 0:
+            item += len(self)
+
+        if not 0 <= item < len(self):
+            raise IndexError("bid index out of range")
+
+        return self._bid_at(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._bid_at(i)
+
+    def copy(self) -> List[Bid]:
+        """
+            :return: All bids as a plain list
+        """
+        return list(self)
@@ -1,5 +1,7 @@
 import math
-from typing import List, Union, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Union, Optional, Tuple
 import numpy as np
 from nenv.Preference import Preference
 from nenv.Bid import Bid
@@ -182,16 +184,108 @@ class BidPoint:
         return self.product_score <= other.product_score
 
 
+def pareto_mask(utilities: np.ndarray) -> np.ndarray:
+    """
+        This method finds the points which are not dominated by any other point. A point dominates another one if it is
+        not worse for any agent and better for at least one agent. Equal points do not dominate each other.
+
+        For two agents, the points are sorted by the utility of the first agent and swept once, in *O(n log n)*. For
+        more agents, each remaining candidate eliminates the points it dominates in one vectorized comparison.
+
+        :Example:
+            Example of finding the Pareto-optimal points
+
+            >>> mask = pareto_mask(np.array([[1.0, 0.2], [0.5, 0.5], [0.4, 0.4]]))
+            >>> print(mask) # [ True  True False]
+
+        :param utilities: Utility matrix, one row per point and one column per agent
+        :return: Boolean mask of the Pareto-optimal points
+    """
+    utilities = np.asarray(utilities, dtype=float)
+
+    if utilities.ndim != 2:
+        utilities = utilities.reshape(len(utilities), -1)
+
+    if len(utilities) == 0:
+        return np.zeros(0, dtype=bool)
+
+    if utilities.shape[1] == 2:
+        return _pareto_mask_2d(utilities[:, 0], utilities[:, 1])
+
+    # Candidates in descending order of total utility, the best one cannot be dominated
+    candidates = np.argsort(-utilities.sum(axis=1), kind="stable")
+    points = utilities[candidates]
+
+    current = 0
+
+    while current < len(points):
+        point = points[current]
+
+        keep = np.any(points > point, axis=1) | np.all(points == point, axis=1)
+
+        candidates = candidates[keep]
+        points = points[keep]
+
+        current = int(np.count_nonzero(keep[:current])) + 1
+
+    mask = np.zeros(len(utilities), dtype=bool)
+    mask[candidates] = True
+
+    return mask
+
+
+def _pareto_mask_2d(utility_a: np.ndarray, utility_b: np.ndarray) -> np.ndarray:
+    """
+        Sort-and-sweep Pareto-frontier for two agents.
+
+        :param utility_a: Utility values of AgentA
+        :param utility_b: Utility values of AgentB
+        :return: Boolean mask of the Pareto-optimal points
+    """
+    # Descending utility of AgentA, then descending utility of AgentB
+    order = np.lexsort((-utility_b, -utility_a))
+
+    sorted_a = utility_a[order]
+    sorted_b = utility_b[order]
+
+    # Groups of the points with the same utility of AgentA, the first point of a group has the highest utility of AgentB
+    group_starts = np.empty(len(order), dtype=bool)
+    group_starts[0] = True
+    np.not_equal(sorted_a[1:], sorted_a[:-1], out=group_starts[1:])
+
+    groups = np.cumsum(group_starts) - 1
+    group_best = sorted_b[group_starts]
+
+    # The highest utility of AgentB among the points with a higher utility of AgentA
+    previous_best = np.empty(len(group_best))
+    previous_best[0] = -np.inf
+    np.maximum.accumulate(group_best[:-1], out=previous_best[1:])
+
+    keep = (sorted_b == group_best[groups]) & (sorted_b > previous_best[groups])
+
+    mask = np.zeros(len(order), dtype=bool)
+    mask[order[keep]] = True
+
+    return mask
+
+
 class BidSpace:
     """
         Bid space of preferences of the agents.
+
+        The bid space is columnar: the utility values of the agents are kept as NumPy arrays (*utility_a* and
+        *utility_b*, aligned with *prefA.bids*), so that the Nash point, the Kalai point, the Pareto-frontier and the
+        scores are computed by array operations. *BidPoint* objects are only created when they are requested, and the
+        same object is returned for the same bid.
     """
-    prefA: Preference                   #: Preferences of agentA
-    prefB: Preference                   #: Preferences of agentB
-    __bids: List[BidPoint]              #: The bid points of the bid space
-    __nash_point: Optional[BidPoint]    #: Nash Point of the bid space
-    __kalai_point: Optional[BidPoint]   #: Kalai Point of the bid space
-    __pareto: Optional[List[BidPoint]]  #: Pareto-frontier of the bid space
+    prefA: Preference                           #: Preferences of agentA
+    prefB: Preference                           #: Preferences of agentB
+    __utility_a: Optional[np.ndarray]           #: Utility values of AgentA, aligned with prefA.bids
+    __utility_b: Optional[np.ndarray]           #: Utility values of AgentB, aligned with prefA.bids
+    __points: Dict[int, BidPoint]               #: Created bid points by bid position
+    __nash_point: Optional[BidPoint]            #: Nash Point of the bid space
+    __kalai_point: Optional[BidPoint]           #: Kalai Point of the bid space
+    __pareto: Optional[List[BidPoint]]          #: Pareto-frontier of the bid space
 
     def __init__(self, prefA: Preference, prefB: Preference):
         """
@@ -202,108 +296,134 @@ class BidSpace:
         """
         self.prefA = prefA
         self.prefB = prefB
-        self.__bids = []
+        self.__utility_a = None
+        self.__utility_b = None
+        self.__points = {}
         self.__nash_point = None
         self.__kalai_point = None
         self.__pareto = None
 
     @property
-    def bid_points(self):
+    def utility_a(self) -> np.ndarray:
         """
-            The bid points of the bid space. It is initiated when the first call.
+            Utility values of AgentA for the bids, in *prefA.bids* order. It is calculated when the first call.
 
-            :return: The bid points of the bid space
+            :return: Utility values of AgentA
         """
-        if len(self.__bids) > 0:
-            return self.__bids
+        if self.__utility_a is None:
+            self.__utility_a = self.__utilities_of(self.prefA)
 
-        for bid in self.prefA.bids:
-            self.__bids.append(
-                BidPoint(bid.copy_without_utility(), self.prefA.get_utility(bid), self.prefB.get_utility(bid)))
+        return self.__utility_a
 
-            if self.__nash_point is None or self.__kalai_point is None:
-                self.__nash_point = BidPoint(bid.copy_without_utility(), self.prefA.get_utility(bid),
-                                             self.prefB.get_utility(bid))
-                self.__kalai_point = BidPoint(bid.copy_without_utility(), self.prefA.get_utility(bid),
-                                              self.prefB.get_utility(bid))
+    @property
+    def utility_b(self) -> np.ndarray:
+        """
+            Utility values of AgentB for the bids, in *prefA.bids* order. It is calculated when the first call.
 
-            if self.__nash_point.product_score < self.__bids[-1].product_score:
-                self.__nash_point = BidPoint(bid.copy_without_utility(), self.prefA.get_utility(bid),
-                                             self.prefB.get_utility(bid))
-            if self.__kalai_point.social_welfare < self.__bids[-1].social_welfare:
-                self.__kalai_point = BidPoint(bid.copy_without_utility(), self.prefA.get_utility(bid),
-                                              self.prefB.get_utility(bid))
+            :return: Utility values of AgentB
+        """
+        if self.__utility_b is None:
+            self.__utility_b = self.__utilities_of(self.prefB)
 
-        return self.__bids
+        return self.__utility_b
 
-    @property
-    def pareto(self) -> List[BidPoint]:
+    def __utilities_of(self, preference: Preference) -> np.ndarray:
         """
-            The list of BidPoint on the Pareto-Frontier
+            This method calculates the utility values of the bids for the given preference in one batch. The value
+            indices of the bids are translated into the issue and value order of that preference.
 
-            :return: List of BidPoint on the Pareto-Frontier
+            :param preference: Preferences of an agent
+            :return: Utility values, in *prefA.bids* order
         """
-        if self.__pareto is not None:
-            return self.__pareto
+        indices = self.prefA.bid_indices
+        source_issues = self.prefA.issues
+        target_issues = preference.issues
+
+        if target_issues != source_issues or any(issue.values != other.values
+                                                 for issue, other in zip(target_issues, source_issues)):
+            columns = []
+
+            for issue in target_issues:
+                if issue not in source_issues:
+                    return np.array([preference.get_utility(bid) for bid in self.prefA.bids], dtype=float)
 
-        bids = self.bid_points
+                position = source_issues.index(issue)
+                values = source_issues[position].values
 
-        pareto_indices = [True for _ in range(len(bids))]
+                if any(value not in issue.values for value in values):
+                    return np.array([preference.get_utility(bid) for bid in self.prefA.bids], dtype=float)
 
-        for i in range(len(bids)):
-            point_i = np.array([bids[i].utility_a, bids[i].utility_b])
+                lookup = np.array([issue.values.index(value) for value in values], dtype=np.intp)
 
-            if not pareto_indices[i]:
-                continue
+                columns.append(lookup[indices[:, position]])
 
-            for j in range(i + 1, len(bids)):
-                if not pareto_indices[i]:
-                    break
+            indices = np.stack(columns, axis=1) if len(columns) > 0 else indices[:, :0]
 
-                if not pareto_indices[j]:
-                    continue
+        return preference.get_utilities(indices)
 
-                point_j = np.array([bids[j].utility_a, bids[j].utility_b])
+    def __point(self, index: int) -> BidPoint:
+        """
+            The bid point of the bid at the given position, created on the first request.
+
+            :param index: Position of the bid in *prefA.bids*
+            :return: BidPoint of the bid
+        """
+        point = self.__points.get(index)
 
-                if all(point_j >= point_i) and any(point_j > point_i):
-                    pareto_indices[i] = False
+        if point is None:
+            point = BidPoint(self.prefA.bids[index].copy_without_utility(), float(self.utility_a[index]),
+                             float(self.utility_b[index]))
 
-                    break
+            self.__points[index] = point
+
+        return point
+
+    @property
+    def bid_points(self) -> List[BidPoint]:
+        """
+            The bid points of the bid space. They are created when the first call.
+
+            :return: The bid points of the bid space
+        """
+        return [self.__point(i) for i in range(len(self))]
 
-                if all(point_i >= point_j) and any(point_i > point_j):
-                    pareto_indices[j] = False
+    @property
+    def pareto(self) -> List[BidPoint]:
+        """
+            The list of BidPoint on the Pareto-Frontier
 
-        pareto_bids = []
+            :return: List of BidPoint on the Pareto-Frontier
+        """
+        if self.__pareto is not None:
+            return self.__pareto
 
-        for index in range(len(bids)):
-            if pareto_indices[index]:
-                pareto_bids.append(bids[index])
+        utilities = np.stack((self.utility_a, self.utility_b), axis=1)
 
-        self.__pareto = pareto_bids
+        self.__pareto = [self.__point(int(index)) for index in np.flatnonzero(pareto_mask(utilities))]
 
-        return pareto_bids
+        return self.__pareto
 
     @property
     def nash_point(self) -> BidPoint:
         """
-            The Bid Point which has the highest Nash Product
+            The Bid Point which has the highest Nash Product. The first bid is chosen among the equal ones.
 
             :return: Nash point of the bid space as BidPoint
         """
         if self.__nash_point is None:
-            _ = self.bid_points
+            self.__nash_point = self.__point(int(np.argmax(self.utility_a * self.utility_b)))
 
         return self.__nash_point
 
     @property
     def kalai_point(self) -> BidPoint:
         """
-            The Bid Point which has the highest Social Welfare
+            The Bid Point which has the highest Social Welfare. The first bid is chosen among the equal ones.
 
             :return: Kalai point of the bid space as BidPoint
         """
         if self.__kalai_point is None:
-            _ = self.bid_points
+            self.__kalai_point = self.__point(int(np.argmax(self.utility_a + self.utility_b)))
 
         return self.__kalai_point
 
@@ -339,16 +459,7 @@ class BidSpace:
 
         :return: Balance Score
         """
-
-        bids_a = self.prefA.bids
-        bids_b = self.prefB.bids
-
-        total_diff = 0.
-
-        for i in range(len(bids_a)):
-            total_diff += bids_a[i].utility - bids_b[i].utility
-
-        return total_diff / len(bids_a)
+        return float(np.mean(self.prefA.bid_utilities - self.prefB.bid_utilities))
 
     def calculate_normalized_balance_score(self) -> float:
         """
@@ -356,22 +467,16 @@ class BidSpace:
 
         :return: Normalized Balance Score
         """
-
-        bids_a = self.prefA.bids
-        bids_b = self.prefB.bids
+        utilities_a = self.prefA.bid_utilities
+        utilities_b = self.prefB.bid_utilities
 
         nash_point = self.nash_point
 
         nash_zero = nash_point - BidPoint(None, 0., 0.)
 
-        total_diff = 0.
+        nash_distances = np.sqrt((nash_point.utility_a - utilities_a) ** 2 + (nash_point.utility_b - utilities_b) ** 2)
 
-        for i in range(len(bids_a)):
-            nash_distance = nash_point - BidPoint(None, bids_a[i].utility, bids_b[i].utility)
-
-            total_diff += (bids_a[i].utility - bids_b[i].utility) * nash_distance / (nash_zero + 1e-12)
-
-        return total_diff
+        return float(np.sum((utilities_a - utilities_b) * nash_distances / (nash_zero + 1e-12)))
 
     def get_bid_point(self, bid: Bid) -> BidPoint:
         """
@@ -422,7 +527,7 @@ class BidSpace:
 
             :return: Number of bids in the bid space
         """
-        return len(self.__bids)
+        return len(self.prefA.bids)
 
     def __iter__(self):
         """
@@ -436,4 +541,97 @@ class BidSpace:
 
             :return: List Iterator
         """
-        return self.__bids.__iter__()
+        return iter(self.bid_points)
+
+
+class BidSpaceRegistry:
+    """
+        BidSpaceRegistry shares the *BidSpace* objects between the session and the loggers, so that the utility arrays,
+        the Pareto-frontier and the Nash and Kalai points of a domain are calculated once.
+
+        The preferences are identified by their content (issues, values and weights), so that the different copies of
+        the same profile (e.g., the preferences of different sessions on the same domain) share the bid space. The
+        preferences which calculate the utility in another way (i.e., the subclasses overriding *get_utility*) are
+        identified by the object.
+
+        :Example:
+            Example of getting the shared bid space of a session
+
+            >>> bid_space = bid_space_registry.get(session.agentA.preference, session.agentB.preference)
+    """
+    max_size: int                                                   #: Maximum number of bid spaces
+    __bid_spaces: "OrderedDict[Tuple[tuple, tuple], BidSpace]"      #: Bid spaces, least recently used first
+    __lock: threading.Lock
+
+    def __init__(self, max_size: int = 32):
+        """
+            Constructor
+
+            :param max_size: Maximum number of bid spaces. *Default 32*
+        """
+        assert max_size > 0, "Registry size must be positive."
+
+        self.max_size = max_size
+        self.__bid_spaces = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(preference: Preference) -> tuple:
+        """
+            This method generates the key of a preference.
+
+            :param preference: Preferences of an agent
+            :return: Key of the preference
+        """
+        if type(preference).get_utility is not Preference.get_utility:
+            return type(preference), id(preference)
+
+        issue_weights = preference.issue_weights
+        value_weights = preference.value_weights
+
+        return (type(preference),) + tuple(
+            (issue.name, issue.values, issue_weights[issue],
+             tuple(value_weights[issue][value] for value in issue.values))
+            for issue in preference.issues)
+
+    def get(self, prefA: Preference, prefB: Preference) -> BidSpace:
+        """
+            This method provides the bid space of the given preferences, creating it if it is not registered.
+
+            :param prefA: Preferences of agentA
+            :param prefB: Preferences of agentB
+            :return: Shared BidSpace object
+        """
+        key = (self.key(prefA), self.key(prefB))
+
+        with self.__lock:
+            bid_space = self.__bid_spaces.get(key)
+
+            if bid_space is not None:
+                self.__bid_spaces.move_to_end(key)
+
+                return bid_space
+
+            bid_space = BidSpace(prefA, prefB)
+
+            self.__bid_spaces[key] = bid_space
+
+            while len(self.__bid_spaces) > self.max_size:
+                self.__bid_spaces.popitem(last=False)
+
+            return bid_space
+
+    def clear(self):
+        """
+            This method removes all bid spaces.
+
+            :return: Nothing
+        """
+        with self.__lock:
+            self.__bid_spaces.clear()
+
+    def __len__(self) -> int:
+        return len(self.__bid_spaces)
+
+
+bid_space_registry = BidSpaceRegistry()     #: Registry shared by the sessions and the loggers
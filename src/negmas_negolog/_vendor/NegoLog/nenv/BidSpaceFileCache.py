@@ -0,0 +1,95 @@
+import hashlib
+import os
+import uuid
+from typing import Optional, Tuple
+import numpy as np
+
+
+class BidSpaceFileCache:
+    """
+        BidSpaceFileCache keeps the sorted bid spaces of profiles on disk, so that the processes which load the
+        same profile do not generate the bid space again. Each entry is a value-index matrix and a utility array of the
+        bids (in the sorted order of *Preference.bids*), saved as *.npy* files whose name is the key of the profile.
+
+        The entries are opened as read-only memory maps. Thus, the processes loading the same profile share the pages
+        of the bid space through the OS cache instead of holding private copies.
+
+        :Example:
+            Example of enabling the cache for all the preferences loaded from JSON files
+
+            >>> Preference.bid_cache_dir = "bid_cache/"
+
+            or set the *NEGOLOG_BID_CACHE_DIR* environment variable before starting the processes.
+    """
+    version: int = 1                    #: Format version, part of each key
+    directory: str                      #: Directory of the cache files
+
+    def __init__(self, directory: str):
+        """
+            Constructor
+
+            :param directory: Directory of the cache files, created on the first *store*
+        """
+        self.directory = directory
+
+    @staticmethod
+    def key(profile_data: bytes, scope: str = "") -> str:
+        """
+            This method generates the key of a bid space. The raw JSON content is hashed because the order of the
+            issues and the values in the file determines the value indices.
+
+            :param profile_data: Content of the profile JSON file
+            :param scope: Additional discriminator, e.g., the name of the Preference class that scores the bids
+            :return: Key of the bid space
+        """
+        digest = hashlib.sha256(f"{BidSpaceFileCache.version}:{scope}:".encode())
+        digest.update(profile_data)
+
+        return digest.hexdigest()
+
+    def __paths(self, key: str) -> Tuple[str, str]:
+        """
+            :param key: Key of the bid space
+            :return: Paths of the value-index matrix and the utility array
+        """
+        return os.path.join(self.directory, f"{key}.indices.npy"), os.path.join(self.directory, f"{key}.utilities.npy")
+
+    def load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+            This method opens a bid space as read-only memory maps.
+
+            :param key: Key of the bid space
+            :return: Value-index matrix and utility array, or None if the bid space is not in the cache
+        """
+        indices_path, utilities_path = self.__paths(key)
+
+        try:
+            indices = np.load(indices_path, mmap_mode="r")
+            utilities = np.load(utilities_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        if indices.ndim != 2 or utilities.ndim != 1 or len(indices) != len(utilities):
+            return None
+
+        return indices, utilities
+
+    def store(self, key: str, indices: np.ndarray, utilities: np.ndarray):
+        """
+            This method saves a bid space. The files are written under temporary names and renamed, so that the
+            concurrent processes never read a partial file.
+
+            :param key: Key of the bid space
+            :param indices: Value-index matrix of the sorted bids
+            :param utilities: Utility array of the sorted bids
+            :return: Nothing
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        for path, array in zip(self.__paths(key), (indices, utilities)):
+            temporary_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+            with open(temporary_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+
+            os.replace(temporary_path, path)
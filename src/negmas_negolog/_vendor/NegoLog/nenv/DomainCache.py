@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Tuple
+from nenv.Preference import Preference, domain_loader
+
+
+class DomainCache:
+    """
+        DomainCache keeps the parsed preferences of the recently used domains, so that the sessions of a tournament on
+        the same domain do not read the profile JSON files and generate the bid spaces again.
+
+        The cached preferences are never given to the agents. Each *load* provides new Preference objects with their
+        own weights and Bid objects, which share the issues and the read-only bid arrays of the cached preferences.
+        Thus, an agent changing its preference does not affect the other sessions.
+
+        :Example:
+            Example of loading the preferences of a domain for a session
+
+            >>> domain_cache = DomainCache(max_size=16)
+            >>> prefA, prefB = domain_cache.load("0")
+    """
+    max_size: int                                                   #: Maximum number of cached domains
+    __preferences: "OrderedDict[str, Tuple[Preference, Preference]]"  #: Parsed preferences, least recently used first
+
+    def __init__(self, max_size: int = 32):
+        """
+            Constructor
+
+            :param max_size: Maximum number of cached domains. *Default 32*
+        """
+        assert max_size > 0, "Cache size must be positive."
+
+        self.max_size = max_size
+        self.__preferences = OrderedDict()
+
+    def load(self, domain_name: str) -> Tuple[Preference, Preference]:
+        """
+            This method provides the preferences of both parties for a session on the given domain.
+
+            :param domain_name: The name of the domain
+            :return: Preferences of profileA, Preferences of profileB
+        """
+        preferences = self.__preferences.get(domain_name)
+
+        if preferences is None:
+            preferences = domain_loader(domain_name)
+
+            # The bid arrays are shared by the sessions
+            for preference in preferences:
+                preference.bid_indices.setflags(write=False)
+                preference.bid_utilities.setflags(write=False)
+
+            self.__preferences[domain_name] = preferences
+
+            while len(self.__preferences) > self.max_size:
+                self.__preferences.popitem(last=False)
+        else:
+            self.__preferences.move_to_end(domain_name)
+
+        return preferences[0]._clone(), preferences[1]._clone()
+
+    def clear(self):
+        """
+            This method removes all cached domains.
+
+            :return: Nothing
+        """
+        self.__preferences.clear()
+
+    def __contains__(self, domain_name: str) -> bool:
+        return domain_name in self.__preferences
+
+    def __len__(self) -> int:
+        return len(self.__preferences)
@@ -1,13 +1,13 @@
-from typing import List
+from typing import List, Tuple
 
 
 class Issue:
     """
         Issue class holds the issue name and the possible discrete values of the corresponding issue in any domain.
-        The objects of this class are mutual.
+        The objects of this class are immutable, so that they can be shared by the preferences and the agents.
     """
     __name: str             # Name of the issue
-    __values: List[str]     # Possible discrete values of the issue
+    __values: Tuple[str, ...]   # Possible discrete values of the issue
 
     def __init__(self, name: str, values: List[str]):
         """
@@ -18,7 +18,7 @@ class Issue:
             :param values: The name of the values of the issue
         """
         self.__name = name
-        self.__values = values
+        self.__values = tuple(values)
 
     def __len__(self):
         """
@@ -73,7 +73,7 @@ class Issue:
 
             :return: Copy of the issue
         """
-        return Issue(self.__name, self.__values.copy())
+        return Issue(self.__name, self.__values)
 
     @property
     def name(self) -> str:
@@ -85,10 +85,10 @@ class Issue:
         return self.__name
 
     @property
-    def values(self) -> List[str]:
+    def values(self) -> Tuple[str, ...]:
         """
-            Get a copy of list of values under this issue
+            Get the values under this issue. The tuple is shared, not copied.
 
-            :return: The list of possible discrete values of the issue
+            :return: The possible discrete values of the issue
         """
-        return self.__values.copy()
+        return self.__values
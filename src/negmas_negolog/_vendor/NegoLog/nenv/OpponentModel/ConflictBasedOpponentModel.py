@@ -53,8 +53,8 @@ class ConflictBasedOpponentModel(AbstractOpponentModel):
         # idx 0 is more important than idx 1
         # Initially at semi-random (the order which the values were inserted)
 
-        issues_orderings = self.preference.issues
-        value_orderings = {issue.name: issue.values for issue in self.preference.issues}
+        issues_orderings = list(self.preference.issues)
+        value_orderings = {issue.name: list(issue.values) for issue in self.preference.issues}
         issue_size = len(issues_orderings)
 
         all_pairwise_comparisons = {key: [] for key in issues_orderings}
@@ -18,7 +18,7 @@ class EstimatedPreference(Preference):
         if reference.profile_json_path is None:
             super(EstimatedPreference, self).__init__(None, generate_bids=False)
             # Copy issues and weights from reference
-            self._issues = reference.issues  # issues property returns a copy
+            self._issues = list(reference.issues)
             self._issue_weights = {}
             self._value_weights = {}
             self._reservation_value = reference.reservation_value
@@ -1,8 +1,13 @@
 import os
 import random
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple, Sequence, Mapping
+import numpy as np
 from nenv.Issue import Issue
-from nenv.Bid import Bid
+from nenv.Bid import Bid, BidDomain
+from nenv.BidEnumerator import LazyBidSpace
+from nenv.BidList import BidList, cartesian_indices
+from nenv.BidSpaceFileCache import BidSpaceFileCache
 import json
 
 
@@ -42,6 +47,23 @@ class Preference:
 
             **Note**: The reservation value can vary for each profile.
 
+        **Huge Domains**:
+            When the domain has more than *lazy_threshold* bids and the preference is additive, the bid list is not
+            generated while loading the profile. *get_bid_at*, *get_bids_at_range*, *get_random_bid*, *max_util_bid*
+            and *min_util_bid* are then answered by a *LazyBidSpace*, which searches the bids around the target
+            utility without generating the whole bid space. Accessing *bids* still generates it.
+
+        **Batch Utility**:
+            *get_utilities* scores many bids in one vectorized call. Bids are given as a value-index matrix (one row per
+            bid, one column per issue, value index in *issue.values* order), such as *bid_indices* which is aligned
+            with *bids*. The weights are read when the method is called, so changes of the weights (e.g., by an
+            opponent model) are always taken into account.
+
+        **Bid Space Cache**:
+            If *bid_cache_dir* is set (or the *NEGOLOG_BID_CACHE_DIR* environment variable), the sorted bid space
+            generated while loading a profile JSON file is saved in a *BidSpaceFileCache*. Later loads of the same file,
+            in any process, open the saved bid space as read-only memory maps instead of generating it.
+
     """
     profile_json_path: str                          #: JSON file path of this preference
     _issues: List[Issue]
@@ -49,6 +71,12 @@ class Preference:
     _value_weights: Dict[Issue, Dict[str, float]]
     _bids: List[Bid]
     _reservation_value: float
+    _lazy_bids: Optional[LazyBidSpace]
+    _bid_arrays: Optional[Tuple[List[Bid], np.ndarray, np.ndarray]] = None
+    _search_keys: Optional[Tuple[List[Bid], np.ndarray]] = None
+    _issues_view: Optional[Tuple[List[Issue], Tuple[Issue, ...]]] = None
+    lazy_threshold: int = 1000000                   #: Domain size above which the bids are enumerated lazily
+    bid_cache_dir: Optional[str] = os.environ.get("NEGOLOG_BID_CACHE_DIR") or None  #: Directory of the bid cache
 
     def __init__(self, profile_json_path: Optional[str], generate_bids: bool = True):
         """
@@ -62,12 +90,15 @@ class Preference:
         self._issue_weights = {}
         self._value_weights = {}
         self._bids = []
+        self._lazy_bids = None
 
         if profile_json_path is None:
             return
 
-        with open(profile_json_path, "r") as f:
-            profile_data = json.load(f)
+        with open(profile_json_path, "rb") as f:
+            profile_bytes = f.read()
+
+        profile_data = json.loads(profile_bytes)
 
         self._reservation_value = profile_data["reservationValue"]
 
@@ -82,47 +113,71 @@ class Preference:
             for value_name, value_weight in profile_data["issues"][issue_name].items():
                 self._value_weights[issue][value_name] = value_weight
 
-        # Generate bids
-        if generate_bids:
+        # Generate bids, unless the domain is huge and the queries are answered by the lazy bid space
+        if generate_bids and self._lazy_bid_space() is None:
+            if self.bid_cache_dir:
+                self._bids = self.__cached_bids(profile_bytes)
+
             _ = self.bids
 
+    def __cached_bids(self, profile_bytes: bytes) -> BidList:
+        """
+            This method provides the bid space of the profile from the bid cache. If it is not in the cache, the bid
+            space is generated and saved first.
+
+            :param profile_bytes: Content of the profile JSON file
+            :return: Sorted bids, backed by read-only memory maps unless the cache cannot be written
+        """
+        cache = BidSpaceFileCache(self.bid_cache_dir)
+
+        # Subclasses may score the bids differently
+        key = cache.key(profile_bytes, f"{type(self).__module__}.{type(self).__qualname__}")
+
+        arrays = cache.load(key)
+
+        if arrays is None or arrays[0].shape != (self.domain_size, len(self._issues)):
+            bids = self.bids
+
+            try:
+                cache.store(key, self.bid_indices, self.bid_utilities)
+            except OSError:
+                return bids
+
+            arrays = cache.load(key)
+
+            if arrays is None:
+                return bids
+
+        return BidList(BidDomain.of(self._issues), *arrays)
+
     @property
     def bids(self) -> List[Bid]:
         """
             This method provides the list of all possible bids in a domain. It extracts the bids on the first call.
             Also, the bids in the list are assigned the utility value, and they are sorted in descending order.
 
+            The bid space is generated as a value-index matrix, scored by *get_utilities* in one batch and sorted with a
+            single stable *argsort*, so the order of the bids with equal utility is the generation order. The result is
+            a *BidList*: Bid objects are only created when they are accessed, and *bid_indices* and *bid_utilities*
+            provide the sorted arrays.
+
             :return: Sorted (in descending order) list of all bids in that domain
         """
         if len(self._bids) > 0:
             return self._bids
 
-        bids = [Bid({}, -1)]
-
         # Generate all bid combinations
-        for issue in self._issues:
-            new_bids = []
-
-            for value_name in issue.values:
-                for bid in bids:
-                    _bid = bid.copy()
-
-                    _bid[issue] = value_name
-
-                    new_bids.append(_bid)
-
-            bids = new_bids
+        indices = cartesian_indices([len(issue) for issue in self._issues])
 
         # Assign the utility of a bid
-        for bid in bids:
-            bid.utility = self.get_utility(bid)
+        utilities = self.get_utilities(indices)
 
         # Sort them descending order
-        bids = sorted(bids, reverse=True)
+        order = np.argsort(-utilities, kind="stable")
 
-        self._bids = bids
+        self._bids = BidList(BidDomain.of(self._issues), indices[order], utilities[order])
 
-        return bids
+        return self._bids
 
     def get_utility(self, bid: Bid) -> float:
         """
@@ -138,6 +193,110 @@ class Preference:
 
         return utility
 
+    @property
+    def issue_weight_vector(self) -> np.ndarray:
+        """
+            Issue weights as a vector, in *issues* order.
+
+            :return: Issue weight vector
+        """
+        return np.array([self._issue_weights[issue] for issue in self._issues], dtype=float)
+
+    @property
+    def value_weight_matrix(self) -> np.ndarray:
+        """
+            Value weights as a matrix: the element *[i, j]* is the weight of the *j-th* value of the *i-th* issue. Rows
+            of issues with fewer values are padded with zeros.
+
+            :return: Value weight matrix
+        """
+        matrix = np.zeros((len(self._issues), max((len(issue) for issue in self._issues), default=0)))
+
+        for i, issue in enumerate(self._issues):
+            weights = self._value_weights[issue]
+            matrix[i, :len(issue)] = [weights[value] for value in issue.values]
+
+        return matrix
+
+    def get_utilities(self, index_matrix: np.ndarray) -> np.ndarray:
+        """
+            This method calculates the utility values of many bids at once. The weighted value utilities are summed in
+            issue order, so the results are exactly equal to those of *get_utility*.
+
+            :param index_matrix: Value indices of the bids, one row per bid and one column per issue
+            :return: Utility value of each bid
+        """
+        index_matrix = np.asarray(index_matrix, dtype=np.intp)
+
+        if index_matrix.ndim != 2:
+            index_matrix = index_matrix.reshape(-1, len(self._issues))
+
+        if type(self).get_utility is not Preference.get_utility:
+            # Non-additive subclasses are scored bid by bid
+            domain = BidDomain.of(self._issues)
+
+            return np.array([self.get_utility(Bid.from_indices(domain, tuple(row)))
+                             for row in index_matrix.tolist()], dtype=float)
+
+        contributions = self.issue_weight_vector[:, None] * self.value_weight_matrix
+
+        utilities = np.zeros(len(index_matrix))
+
+        for i in range(len(self._issues)):
+            utilities += contributions[i, index_matrix[:, i]]
+
+        return utilities
+
+    def get_index_matrix(self, bids: Sequence[Bid]) -> np.ndarray:
+        """
+            This method provides the value-index matrix of the given bids for *get_utilities*.
+
+            :param bids: List of bids
+            :return: Value indices of the bids, one row per bid and one column per issue
+        """
+        domain = BidDomain.of(self._issues)
+
+        rows = [bid.indices if bid.domain is domain else domain.encode(bid[issue] for issue in self._issues)
+                for bid in bids]
+
+        return np.array(rows, dtype=np.intp).reshape(-1, len(self._issues))
+
+    @property
+    def bid_indices(self) -> np.ndarray:
+        """
+            Value-index matrix of *bids* (in the same order).
+
+            :return: Value indices of all bids, one row per bid
+        """
+        return self.__bid_arrays()[0]
+
+    @property
+    def bid_utilities(self) -> np.ndarray:
+        """
+            Utility values of *bids* (in the same order, i.e., descending).
+
+            :return: Utility value of each bid
+        """
+        return self.__bid_arrays()[1]
+
+    def __bid_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+            This method builds the value-index matrix and the utility array of *bids* once per bid list, unless the
+            bids are already kept as a *BidList*.
+
+            :return: Value-index matrix and utility array
+        """
+        bids = self.bids
+
+        if isinstance(bids, BidList):
+            return bids.indices, bids.utilities
+
+        if self._bid_arrays is None or self._bid_arrays[0] is not bids:
+            utilities = np.array([bid.utility for bid in bids], dtype=float)
+            self._bid_arrays = (bids, self.get_index_matrix(bids), utilities)
+
+        return self._bid_arrays[1], self._bid_arrays[2]
+
     def get_bid_at(self, target_utility: float) -> Bid:
         """
             This method returns the closest bid to provided target utility.
@@ -145,11 +304,17 @@ class Preference:
             :param target_utility: Target utility
             :return: The closest bid
         """
+        lazy_bids = self._lazy_bid_space()
+
+        if lazy_bids is not None:
+            return lazy_bids.get_bid_at(target_utility)
+
         return self.bids[self.__binary_search(target_utility)]
 
-    def get_bids_at_range(self, lower_bound: float = 0., upper_bound: float = 1.) -> List[Bid]:
+    def get_bids_at_range(self, lower_bound: float = 0., upper_bound: float = 1.) -> Sequence[Bid]:
         """
-            This method provides a list of bids in the utility range.
+            This method provides a list of bids in the utility range. If the bids are kept as a *BidList*, the result
+            is a view of it instead of a copy.
 
             .. math:: U_{bid} \in [U_{lower}, U_{upper}]
 
@@ -157,20 +322,30 @@ class Preference:
             :param upper_bound: The upper bound of the range
             :return: List of bids in that range.
         """
+        lazy_bids = self._lazy_bid_space()
+
+        if lazy_bids is not None:
+            return lazy_bids.get_bids_at_range(lower_bound, upper_bound)
+
         lower_index = self.__binary_search(lower_bound)
         upper_index = self.__binary_search(upper_bound)
 
         bids = self.bids
+        keys = self.__search_keys()
+
+        # Move the upper index to the first bid with the same utility
+        upper_index = int(np.searchsorted(keys, keys[upper_index], "left"))
 
-        while upper_index >= 1 and bids[upper_index].utility == bids[upper_index - 1].utility:
-            upper_index -= 1
+        # Move the lower index to the last bid with the same utility, but not beyond the second last bid
+        if lower_index < len(keys) - 2:
+            lower_index = min(int(np.searchsorted(keys, keys[lower_index], "right")) - 1, len(keys) - 2)
 
-        while lower_index < len(bids) - 2 and bids[lower_index].utility == bids[lower_index + 1].utility:
-            lower_index += 1
+        if isinstance(bids, BidList):
+            return bids.view(upper_index, lower_index + 1)
 
         return bids[upper_index:lower_index + 1]
 
-    def get_bids_at(self, target_utility: float, lower_bound: float = 0., upper_bound: float = 0.) -> List[Bid]:
+    def get_bids_at(self, target_utility: float, lower_bound: float = 0., upper_bound: float = 0.) -> Sequence[Bid]:
         """
             This method provides a list of bids in the utility window.
 
@@ -201,6 +376,20 @@ class Preference:
 
         return self.get_bid_at(target_utility)
 
+    def __search_keys(self) -> np.ndarray:
+        """
+            This method provides the negated utilities of *bids* as a contiguous array in ascending order, so that
+            *np.searchsorted* can be applied.
+
+            :return: Negated bid utilities
+        """
+        bids = self.bids
+
+        if self._search_keys is None or self._search_keys[0] is not bids:
+            self._search_keys = (bids, np.ascontiguousarray(-self.bid_utilities))
+
+        return self._search_keys[1]
+
     def __binary_search(self, target_utility: float) -> int:
         """
             This method employs Binary-Search algorithm to find the index of the closest bid to the given target utility.
@@ -208,39 +397,70 @@ class Preference:
             :param target_utility: Target utility
             :return: Index of the closest bid to the target utility
         """
-        bids = self.bids
+        keys = self.__search_keys()
 
-        if target_utility >= bids[0].utility:
+        if target_utility >= -keys[0]:
             return 0
 
-        if target_utility <= bids[-1].utility:
-            return len(bids) - 1
+        if target_utility <= -keys[-1]:
+            return len(keys) - 1
 
+        # Bids in [0, above) have a higher utility than the target, bids in [above, below) have the target utility
+        above = int(np.searchsorted(keys, -target_utility, "left"))
+        below = int(np.searchsorted(keys, -target_utility, "right"))
+
+        # Replay the comparisons of the binary search over the bid positions only. If some bids have exactly the
+        # target utility, this selects the same one among them as a binary search over the utilities would.
         low: int = 0
-        high: int = len(bids) - 1
+        high: int = len(keys) - 1
 
         while low <= high:
             mid: int = (high + low) // 2
 
-            if target_utility < bids[mid].utility:
+            if mid < above:
                 low = mid + 1
-            elif target_utility > bids[mid].utility:
+            elif mid >= below:
                 high = mid - 1
             else:
                 return mid
 
-        if abs(bids[low].utility - target_utility) < abs(bids[high].utility - target_utility):
+        if abs(-keys[low] - target_utility) < abs(-keys[high] - target_utility):
             return low
 
         return high
 
+    def _clone(self) -> "Preference":
+        """
+            This method creates a copy of this preference (of the same class) in memory, without reading the profile
+            JSON file. The weights are copied, so that the copy can be changed independently. The issues and the bid
+            arrays are shared, while the copy creates its own Bid objects. Other attributes of subclasses are shared.
+
+            :return: Copy of this preference
+        """
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+
+        clone._issues = list(self._issues)
+        clone._issue_weights = self._issue_weights.copy()
+        clone._value_weights = {issue: weights.copy() for issue, weights in self._value_weights.items()}
+        clone._bids = []
+        clone._lazy_bids = None
+        clone._bid_arrays = None
+        clone._search_keys = None
+        clone._issues_view = None
+
+        if len(self._bids) > 0:
+            clone._bids = BidList(BidDomain.of(self._issues), self.bid_indices, self.bid_utilities)
+
+        return clone
+
     def __copy__(self):
         """
-            A copy of this object
+            A copy of this object, created in memory (see *_clone*)
 
             :return: Copy of Preference object
         """
-        return Preference(self.profile_json_path)
+        return self._clone()
 
     def copy(self):
         """
@@ -251,13 +471,17 @@ class Preference:
         return self.__copy__()
 
     @property
-    def issues(self) -> List[Issue]:
+    def issues(self) -> Tuple[Issue, ...]:
         """
-            A copy of list of Issue in that domain
+            The issues in that domain. The tuple is shared by the calls, not copied.
 
-            :return: Copy of list of Issue in that domain
+            :return: Tuple of Issue in that domain
         """
-        return self._issues.copy()
+        if self._issues_view is None or self._issues_view[0] is not self._issues or \
+                len(self._issues_view[1]) != len(self._issues):
+            self._issues_view = (self._issues, tuple(self._issues))
+
+        return self._issues_view[1]
 
     @property
     def reservation_value(self) -> float:
@@ -269,22 +493,24 @@ class Preference:
         return self._reservation_value
 
     @property
-    def issue_weights(self) -> Dict[Issue, float]:
+    def issue_weights(self) -> Mapping[Issue, float]:
         """
-            Copy of dictionary of Issue-Weight pairs.
+            Read-only view of dictionary of Issue-Weight pairs. The view follows the changes of the weights, use *copy()*
+            to keep the current weights.
 
-            :return: Copy of dictionary of Issue-Weight pairs.
+            :return: Read-only view of dictionary of Issue-Weight pairs.
         """
-        return self._issue_weights.copy()
+        return MappingProxyType(self._issue_weights)
 
     @property
-    def value_weights(self) -> Dict[Issue, Dict[str, float]]:
+    def value_weights(self) -> Mapping[Issue, Dict[str, float]]:
         """
-            Copy of dictionary of Issue-Value - Weight pairs
+            Read-only view of dictionary of Issue-Value - Weight pairs. The view follows the changes of the weights, use
+            *copy()* to keep the current weights.
 
-            :return: Copy of dictionary of Issue-Value - Weight pairs
+            :return: Read-only view of dictionary of Issue-Value - Weight pairs
         """
-        return self._value_weights.copy()
+        return MappingProxyType(self._value_weights)
 
     @property
     def max_util_bid(self) -> Bid:
@@ -293,6 +519,11 @@ class Preference:
 
             :return: The maximum utility value in the bid space
         """
+        lazy_bids = self._lazy_bid_space()
+
+        if lazy_bids is not None:
+            return lazy_bids.max_util_bid
+
         return self.bids[0].copy()
 
     @property
@@ -302,8 +533,63 @@ class Preference:
 
             :return: The minimum utility value in the bid space
         """
+        lazy_bids = self._lazy_bid_space()
+
+        if lazy_bids is not None:
+            return lazy_bids.min_util_bid
+
         return self.bids[-1].copy()
 
+    @property
+    def domain_size(self) -> int:
+        """
+            The number of possible bids in the domain, without generating them
+
+            :return: Number of bids
+        """
+        size = 1
+
+        for issue in self._issues:
+            size *= len(issue)
+
+        return size
+
+    def _additive_model(self) -> Optional[Tuple[List[List[float]], float]]:
+        """
+            This method provides the additive utility model for the lazy bid enumeration: the weighted utility of
+            each value (in *issue.values* order) for each issue, and a constant offset. Subclasses that override
+            *get_utility* must override this method too, or return None.
+
+            :return: Value contributions and offset, or None if the preference is not additive
+        """
+        if type(self).get_utility is not Preference.get_utility:
+            return None
+
+        contributions = [[self._issue_weights[issue] * self._value_weights[issue][value] for value in issue.values]
+                         for issue in self._issues]
+
+        return contributions, 0.
+
+    def _lazy_bid_space(self) -> Optional[LazyBidSpace]:
+        """
+            This method provides the lazy bid space if the domain is larger than *lazy_threshold* and the bid list has
+            not been generated.
+
+            :return: LazyBidSpace object or None
+        """
+        if len(self._bids) > 0 or self.domain_size <= self.lazy_threshold:
+            return None
+
+        if self._lazy_bids is None:
+            model = self._additive_model()
+
+            if model is None:
+                return None
+
+            self._lazy_bids = LazyBidSpace(self.issues, *model)
+
+        return self._lazy_bids
+
 
 def domain_loader(domain_name: str) -> (Preference, Preference):
     """
@@ -2,8 +2,9 @@ import time
 from typing import List, Union, Optional
 from nenv.Action import Accept, Action
 from nenv.Agent import AbstractAgent
-from nenv.BidSpace import BidSpace
-from nenv.utils.ProcessManager import ProcessManager
+from nenv.BidSpace import BidSpace, bid_space_registry
+from nenv.utils.ProcessManager import ProcessManager, TimeoutBackend
+from nenv.utils.SessionClock import SessionClock, VirtualClock, SESSION_CLOCKS
 from nenv.utils.SessionOps import session_operation
 from nenv.utils.ExcelLog import ExcelLog, LogRow, update
 
@@ -42,8 +43,10 @@ class Session:
     start_time: float                       #: Start time of the session
     process_manager: ProcessManager         #: Process Manager
     time_out: float                         #: Time out for any process
+    inline: bool                            #: Whether the agent methods are called directly, without ProcessManager
+    clock: SessionClock                     #: Clock of the time-based deadline
 
-    def __init__(self, agentA: AbstractAgent, agentB: AbstractAgent, path: str, deadline_time: Optional[int], deadline_round: Optional[int], loggers: list):
+    def __init__(self, agentA: AbstractAgent, agentB: AbstractAgent, path: str, deadline_time: Optional[int], deadline_round: Optional[int], loggers: list, timeout_backend: Union[str, TimeoutBackend] = "trace", clock: Union[str, SessionClock] = "wall"):
         """
             Constructor
 
@@ -53,18 +56,34 @@ class Session:
             :param deadline_time: Time-Based deadline in terms of seconds.
             :param deadline_round: Round-based deadline in terms of number of rounds.
             :param loggers: List of logger
+            :param timeout_backend: Timeout backend of the agent calls, see *TimeoutBackend*, or *"inline"* to call
+                the agent methods directly. An inline call cannot be interrupted, it is timed-out if it takes longer than
+                the time out when it returns. *Default "trace"*
+            :param clock: Clock of the time-based deadline, or its name: *"wall"* for the wall clock or *"virtual"* to
+                advance the time by the CPU time of the agent operations, see *VirtualClock*. *Default "wall"*
         """
 
         assert deadline_time is not None or deadline_round is not None, "No deadline type is specified."
         assert deadline_time is None or deadline_time > 0, "Deadline must be positive."
         assert deadline_round is None or deadline_round > 0, "Deadline must be positive."
 
-        self.process_manager = ProcessManager()
+        self.inline = timeout_backend == "inline"
+        self.process_manager = ProcessManager("trace" if self.inline else timeout_backend)
+
+        if isinstance(clock, str):
+            assert clock in SESSION_CLOCKS, f"Unknown session clock: {clock}"
+
+            clock = SESSION_CLOCKS[clock]()
+
+        assert deadline_round is not None or not isinstance(clock, VirtualClock) or clock.operation_costs is None or \
+            clock.operation_costs.get("Act", clock.default_cost) > 0, "The virtual clock never reaches the deadline."
+
+        self.clock = clock
 
         self.agentA = agentA
         self.agentB = agentB
 
-        self.bidSpace = BidSpace(agentA.preference, agentB.preference)
+        self.bidSpace = bid_space_registry.get(agentA.preference, agentB.preference)
 
         self.log_path = path
         self.deadline_time = deadline_time
@@ -100,12 +119,12 @@ class Session:
         """
 
         if self.deadline_time is not None and self.deadline_round is not None:
-            t_time = (time.time() - self.start_time) / self.deadline_time
+            t_time = self.clock.elapsed() / self.deadline_time
             t_round = self.round / self.deadline_round
 
             return max(t_round, t_time)
         elif self.deadline_time is not None:
-            return (time.time() - self.start_time) / self.deadline_time
+            return self.clock.elapsed() / self.deadline_time
         elif self.deadline_round is not None:
             return self.round / self.deadline_round
         else:
@@ -135,7 +154,7 @@ class Session:
             "ProductScore": agent1_utility * agent2_utility,
             "SocialWelfare": agent1_utility + agent2_utility,
             "BidContent": action.bid,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }
 
         self.session_log.append({"Session": row})
@@ -172,7 +191,7 @@ class Session:
             "ProductScore": agent1_utility * agent2_utility,
             "SocialWelfare": agent1_utility + agent2_utility,
             "BidContent": action.bid,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }
 
         self.session_log.append({"Session": row})
@@ -201,7 +220,7 @@ class Session:
             "ProductScore": self.last_row["ProductScore"],
             "SocialWelfare": self.last_row["SocialWelfare"],
             "BidContent": action.bid,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }}
 
         for logger in self.loggers:
@@ -241,7 +260,7 @@ class Session:
             "ProductScore": agentA_utility * agentB_utility,
             "SocialWelfare": agentA_utility + agentB_utility,
             "BidContent": None,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }}
 
         for logger in self.loggers:
@@ -283,7 +302,7 @@ class Session:
             "ProductScore": agentA_utility * agentB_utility,
             "SocialWelfare": agentA_utility + agentB_utility,
             "BidContent": None,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }}
 
         for logger in self.loggers:
@@ -325,7 +344,7 @@ class Session:
             "ProductScore": agentA_utility * agentB_utility,
             "SocialWelfare": agentA_utility + agentB_utility,
             "BidContent": None,
-            "ElapsedTime": time.time() - self.start_time
+            "ElapsedTime": self.clock.elapsed()
         }}
 
         for logger in self.loggers:
@@ -336,9 +355,9 @@ class Session:
     def _run_process_manager(self, agent_no: str, process_name: str, call_events: bool = True, **kwargs) -> \
             Union[dict, Action, None]:
         """
-            This method calls the corresponding process with the process manager. If any exception is occurred,
-            or the initiation process is timed out, this method returns a corresponding tournament log to end the
-            negotiation session. Otherwise, it provides the return value of the process.
+            This method calls the corresponding process with the process manager, or directly in the inline mode. If
+            any exception is occurred, or the initiation process is timed out, this method returns a corresponding
+            tournament log to end the negotiation session. Otherwise, it provides the return value of the process.
 
             :param agent_no: Agent no
             :param process_name: Process name
@@ -347,21 +366,54 @@ class Session:
             :return: Return value of the process, or corresponding tournament log to end the negotiation
         """
 
-        kwargs["agent"] = self.agentA if agent_no == 'A' else self.agentB
-        kwargs["process_name"] = process_name
+        # CPU time of the agent method, measured in the thread (or the child process) which runs it
+        cpu_time = []
+
+        if self.inline:
+            exception = None
+            start_time = time.perf_counter()
+
+            try:
+                return_val = session_operation(self.agentA if agent_no == 'A' else self.agentB, process_name,
+                                               cpu_time, **kwargs)
+            except Exception as e:
+                return_val = None
+                exception = e
+
+            time_outed = exception is None and time.perf_counter() - start_time > self.time_out
+        else:
+            kwargs["agent"] = self.agentA if agent_no == 'A' else self.agentB
+            kwargs["process_name"] = process_name
+            kwargs["cpu_time"] = cpu_time
+
+            self.process_manager.run(session_operation, self.time_out, kwargs)
 
-        self.process_manager.run(session_operation, self.time_out, kwargs)
+            # The "process" backend provides the measurement of the child process
+            cpu_time = self.process_manager.args["cpu_time"]
 
-        if self.process_manager.has_exception:
+            # The "process" backend provides a copy of the agent which has the changes made by the call
+            if agent_no == 'A':
+                self.agentA = self.process_manager.args["agent"]
+            else:
+                self.agentB = self.process_manager.args["agent"]
+
+            return_val = self.process_manager.return_val
+            exception = self.process_manager.exception if self.process_manager.has_exception else None
+            time_outed = self.process_manager.time_outed
+
+        # A timed-out call which is still running is not measured
+        self.clock.advance(process_name, sum(cpu_time))
+
+        if exception is not None:
             print(
                 f"Exception occurs in {self.agentA.name if agent_no == 'A' else self.agentB.name} while {process_name}:")
-            print(self.process_manager.exception)
+            print(exception)
 
             if call_events:
                 return self.on_error(agent_no, kwargs.get('t', 0))
             else:
                 return {}
-        elif self.process_manager.time_outed:
+        elif time_outed:
             print(f"Timed Out: {self.agentA.name if agent_no == 'A' else self.agentB.name} while {process_name}")
 
             if call_events:
@@ -369,7 +421,7 @@ class Session:
             else:
                 return {}
         else:
-            return self.process_manager.return_val
+            return return_val
 
     def start(self) -> LogRow:
         """
@@ -377,6 +429,17 @@ class Session:
 
             :return: Log row for tournament
         """
+        try:
+            return self.__negotiate()
+        finally:
+            self.process_manager.close()
+
+    def __negotiate(self) -> LogRow:
+        """
+            This method conducts the negotiation until it ends.
+
+            :return: Log row for tournament
+        """
 
         # print(f"{self.agentA.name} vs. {self.agentB.name} is started.")
 
@@ -395,6 +458,7 @@ class Session:
         action = None
         self.round = 0
         self.start_time = time.time()
+        self.clock.start()
         t = self.get_time()
 
         while t < 1.:  # Until deadline
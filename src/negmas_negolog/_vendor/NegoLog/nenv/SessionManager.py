@@ -1,8 +1,11 @@
 from typing import List, Union, Optional
+from nenv.utils.ProcessManager import TimeoutBackend
+from nenv.utils.SessionClock import SessionClock
 from nenv.OpponentModel import OpponentModelClass
 from nenv.Agent import AbstractAgent, AgentClass
 from nenv.Session import Session
 from nenv.Preference import Preference, domain_loader
+from nenv.DomainCache import DomainCache
 from nenv.logger import AbstractLogger, LoggerClass
 from nenv.utils import LogRow
 from nenv.utils.ExcelLog import update
@@ -20,8 +23,10 @@ class SessionManager:
     session: Session                 #: Negotiation session object
     deadline_time: Optional[int]    #: The time-based deadline in terms of seconds
     deadline_time: Optional[int]    #: The round-based in terms of number of rounds
+    timeout_backend: Union[str, TimeoutBackend]     #: Timeout backend of the agent calls
+    clock: Union[str, SessionClock]                 #: Clock of the time-based deadline
 
-    def __init__(self, agentA_class: AgentClass, agentB_class: AgentClass, domain_name: str, deadline_time: Optional[int], deadline_round: Optional[int], estimators: List[OpponentModelClass], loggers: List[LoggerClass]):
+    def __init__(self, agentA_class: AgentClass, agentB_class: AgentClass, domain_name: str, deadline_time: Optional[int], deadline_round: Optional[int], estimators: List[OpponentModelClass], loggers: List[LoggerClass], domain_cache: Optional[DomainCache] = None, timeout_backend: Union[str, TimeoutBackend] = "trace", clock: Union[str, SessionClock] = "wall"):
         """
             Constructor
 
@@ -32,13 +37,19 @@ class SessionManager:
             :param deadline_round: Round-based deadline in terms of number of rounds
             :param estimators: List of Opponent Model
             :param loggers: List of logger
+            :param domain_cache: Cache of the parsed domains. If it is not given, the domain is loaded from the files.
+            :param timeout_backend: Timeout backend of the agent calls, see *TimeoutBackend*. *Default "trace"*
+            :param clock: Clock of the time-based deadline, see *SessionClock*. *Default "wall"*
         """
 
         assert deadline_time is not None or deadline_round is not None, "No deadline type is specified."
         assert deadline_time is None or deadline_time > 0, "Deadline must be positive."
         assert deadline_round is None or deadline_round > 0, "Deadline must be positive."
 
-        self.prefA, self.prefB = domain_loader(domain_name)
+        if domain_cache is not None:
+            self.prefA, self.prefB = domain_cache.load(domain_name)
+        else:
+            self.prefA, self.prefB = domain_loader(domain_name)
         self.domain_no = domain_name
 
         self.agentA = agentA_class(self.prefA, deadline_round if deadline_time is None else deadline_time, [estimator(self.prefA) for estimator in estimators])
@@ -48,6 +59,8 @@ class SessionManager:
         self.deadline_time = deadline_time
         self.deadline_round = deadline_round
         self.loggers = loggers
+        self.timeout_backend = timeout_backend
+        self.clock = clock
 
     def run(self, save_path: str) -> LogRow:
         """
@@ -56,7 +69,7 @@ class SessionManager:
             :param save_path: Session log file
             :return: Log row for tournament
         """
-        self.session = Session(self.agentA, self.agentB, save_path, self.deadline_time, self.deadline_round, self.loggers)
+        self.session = Session(self.agentA, self.agentB, save_path, self.deadline_time, self.deadline_round, self.loggers, self.timeout_backend, self.clock)
 
         session_result = self.session.start()
 
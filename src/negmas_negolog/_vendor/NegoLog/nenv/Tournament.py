@@ -4,19 +4,113 @@ import random
 import shutil
 import time
 import warnings
-from typing import Union, Set, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Union, Set, List, Tuple, Optional, Dict, Any
 import numpy as np
 import pandas as pd
 from nenv.Agent import AgentClass
+from nenv.utils.ExcelLog import LogRow
 from nenv.logger import AbstractLogger, LoggerClass
 from nenv.OpponentModel import OpponentModelClass
 from nenv.SessionManager import SessionManager
-from nenv.utils import ExcelLog, TournamentProcessMonitor, open_folder
+from nenv.DomainCache import DomainCache
+from nenv.BidSpace import bid_space_registry
+from nenv.utils import ExcelLog, TournamentProcessMonitor, TournamentJournal, open_folder, TIMEOUT_BACKENDS, SESSION_CLOCKS, SessionClock
+from nenv.utils.TournamentJournal import SessionKey
+
+
+SessionTask = Tuple[int, AgentClass, AgentClass, str, Dict[str, Any]]
+"""
+    A negotiation session of a tournament: session index, class of agentA, class of agentB, domain name and the
+    tournament settings.
+"""
+
+SessionOutcome = Tuple[int, LogRow, str, str, List[str], float]
+"""
+    Result of a negotiation session: session index, tournament log row, name of agentA, name of agentB, names of the
+    estimators and the session real time in terms of seconds.
+"""
+
+_worker_domain_cache: Optional[DomainCache] = None  # Domain cache of a worker process
+
+
+def session_seed(seed: int, session_index: int) -> int:
+    """
+        This method derives the random seed of a negotiation session from the tournament seed, so that each session
+        gets the same seed whichever worker runs it.
+
+        :param seed: Random seed of the tournament
+        :param session_index: Index of the session in the negotiation combinations
+        :return: Random seed of the session
+    """
+    return int(np.random.SeedSequence([seed, session_index]).generate_state(1)[0])
+
+
+def run_session(task: SessionTask, domain_cache: Optional[DomainCache] = None) -> SessionOutcome:
+    """
+        This method runs a negotiation session of a tournament.
+
+        :param task: The negotiation session
+        :param domain_cache: Cache of the parsed domains
+        :return: Result of the session
+    """
+    session_index, agent_class_1, agent_class_2, domain_name, settings = task
+
+    if settings["seed"] is not None:
+        seed = session_seed(settings["seed"], session_index)
+
+        random.seed(seed)
+        np.random.seed(seed)
+
+    session_runner = SessionManager(agent_class_1, agent_class_2, domain_name, settings["deadline_time"], settings["deadline_round"], settings["estimators"], settings["loggers"], domain_cache, settings["timeout_backend"], settings["clock"])
+
+    session_path = "%s_%s_Domain%s.xlsx" % \
+                   (session_runner.agentA.name, session_runner.agentB.name, domain_name)
+
+    session_start_time = time.time()
+    session_log = session_runner.run(os.path.join(settings["result_dir"], "sessions/", session_path))
+    session_end_time = time.time()
+
+    estimator_names = [estimator.name for estimator in session_runner.agentA.estimators]
+
+    return session_index, session_log, session_runner.agentA.name, session_runner.agentB.name, estimator_names, \
+        session_end_time - session_start_time
+
+
+def _initiate_worker():
+    """
+        This method initiates a worker process of a parallel tournament.
+
+        :return: Nothing
+    """
+    global _worker_domain_cache
+
+    _worker_domain_cache = DomainCache()
+
+    bid_space_registry.clear()
+
+
+def _run_session_in_worker(task: SessionTask) -> SessionOutcome:
+    """
+        This method runs a negotiation session in a worker process with the domain cache of the worker.
+
+        :param task: The negotiation session
+        :return: Result of the session
+    """
+    return run_session(task, _worker_domain_cache)
 
 
 class Tournament:
     """
         This class conducts a tournament based on given settings.
+
+        The sessions are independent, so they can run in parallel worker processes (see *workers*). The results are
+        logged in the order of the negotiation combinations, and each session gets a random seed derived from the
+        tournament seed and its index. Thus, the results do not depend on the number of workers.
+
+        Each completed session is recorded in the journal of the result directory (*journal.jsonl*). A killed or
+        crashed tournament can be resumed (see *resume*): the sessions in the journal are not negotiated again, and
+        the analysis is built from the journal and the new sessions.
     """
     agent_classes: Set[AgentClass]                 #: List of Agent classes
     loggers: List[AbstractLogger]                  #: List of Logger classes
@@ -31,6 +125,10 @@ class Tournament:
     self_negotiation: bool                         #: Whether the agents negotiate with itself, or not
     tournament_process: TournamentProcessMonitor   #: Process monitor
     killed: bool                                   #: Whether the tournament process is killed, or not
+    timeout_backend: str                           #: Timeout backend of the agent calls
+    clock: Union[str, SessionClock]                #: Clock of the time-based deadline
+    workers: int                                   #: Number of worker processes
+    resume: bool                                   #: Whether the tournament continues from its journal, or not
 
     def __init__(self, agent_classes: Union[List[AgentClass], Set[AgentClass]],
                  domains: List[str],
@@ -42,7 +140,11 @@ class Tournament:
                  repeat: int = 1,
                  result_dir: str = "results/",
                  seed: Optional[int] = None,
-                 shuffle: bool = False
+                 shuffle: bool = False,
+                 timeout_backend: str = "trace",
+                 clock: Union[str, SessionClock] = "wall",
+                 workers: int = 1,
+                 resume: bool = False
                  ):
         """
             This class conducts a negotiation tournament.
@@ -58,6 +160,15 @@ class Tournament:
             :param result_dir: The result directory that the tournament logs will be created. *Default 'results/'*
             :param seed: Setting seed for whole tournament. *Default None*.
             :param shuffle: Whether shuffle negotiation combinations. *Default False*
+            :param timeout_backend: How the timeouts of the agent calls are enforced: *"trace"*, *"thread"*,
+                *"signal"* or *"process"* (see *TimeoutBackend*), or *"inline"* to call the agents directly for the
+                trusted agents. *Default "trace"*
+            :param clock: Clock of the time-based deadline: *"wall"*, *"virtual"* or a *SessionClock* object (e.g.,
+                *VirtualClock* with fixed operation costs for the reproducible results). *Default "wall"*
+            :param workers: Number of worker processes running the sessions in parallel. The agent classes, the loggers
+                and the clock must be picklable for more than one worker. *Default 1*
+            :param resume: Whether the tournament continues from the journal in the result directory, instead of
+                deleting the result directory. The settings must be the same as the previous run. *Default False*
         """
 
         assert deadline_time is not None or deadline_round is not None, "No deadline type is specified."
@@ -70,6 +181,10 @@ class Tournament:
 
         assert len(agent_classes) > 0, "Empty list of agent classes."
         assert len(domains) > 0, "Empty list of domains."
+        assert timeout_backend in TIMEOUT_BACKENDS or timeout_backend == "inline", \
+            f"Unknown timeout backend: {timeout_backend}"
+        assert not isinstance(clock, str) or clock in SESSION_CLOCKS, f"Unknown session clock: {clock}"
+        assert workers > 0, "Number of workers must be positive."
 
         self.agent_classes = agent_classes
         self.domains = domains
@@ -84,6 +199,10 @@ class Tournament:
         self.shuffle = shuffle
         self.tournament_process = TournamentProcessMonitor()
         self.killed = False
+        self.timeout_backend = timeout_backend
+        self.clock = clock
+        self.workers = workers
+        self.resume = resume
 
     def run(self):
         """
@@ -98,11 +217,10 @@ class Tournament:
             os.environ['PYTHONHASHSEED'] = str(self.seed)
 
         # Create directory
-        if os.path.exists(self.result_dir):
+        if os.path.exists(self.result_dir) and not self.resume:
             shutil.rmtree(self.result_dir)
 
-        os.makedirs(self.result_dir)
-        os.makedirs(os.path.join(os.path.join(self.result_dir, "sessions/")))
+        os.makedirs(os.path.join(os.path.join(self.result_dir, "sessions/")), exist_ok=True)
 
         # Set killed flag
         self.killed = False
@@ -112,6 +230,17 @@ class Tournament:
 
         # Get all combinations
         negotiations = self.generate_combinations()
+        session_keys = self.generate_session_keys(negotiations)
+
+        # Completed sessions of the previous run
+        journal = TournamentJournal(os.path.join(self.result_dir, "journal.jsonl"))
+        completed_sessions = journal.load()
+
+        # Each domain is parsed once, the sessions get their own copies of the preferences
+        domain_cache = DomainCache()
+
+        # Bid spaces are shared by the sessions and the loggers during this tournament
+        bid_space_registry.clear()
 
         # Names for logger
         agent_names = []
@@ -122,42 +251,61 @@ class Tournament:
 
         tournament_logs.save(os.path.join(self.result_dir, "results.xlsx"))
 
-        self.tournament_process.initiate(len(negotiations))
+        # Results are logged in the order of the combinations
+        pending_outcomes = {}
+
+        for i, session_key in enumerate(session_keys):
+            if session_key in completed_sessions:
+                entry = completed_sessions[session_key]
+
+                pending_outcomes[i] = (i, entry["log"], *entry["agent_names"], entry["estimator_names"], entry["session_real_time"])
+
+        self.tournament_process.initiate(len(negotiations) - len(pending_outcomes), self.workers)
 
         print(f'Started at {str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))}.')
         print("Total negotiation:", len(negotiations))
 
+        if len(pending_outcomes) > 0:
+            print("Resumed negotiation:", len(pending_outcomes))
+
         print("*" * 50)
 
-        for i, (agent_class_1, agent_class_2, domain_name) in enumerate(negotiations):
-            # Start session
-            session_runner = SessionManager(agent_class_1, agent_class_2, domain_name, self.deadline_time, self.deadline_round, list(self.estimators), self.loggers)
+        settings = {
+            "deadline_time": self.deadline_time,
+            "deadline_round": self.deadline_round,
+            "estimators": list(self.estimators),
+            "loggers": self.loggers,
+            "timeout_backend": self.timeout_backend,
+            "clock": self.clock,
+            "result_dir": self.result_dir,
+            "seed": self.seed
+        }
 
-            session_path = "%s_%s_Domain%s.xlsx" % \
-                           (session_runner.agentA.name, session_runner.agentB.name, domain_name)
+        tasks = [(i, agent_class_1, agent_class_2, domain_name, settings)
+                 for i, (agent_class_1, agent_class_2, domain_name) in enumerate(negotiations)
+                 if i not in pending_outcomes]
 
-            session_start_time = time.time()
-            tournament_logs.append(session_runner.run(os.path.join(self.result_dir, "sessions/", session_path)))
-            session_end_time = time.time()
+        if self.workers == 1:
+            outcomes = (run_session(task, domain_cache) for task in tasks)
+        else:
+            outcomes = self.__run_in_parallel(tasks)
 
-            # Update total elapsed time
-            session_elapsed_time = session_end_time - session_start_time
+        next_index = self.__log_outcomes(pending_outcomes, 0, tournament_logs, agent_names, estimator_names)
 
-            tournament_logs.update({"TournamentResults": {"SessionRealTime": session_elapsed_time}})
+        for outcome in outcomes:
+            session_index, session_log, agent_name_1, agent_name_2, session_estimator_names, session_elapsed_time = outcome
 
-            # Get list of name for loggers
-            if len(estimator_names) == 0:
-                estimator_names = [estimator.name for estimator in session_runner.agentA.estimators]
+            journal.append(session_keys[session_index], session_log, [agent_name_1, agent_name_2], session_estimator_names, session_elapsed_time)
 
-            if session_runner.agentA.name not in agent_names:
-                agent_names.append(session_runner.agentA.name)
+            pending_outcomes[session_index] = outcome
 
-            if session_runner.agentB.name not in agent_names:
-                agent_names.append(session_runner.agentB.name)
+            print(self.tournament_process.update(f"{agent_name_1} vs. {agent_name_2} in Domain: {negotiations[session_index][2]}", session_elapsed_time))
 
-            print(self.tournament_process.update(f"{session_runner.agentA.name} vs. {session_runner.agentB.name } in Domain: {domain_name}", session_elapsed_time))
+            next_index = self.__log_outcomes(pending_outcomes, next_index, tournament_logs, agent_names, estimator_names)
 
             if self.killed:  # Check for kill signal
+                outcomes.close()
+
                 return
 
         self.tournament_process.end()
@@ -182,6 +330,79 @@ class Tournament:
         # Show folder
         open_folder(self.result_dir)
 
+    @staticmethod
+    def __log_outcomes(pending_outcomes: Dict[int, SessionOutcome], next_index: int, tournament_logs: ExcelLog, agent_names: List[str], estimator_names: List[str]) -> int:
+        """
+            This method logs the pending session results in the order of the combinations, until the result of the next
+            session is not available.
+
+            :param pending_outcomes: Session results which are not logged yet by the session indices
+            :param next_index: Index of the next session to log
+            :param tournament_logs: Tournament logs
+            :param agent_names: List of agent names for the loggers, updated in place
+            :param estimator_names: List of estimator names for the loggers, updated in place
+            :return: Index of the next session to log
+        """
+        while next_index in pending_outcomes:
+            _, session_log, agent_name_1, agent_name_2, session_estimator_names, session_elapsed_time = \
+                pending_outcomes.pop(next_index)
+
+            next_index += 1
+
+            tournament_logs.append(session_log)
+
+            # Update total elapsed time
+            tournament_logs.update({"TournamentResults": {"SessionRealTime": session_elapsed_time}})
+
+            # Get list of name for loggers
+            if len(estimator_names) == 0:
+                estimator_names.extend(session_estimator_names)
+
+            if agent_name_1 not in agent_names:
+                agent_names.append(agent_name_1)
+
+            if agent_name_2 not in agent_names:
+                agent_names.append(agent_name_2)
+
+        return next_index
+
+    def __run_in_parallel(self, tasks: List[SessionTask]):
+        """
+            This method runs the negotiation sessions in the worker processes. It yields the result of each session as
+            soon as it ends, so the results are not in the order of the tasks.
+
+            Each worker keeps its own domain cache. At most two sessions per worker are submitted at once, so that
+            the tournament can be killed without waiting for all sessions.
+
+            :param tasks: Negotiation sessions
+            :return: Generator of the session results
+        """
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initiate_worker)
+
+        try:
+            remaining_tasks = iter(tasks)
+            running = set()
+
+            while True:
+                while len(running) < 2 * self.workers:
+                    task = next(remaining_tasks, None)
+
+                    if task is None:
+                        break
+
+                    running.add(executor.submit(_run_session_in_worker, task))
+
+                if len(running) == 0:
+                    return
+
+                completed, running = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in completed:
+                    yield future.result()
+        finally:
+            # A killed tournament does not wait for the running sessions
+            executor.shutdown(wait=not self.killed, cancel_futures=True)
+
     def generate_combinations(self) -> List[Tuple[AgentClass, AgentClass, str]]:
         """
             This method generates all combinations of negotiations.
@@ -204,6 +425,27 @@ class Tournament:
 
         return combinations
 
+    @staticmethod
+    def generate_session_keys(negotiations: List[Tuple[AgentClass, AgentClass, str]]) -> List[SessionKey]:
+        """
+            This method generates the journal keys of the negotiation combinations. The repeated combinations are
+            distinguished by their repetition numbers, so that the keys do not depend on the order of the combinations.
+
+            :param negotiations: Negotiation combinations
+            :return: Key of each combination
+        """
+        repetitions = {}
+        session_keys = []
+
+        for agent_class_1, agent_class_2, domain_name in negotiations:
+            combination = (agent_class_1.__name__, agent_class_2.__name__, domain_name)
+
+            repetitions[combination] = repetitions.get(combination, 0) + 1
+
+            session_keys.append((*combination, repetitions[combination] - 1))
+
+        return session_keys
+
     def extract_domains(self):
         """
             This method extracts the domain information into the result directory.
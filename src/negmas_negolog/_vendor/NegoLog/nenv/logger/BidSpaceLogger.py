@@ -1,6 +1,6 @@
 from nenv.logger.AbstractLogger import AbstractLogger, Bid, SessionLogs, Session, LogRow
 from typing import Union, List
-from nenv.BidSpace import BidSpace, BidPoint
+from nenv.BidSpace import BidSpace, BidPoint, bid_space_registry
 
 
 class BidSpaceLogger(AbstractLogger):
@@ -19,7 +19,7 @@ class BidSpaceLogger(AbstractLogger):
             :param session: Current negotiation session
             :return: Empty list
         """
-        self.bidSpace = BidSpace(session.agentA.preference, session.agentB.preference)
+        self.bidSpace = bid_space_registry.get(session.agentA.preference, session.agentB.preference)
 
         return []
 
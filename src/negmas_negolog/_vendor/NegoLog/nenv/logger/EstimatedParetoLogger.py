@@ -2,7 +2,7 @@ import os
 
 import numpy as np
 
-from nenv.BidSpace import BidSpace, BidPoint
+from nenv.BidSpace import BidSpace, BidPoint, bid_space_registry
 from nenv.logger.AbstractLogger import AbstractLogger, Session, SessionLogs, Bid, LogRow
 from typing import List, Union, Optional
 
@@ -25,7 +25,7 @@ class EstimatedParetoLogger(AbstractLogger):
         if len(session.agentA.estimators) == 0:
             return []
 
-        self.real_pareto = BidSpace(session.agentA.preference, session.agentB.preference).pareto
+        self.real_pareto = bid_space_registry.get(session.agentA.preference, session.agentB.preference).pareto
 
         return []
 
@@ -1,6 +1,6 @@
 import warnings
 from nenv.Preference import domain_loader
-from nenv.BidSpace import BidSpace, BidPoint
+from nenv.BidSpace import BidSpace, BidPoint, bid_space_registry
 from nenv.logger.AbstractLogger import (
     AbstractLogger,
     SessionLogs,
@@ -9,11 +9,10 @@ from nenv.logger.AbstractLogger import (
     ExcelLog,
 )
 from typing import Union, Optional
-from nenv.utils.tournament_graphs import plt, DRAWING_FORMAT
+from nenv.utils.tournament_graphs import DRAWING_FORMAT
 from typing import List
 import numpy as np
 import os
-import matplotlib
 
 
 class UtilityDistributionLogger(AbstractLogger):
@@ -109,6 +108,8 @@ class UtilityDistributionLogger(AbstractLogger):
         draw_pareto: bool,
         target_domain_id: Optional[str] = None,
     ):
+        import matplotlib.pyplot as plt
+
         agent_mean_utilities = {}
         opponent_mean_utilities = {}
 
@@ -253,7 +254,7 @@ class UtilityDistributionLogger(AbstractLogger):
     def get_pareto_nash_kalai(domain_no: str) -> (np.ndarray, BidPoint, BidPoint):
         preference_A, preference_B = domain_loader(domain_no)
 
-        bid_space = BidSpace(preference_A, preference_B)
+        bid_space = bid_space_registry.get(preference_A, preference_B)
 
         pareto_points = bid_space.pareto
 
@@ -1,54 +1,350 @@
+import multiprocessing
+import queue
+import signal
+import threading
+from abc import ABC, abstractmethod
 from nenv.utils.KillableThread import KillableThread
-from typing import Callable, Union, Any
+from typing import Callable, Union, Any, Dict, Optional, Tuple, Type
 
+BackendResult = Tuple[Any, bool, Optional[Exception], Union[list, dict, None]]
+"""
+    Result of a timeout backend: return value, whether the process is timed-out, the exception if it occurs, and the
+    arguments after the call.
+"""
 
-class ProcessManager:
+_worker_state = threading.local()
+
+
+def cancellation_requested() -> bool:
     """
-        This class helps us to set time-out for a process.
+        This method tells a process running under the *"thread"* backend whether it is timed-out. Long computations can
+        check it to stop early, since that backend cannot stop a running process.
+
+        :return: Whether the current process is asked to stop
     """
-    return_val: Any             #: Return value of the process
-    timeout: float              #: Timeout in terms of seconds
-    timed_out: bool             #: The process is timed-out or not
-    exception: Exception        #: Exception if it occurs
-    has_exception: bool         #: If any exception is occurred, or not
-    process: Callable           #: Process will be called
-    thread: KillableThread      #: Thread object
+    event = getattr(_worker_state, "cancel_event", None)
 
-    def __init__(self):
+    return event is not None and event.is_set()
+
+
+def _call(process: Callable, args: Union[list, dict, None]) -> Any:
+    """
+        This method calls the process with given arguments.
+
+        :param process: The process will be called
+        :param args: Given arguments as a list, dictionary or none
+        :return: Return value of the process
+    """
+    if not args:
+        return process()
+    elif isinstance(args, list):
+        return process(*args)
+    else:
+        return process(**args)
+
+
+class ProcessTimeout(BaseException):
+    """
+        This exception is raised in the process by the *"signal"* backend when the timeout expires. It is not a
+        subclass of *Exception*, so that the *except Exception* blocks of the agents do not catch it.
+    """
+
+
+class TimeoutBackend(ABC):
+    """
+        TimeoutBackend defines how the *ProcessManager* runs a process with a timeout. Each backend must implement
+        *run*. The backends are:
+
+        - *"trace"*: A new thread per call, killed by a line tracer (*KillableThread*). Each executed line of the
+          process is traced. Exceptions of the process are not caught, only printed by the thread.
+        - *"thread"*: A persistent worker thread. A timed-out process cannot be stopped, it is abandoned and asked to
+          stop through *cancellation_requested*. A new worker thread is started for the next call. **Note**: The
+          abandoned thread keeps running the process, so it may still mutate the arguments (e.g., the agent). A
+          timed-out agent must not be used for anything but ending the session.
+        - *"signal"*: The process runs in the calling thread and *signal.setitimer* interrupts it. It works only in the
+          main thread on POSIX systems.
+        - *"process"*: The process runs in a child process which is killed when the timeout expires. Each call forks
+          (or spawns) a new child, and the arguments (e.g., the whole agent) are pickled and sent back after the call,
+          so they must be picklable. This cost is paid on every call, even for the cheap ones.
+    """
+
+    @abstractmethod
+    def run(self, process: Callable, timeout: float, args: Union[list, dict, None]) -> BackendResult:
         """
-            Constructor
+            This method calls the process with given arguments by setting a timeout.
+
+            :param process: The process will be called
+            :param timeout: Timeout in terms of seconds
+            :param args: Given arguments as a list, dictionary or none
+            :return: Return value, timed-out flag, exception and the arguments after the call
         """
+        pass
 
-        # Default values
-        self.return_val = None
-        self.timeout = 0.
-        self.time_outed = False
-        self.process = lambda args: {}
-        self.exception = None
-        self.has_exception = False
+    def close(self):
+        """
+            This method releases the resources of the backend.
+
+            :return: Nothing
+        """
+        pass
+
+
+class TraceThreadBackend(TimeoutBackend):
+    """
+        A new *KillableThread* per call.
+    """
+    thread: Optional[KillableThread] = None     #: Thread of the last call
 
-    def _run(self, args: Union[list, dict, None], return_dict: dict):
+    @staticmethod
+    def _run(process: Callable, args: Union[list, dict, None], return_dict: dict):
         """
-            This method is a wrapper to run the process with given arguments. It also handles the exception if it
-            occurs.
+            This method is a wrapper to run the process with given arguments.
 
+            :param process: The process will be called
             :param args: Given arguments as a list, dictionary or none
             :param return_dict: Return dictionary
             :return: None
         """
+        return_dict["return_val"] = _call(process, args)
+
+    def run(self, process: Callable, timeout: float, args: Union[list, dict, None]) -> BackendResult:
+        # Return dictionary of the process
+        return_dict = {"return_val": None}
+
+        # Start the process with a timeout
+        self.thread = KillableThread(target=self._run, args=(process, args, return_dict))
+        self.thread.daemon = True
+
+        self.thread.start()
+
+        self.thread.join(timeout=timeout)
+
+        # If timed-out
+        if self.thread.is_alive():
+            self.thread.kill()
+            self.thread.join()
+
+            return return_dict["return_val"], True, None, args
+
+        return return_dict["return_val"], False, None, args
+
+
+class WorkerThreadBackend(TimeoutBackend):
+    """
+        A persistent worker thread with cooperative cancellation.
+
+        **Note**: A timed-out process keeps running in the abandoned thread until it returns or checks
+        *cancellation_requested*, so the agent it was called on may still change.
+    """
+    __tasks: Optional[queue.Queue]              #: Task queue of the current worker
+    __cancel: Optional[threading.Event]         #: Cancellation flag of the current worker
+
+    def __init__(self):
+        self.__tasks = None
+        self.__cancel = None
+
+    @staticmethod
+    def __work(tasks: queue.Queue, cancel: threading.Event):
+        """
+            The loop of a worker thread.
+
+            :param tasks: Task queue of the worker
+            :param cancel: Cancellation flag of the worker
+            :return: Nothing
+        """
+        _worker_state.cancel_event = cancel
+
+        while True:
+            task = tasks.get()
+
+            if task is None:
+                return
+
+            process, args, result, done = task
+
+            try:
+                result["return_val"] = _call(process, args)
+            except Exception as e:
+                result["exception"] = e
+
+            done.set()
+
+    def run(self, process: Callable, timeout: float, args: Union[list, dict, None]) -> BackendResult:
+        if self.__tasks is None:
+            self.__tasks = queue.Queue()
+            self.__cancel = threading.Event()
+
+            threading.Thread(target=self.__work, args=(self.__tasks, self.__cancel), daemon=True).start()
+
+        result = {}
+        done = threading.Event()
+
+        self.__tasks.put((process, args, result, done))
+
+        if done.wait(timeout):
+            return result.get("return_val"), False, result.get("exception"), args
+
+        # Abandon the worker, it stops after the process returns
+        self.__cancel.set()
+        self.close()
+
+        return None, True, None, args
+
+    def close(self):
+        if self.__tasks is not None:
+            self.__tasks.put(None)
+
+        self.__tasks = None
+        self.__cancel = None
+
+
+class SignalBackend(TimeoutBackend):
+    """
+        Interval timer of the main thread.
+    """
+
+    def __init__(self):
+        assert hasattr(signal, "setitimer"), "The signal backend requires signal.setitimer (POSIX)."
+        assert threading.current_thread() is threading.main_thread(), "The signal backend works only in the main thread."
+
+    @staticmethod
+    def __on_alarm(signum, frame):
+        raise ProcessTimeout()
+
+    def run(self, process: Callable, timeout: float, args: Union[list, dict, None]) -> BackendResult:
+        previous_handler = signal.signal(signal.SIGALRM, self.__on_alarm)
+
+        try:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+
+            return_val = _call(process, args)
+
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+            return return_val, False, None, args
+        except ProcessTimeout:
+            return None, True, None, args
+        except Exception as e:
+            return None, False, e, args
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _subprocess_main(process: Callable, args: Union[list, dict, None], connection):
+    """
+        The entry point of the child process of the *"process"* backend.
+
+        :param process: The process will be called
+        :param args: Given arguments as a list, dictionary or none
+        :param connection: Connection to send the return value, the exception and the arguments
+        :return: Nothing
+    """
+    try:
+        message = (_call(process, args), None, args)
+    except Exception as e:
+        message = (None, e, args)
+
+    try:
+        connection.send(message)
+    except Exception as e:
+        connection.send((None, RuntimeError(f"The result of the process cannot be sent: {e}"), None))
+    finally:
+        connection.close()
+
+
+class SubprocessBackend(TimeoutBackend):
+    """
+        A child process per call, killed when the timeout expires.
+
+        **Note**: Every call starts a new child and pickles the whole agent back to the parent, so each operation costs
+        a process start and a round trip of the agent state.
+    """
+    context: Any    #: Multiprocessing context
+
+    def __init__(self, start_method: Optional[str] = None):
+        """
+            Constructor
+
+            :param start_method: Start method of the child processes. *Default "fork"* if it is available, since the
+                arguments are sent to the child without pickling.
+        """
+        if start_method is None and "fork" in multiprocessing.get_all_start_methods():
+            start_method = "fork"
+
+        self.context = multiprocessing.get_context(start_method)
+
+    def run(self, process: Callable, timeout: float, args: Union[list, dict, None]) -> BackendResult:
+        receiver, sender = self.context.Pipe(duplex=False)
+
+        child = self.context.Process(target=_subprocess_main, args=(process, args, sender), daemon=True)
+        child.start()
+
+        sender.close()
+
+        try:
+            if not receiver.poll(timeout):
+                child.kill()
+
+                return None, True, None, args
 
-        # Handle different kind of arguments.
-        if not args:
-                return_dict["return_val"] = self.process()
-        elif isinstance(args, list):
-                return_dict["return_val"] = self.process(*args)
-        else:
-                return_dict["return_val"] = self.process(**args)
+            return_val, exception, new_args = receiver.recv()
+
+            return return_val, False, exception, args if new_args is None else new_args
+        except EOFError:
+            return None, False, RuntimeError("The process exited without a result."), args
+        finally:
+            child.join()
+            receiver.close()
+
+
+TIMEOUT_BACKENDS: Dict[str, Type[TimeoutBackend]] = {
+    "trace": TraceThreadBackend,
+    "thread": WorkerThreadBackend,
+    "signal": SignalBackend,
+    "process": SubprocessBackend
+}
+"""
+    Names of the timeout backends.
+"""
+
+
+class ProcessManager:
+    """
+        This class helps us to set time-out for a process. How the timeout is enforced depends on the backend, see
+        *TimeoutBackend*.
+    """
+    return_val: Any                     #: Return value of the process
+    timeout: float                      #: Timeout in terms of seconds
+    timed_out: bool                     #: The process is timed-out or not
+    exception: Exception                #: Exception if it occurs
+    has_exception: bool                 #: If any exception is occurred, or not
+    process: Callable                   #: Process will be called
+    args: Union[list, dict, None]       #: Arguments of the process after the call
+    backend: TimeoutBackend             #: Timeout backend
+
+    def __init__(self, backend: Union[str, TimeoutBackend] = "trace"):
         """
-        except Exception as e:  # Keep the exception
-            return_dict["exception"] = e
-            return_dict["has_exception"] = True
+            Constructor
+
+            :param backend: Timeout backend or its name (*"trace"*, *"thread"*, *"signal"* or *"process"*).
+            *Default "trace"*
         """
+        if isinstance(backend, str):
+            assert backend in TIMEOUT_BACKENDS, f"Unknown timeout backend: {backend}"
+
+            backend = TIMEOUT_BACKENDS[backend]()
+
+        self.backend = backend
+
+        # Default values
+        self.return_val = None
+        self.timeout = 0.
+        self.time_outed = False
+        self.process = lambda args: {}
+        self.args = None
+        self.exception = None
+        self.has_exception = False
 
     def run(self, process: Callable, timeout: float, args: Union[list, dict, None] = None) -> object:
         """
@@ -63,35 +359,19 @@ class ProcessManager:
             :return: Return value of the process
         """
         # Initial values
-        self.return_val = None
         self.timeout = timeout
         self.process = process
-        self.time_outed = False
-        self.has_exception = False
 
-        # Return dictionary of the process
-        return_dict = {}
-        return_dict["return_val"] = None
-        return_dict["exception"] = None
-        return_dict["has_exception"] = False
+        self.return_val, self.time_outed, self.exception, self.args = self.backend.run(process, timeout, args)
 
-        # Start the process with a timeout
-        self.thread = KillableThread(target=self._run, args=(args, return_dict))
-        self.thread.daemon = True
-
-        self.thread.start()
+        self.has_exception = self.exception is not None
 
-        self.thread.join(timeout=self.timeout)
-
-        # If timed-out
-        if self.thread.is_alive():
-            self.thread.kill()
-            self.thread.join()
-            self.time_outed = True
+        return self.return_val  # Return value of the given process
 
-        # Get variables from the return dictionary
-        self.return_val = return_dict["return_val"]
-        self.exception = return_dict["exception"]
-        self.has_exception = return_dict["has_exception"]
+    def close(self):
+        """
+            This method releases the resources of the backend (e.g., the worker thread).
 
-        return self.return_val  # Return value of the given process
+            :return: Nothing
+        """
+        self.backend.close()
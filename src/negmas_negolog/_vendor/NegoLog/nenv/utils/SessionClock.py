@@ -0,0 +1,116 @@
+import time
+from typing import Dict, Optional, Type, Union
+
+
+class SessionClock:
+    """
+        SessionClock provides the elapsed negotiation time of a session in terms of seconds. The session starts the
+        clock when the negotiation begins and reports the CPU cost of each agent operation to it.
+
+        This clock is the wall clock, so the elapsed time depends on the load of the machine.
+    """
+    _start_time: float          #: Wall time when the clock is started
+
+    def __init__(self):
+        self._start_time = 0.
+
+    def start(self):
+        """
+            This method (re)starts the clock at zero.
+
+            :return: Nothing
+        """
+        self._start_time = time.time()
+
+    def elapsed(self) -> float:
+        """
+            This method provides the elapsed time since the clock is started.
+
+            :return: Elapsed time in terms of seconds
+        """
+        return time.time() - self._start_time
+
+    def advance(self, process_name: str, cpu_time: float):
+        """
+            This method is called after each agent operation. The wall clock ignores it.
+
+            :param process_name: Name of the agent operation (e.g., *"Act"*), see *AGENT_OPERATIONS*
+            :param cpu_time: CPU time of the operation in terms of seconds
+            :return: Nothing
+        """
+        pass
+
+    @property
+    def measures_cpu_time(self) -> bool:
+        """
+            :return: Whether the clock needs the measured CPU time of the operations
+        """
+        return False
+
+
+class VirtualClock(SessionClock):
+    """
+        VirtualClock advances only when the agents operate, so that the time-based deadlines do not depend on the
+        load of the machine and the session runs at full CPU speed. Each operation advances the clock by either:
+
+        - its measured CPU time (*Default*), which excludes the time waiting for the CPU, or
+        - a fixed cost per operation, which makes the sessions reproducible across machines.
+
+        **Note**: The CPU time is measured by *time.thread_time* in the thread (or the child process of the *"process"*
+        timeout backend) which runs the agent method, so the other threads and the session itself are not counted.
+
+        :Example:
+            Example of a fixed cost model, each *act* call takes 10ms and the other operations take 1ms
+
+            >>> clock = VirtualClock(operation_costs={"Act": 0.01}, default_cost=0.001)
+    """
+    operation_costs: Optional[Dict[str, float]]     #: Fixed cost of each operation, or None to use the CPU time
+    default_cost: float                             #: Fixed cost of the operations not in operation_costs
+    __elapsed: float                                #: Elapsed virtual time
+
+    def __init__(self, operation_costs: Union[Dict[str, float], float, None] = None, default_cost: float = 0.):
+        """
+            Constructor
+
+            :param operation_costs: Fixed cost of each operation in terms of seconds, or a single cost for all
+                operations. *Default None* to advance by the measured CPU time.
+            :param default_cost: Fixed cost of the operations which are not in *operation_costs*. *Default 0*
+        """
+        super().__init__()
+
+        if isinstance(operation_costs, (int, float)):
+            default_cost = float(operation_costs)
+            operation_costs = {}
+
+        assert operation_costs is None or all(cost >= 0 for cost in operation_costs.values()), \
+            "Operation costs must be non-negative."
+        assert default_cost >= 0, "Operation costs must be non-negative."
+
+        self.operation_costs = operation_costs
+        self.default_cost = default_cost
+        self.__elapsed = 0.
+
+    def start(self):
+        self.__elapsed = 0.
+
+    def elapsed(self) -> float:
+        return self.__elapsed
+
+    def advance(self, process_name: str, cpu_time: float):
+        if self.operation_costs is None:
+            self.__elapsed += cpu_time
+        else:
+            self.__elapsed += self.operation_costs.get(process_name, self.default_cost)
+
+    @property
+    def measures_cpu_time(self) -> bool:
+        return self.operation_costs is None
+
+
+SESSION_CLOCKS: Dict[str, Type[SessionClock]] = {
+    "wall": SessionClock,
+    "virtual": VirtualClock
+}
+"""
+    Names of the session clocks.
+"""
@@ -1,3 +1,5 @@
+import time
+from typing import List, Optional
 from nenv.Agent import AbstractAgent
 
 
@@ -13,13 +15,25 @@ AGENT_OPERATIONS = {
 """
 
 
-def session_operation(agent: AbstractAgent, process_name: str, **kwargs) -> dict:
+def session_operation(agent: AbstractAgent, process_name: str, cpu_time: Optional[List[float]] = None, **kwargs):
     """
         This method helps to wrap the agent method to use them with process manager.
 
+        The CPU time is measured by *time.thread_time* in the thread which runs the agent method, so it excludes the
+        other threads of the process and the time waiting for the CPU.
+
         :param agent: Agent
         :param process_name: Name of the agent's process
+        :param cpu_time: List to append the CPU time of the agent method in terms of seconds, if given
         :param kwargs: Additional arguments
-        :return: A dictionary which contains the returned value and the agent object.
+        :return: Return value of the agent method
     """
-    return AGENT_OPERATIONS[process_name](agent, **kwargs)
+    if cpu_time is None:
+        return AGENT_OPERATIONS[process_name](agent, **kwargs)
+
+    start_time = time.thread_time()
+
+    try:
+        return AGENT_OPERATIONS[process_name](agent, **kwargs)
+    finally:
+        cpu_time.append(time.thread_time() - start_time)
@@ -0,0 +1,119 @@
+import json
+import os
+from typing import Any, Dict, List, Tuple
+from nenv.Bid import Bid
+from nenv.utils.ExcelLog import LogRow
+
+SessionKey = Tuple[str, str, str, int]
+"""
+    Key of a negotiation session in a tournament: class name of agentA, class name of agentB, domain name and the
+    repetition number of this combination.
+"""
+
+
+def _to_json(value: Any) -> Any:
+    """
+        This method converts the values which are not JSON serializable. NumPy scalars are converted into Python
+        scalars, Bid objects are converted into their offer content by issue names (see *_from_json*), and the other
+        objects are converted into strings as in the Excel logs.
+
+        :param value: Value in a log row
+        :return: JSON serializable value
+    """
+    if hasattr(value, "item"):
+        return value.item()
+
+    if isinstance(value, Bid):
+        return {"__bid__": {str(issue): issue_value for issue, issue_value in value}, "utility": value.utility}
+
+    return str(value)
+
+
+def _from_json(obj: Dict[str, Any]) -> Any:
+    """
+        This method rebuilds the Bid objects converted by *_to_json*. The offer content of a rebuilt bid is keyed by
+        issue names, which are equal to the Issue objects of the domain.
+
+        :param obj: Decoded JSON object
+        :return: Bid object, or the given object if it is not a converted bid
+    """
+    if "__bid__" in obj:
+        return Bid(obj["__bid__"], obj["utility"])
+
+    return obj
+
+
+class TournamentJournal:
+    """
+        TournamentJournal is an append-only file of the completed negotiation sessions of a tournament. Each line is
+        a JSON object which holds the key of the session, its tournament log row, the agent and estimator names and
+        the session real time. A line is written and flushed to the disk as soon as the session ends, so a killed or
+        crashed tournament can be resumed from the journal.
+
+        **Note**: A partially written last line (e.g., due to a crash) is removed while loading.
+    """
+    path: str       #: Path of the journal file
+
+    def __init__(self, path: str):
+        """
+            Constructor
+
+            :param path: Path of the journal file
+        """
+        self.path = path
+
+    def load(self) -> Dict[SessionKey, Dict[str, Any]]:
+        """
+            This method reads the completed sessions.
+
+            :return: Entries of the completed sessions by their keys
+        """
+        entries = {}
+
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, "rb+") as f:
+            content = f.read()
+
+            # Remove a partially written last line, so that the next entry starts on a new line
+            if not content.endswith(b"\n"):
+                content = content[:content.rfind(b"\n") + 1]
+
+                f.truncate(len(content))
+
+        for line in content.decode("utf-8").splitlines():
+            try:
+                entry = json.loads(line, object_hook=_from_json)
+            except json.JSONDecodeError:
+                continue
+
+            entries[tuple(entry["key"])] = entry
+
+        return entries
+
+    def append(self, key: SessionKey, session_log: LogRow, agent_names: List[str], estimator_names: List[str], session_elapsed_time: float):
+        """
+            This method records a completed session.
+
+            :param key: Key of the session
+            :param session_log: Tournament log row of the session
+            :param agent_names: Names of agentA and agentB
+            :param estimator_names: Names of the estimators
+            :param session_elapsed_time: Session real time in terms of seconds
+            :return: Nothing
+        """
+        entry = {
+            "key": list(key),
+            "log": session_log,
+            "agent_names": agent_names,
+            "estimator_names": estimator_names,
+            "session_real_time": session_elapsed_time
+        }
+
+        line = json.dumps(entry, default=_to_json)
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
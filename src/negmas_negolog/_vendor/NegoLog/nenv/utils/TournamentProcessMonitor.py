@@ -18,6 +18,8 @@ class TournamentProcessMonitor:
     completed_number_of_sessions: int           #: The number of completed negotiation sessions
     is_completed: bool                          #: Whether all negotiation sessions is completed, or not
     is_active: bool                             #: Whether the tournament process is active, or not
+    number_of_workers: int                      #: The number of worker processes running the sessions
+    total_session_time: float                   #: The sum of the real time of the completed sessions in terms of seconds
 
     def __init__(self):
         self.current_session = ""
@@ -29,12 +31,15 @@ class TournamentProcessMonitor:
         self.last_update_datetime = None
         self.is_completed = False
         self.is_active = False
+        self.number_of_workers = 1
+        self.total_session_time = 0.
 
-    def initiate(self, number_of_sessions: int):
+    def initiate(self, number_of_sessions: int, number_of_workers: int = 1):
         """
             This method is called when the tournament starts.
 
         :param number_of_sessions: The total number of negotiation sessions
+        :param number_of_workers: The number of worker processes running the sessions. *Default 1*
         :return: Nothing
         """
         self.start_time = time.time()
@@ -46,6 +51,8 @@ class TournamentProcessMonitor:
         self.completed_number_of_sessions = 0
         self.is_completed = False
         self.is_active = True
+        self.number_of_workers = number_of_workers
+        self.total_session_time = 0.
 
         self.current_session = "Started"
 
@@ -59,12 +66,15 @@ class TournamentProcessMonitor:
         """
         self.current_session = session
         self.completed_number_of_sessions += 1
+        self.total_session_time += session_elapsed_time
         self.last_update_time = time.time()
         self.last_update_datetime = datetime.datetime.now()
 
         session_elapsed_time = datetime.timedelta(seconds=math.ceil(session_elapsed_time))
 
-        return f"{session} - Session Real Time: {str(session_elapsed_time)} - Process: {'%.2f' % (self.completed_percentage * 100.)} % - Estimated Remaining Time: {str(self.estimated_remaining_time)} - Elapsed Time: {str(self.elapsed_time)} - Last Update: {str(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}"
+        workers = f" - Workers: {self.number_of_workers} (Speedup: {'%.2f' % self.speedup})" if self.number_of_workers > 1 else ""
+
+        return f"{session} - Session Real Time: {str(session_elapsed_time)}{workers} - Process: {'%.2f' % (self.completed_percentage * 100.)} % - Estimated Remaining Time: {str(self.estimated_remaining_time)} - Elapsed Time: {str(self.elapsed_time)} - Last Update: {str(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}"
 
     def end(self) -> datetime.timedelta:
         """
@@ -126,6 +136,21 @@ class TournamentProcessMonitor:
 
         return datetime.timedelta(seconds=remaining_time)
 
+    @property
+    def speedup(self) -> float:
+        """
+            This method provides the ratio of the total real time of the completed sessions to the elapsed time, i.e.,
+            how many sessions run at the same time on average.
+
+        :return: Average number of concurrent sessions
+        """
+        elapsed_time = self.last_update_time - self.start_time
+
+        if elapsed_time <= 0.:
+            return 1.
+
+        return self.total_session_time / elapsed_time
+
     @property
     def elapsed_time(self) -> datetime.timedelta:
         """
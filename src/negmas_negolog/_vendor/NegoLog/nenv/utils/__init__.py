@@ -2,11 +2,13 @@
     This module contains some helpful methods and classes.
 """
 
-from nenv.utils.ProcessManager import ProcessManager
+from nenv.utils.ProcessManager import ProcessManager, TimeoutBackend, TIMEOUT_BACKENDS, cancellation_requested
 from nenv.utils.SessionOps import AGENT_OPERATIONS, session_operation
+from nenv.utils.SessionClock import SessionClock, VirtualClock, SESSION_CLOCKS
 from nenv.utils.KillableThread import KillableThread
 from nenv.utils.ExcelLog import ExcelLog, LogRow
 from nenv.utils.Move import get_move, get_move_distribution, calculate_move_correlation, calculate_awareness, calculate_behavior_sensitivity
 from nenv.utils.tournament_graphs import DRAWING_FORMAT, set_drawing_format, draw_line, draw_heatmap
 from nenv.utils.TournamentProcessMonitor import TournamentProcessMonitor
+from nenv.utils.TournamentJournal import TournamentJournal
 from nenv.utils.OSUtils import open_folder
@@ -1,17 +1,13 @@
 """
     Helpful draw functions for loggers.
+
+    The plotting libraries are imported by the draw functions, so that importing *nenv* does not import them.
 """
 import os
 from typing import Union, List, Dict
 
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.figure_factory as ff
-import plotly
-import seaborn as sb
 import numpy as np
 import pandas as pd
-import matplotlib
 
 DRAWING_FORMAT: str = None
 
@@ -53,6 +49,9 @@ def draw_heatmap_matplotlib(
     file_format: str = "png",
     **kwargs,
 ):
+    import matplotlib.pyplot as plt
+    import seaborn as sb
+
     fig = plt.figure(
         figsize=(len(labels_x) + 2, len(labels_y)), facecolor="white", dpi=1200
     )
@@ -135,6 +134,9 @@ def draw_heatmap_plotly(
     fmt: str = ".2f",
     **kwargs,
 ):
+    import plotly
+    import plotly.figure_factory as ff
+
     data = np.array(data, dtype=np.float32)
 
     # Color Scale
@@ -327,6 +329,8 @@ def draw_line_matplotlib(
     title: str,
     file_format: str = "png",
 ):
+    import matplotlib.pyplot as plt
+
     # Plot them separately
     for key in data.keys():
         plt.plot(np.array(list(range(len(data[key])))), np.array(data[key]), label=key)
@@ -351,6 +355,9 @@ def draw_line_matplotlib(
 def draw_line_plotly(
     data: dict, save_path: str, x_axis_name: str, y_axis_name: str, title: str
 ):
+    import plotly
+    import plotly.express as px
+
     df = pd.DataFrame(data)
 
     fig = px.line(df, x=x_axis_name, y=y_axis_name, title=title)
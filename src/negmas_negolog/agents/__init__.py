@@ -3,33 +3,72 @@ Agent wrapper classes for bridging NegoLog agents to NegMAS.
 
 This package provides individual wrapper classes for each NegoLog agent,
 all inheriting from NegologNegotiatorWrapper.
+
+Wrapper modules are imported on first access (PEP 562 module ``__getattr__``),
+so using one agent does not pay for the dependencies of all the others
+(scikit-learn, numba, ...).
 """
 
-from negmas_negolog.agents.boulware import BoulwareAgent
-from negmas_negolog.agents.conceder import ConcederAgent
-from negmas_negolog.agents.linear import LinearAgent
-from negmas_negolog.agents.micro import MICROAgent
-from negmas_negolog.agents.atlas3 import Atlas3Agent
-from negmas_negolog.agents.nice_tit_for_tat import NiceTitForTat
-from negmas_negolog.agents.yx import YXAgent
-from negmas_negolog.agents.parscat import ParsCatAgent
-from negmas_negolog.agents.ponpoko import PonPokoAgent
-from negmas_negolog.agents.agent_gg import AgentGG
-from negmas_negolog.agents.saga import SAGAAgent
-from negmas_negolog.agents.cuhk import CUHKAgent
-from negmas_negolog.agents.agent_kn import AgentKN
-from negmas_negolog.agents.rubick import Rubick
-from negmas_negolog.agents.ahbune import AhBuNeAgent
-from negmas_negolog.agents.pars import ParsAgent
-from negmas_negolog.agents.random_dance import RandomDance
-from negmas_negolog.agents.agent_buyog import AgentBuyog
-from negmas_negolog.agents.kawaii import Kawaii
-from negmas_negolog.agents.caduceus2015 import Caduceus2015
-from negmas_negolog.agents.caduceus import Caduceus
-from negmas_negolog.agents.hardheaded import HardHeaded
-from negmas_negolog.agents.iamhaggler import IAMhaggler
-from negmas_negolog.agents.lucky2022 import LuckyAgent2022
-from negmas_negolog.agents.hybrid import HybridAgent
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from negmas_negolog.agents.boulware import BoulwareAgent
+    from negmas_negolog.agents.conceder import ConcederAgent
+    from negmas_negolog.agents.linear import LinearAgent
+    from negmas_negolog.agents.micro import MICROAgent
+    from negmas_negolog.agents.atlas3 import Atlas3Agent
+    from negmas_negolog.agents.nice_tit_for_tat import NiceTitForTat
+    from negmas_negolog.agents.yx import YXAgent
+    from negmas_negolog.agents.parscat import ParsCatAgent
+    from negmas_negolog.agents.ponpoko import PonPokoAgent
+    from negmas_negolog.agents.agent_gg import AgentGG
+    from negmas_negolog.agents.saga import SAGAAgent
+    from negmas_negolog.agents.cuhk import CUHKAgent
+    from negmas_negolog.agents.agent_kn import AgentKN
+    from negmas_negolog.agents.rubick import Rubick
+    from negmas_negolog.agents.ahbune import AhBuNeAgent
+    from negmas_negolog.agents.pars import ParsAgent
+    from negmas_negolog.agents.random_dance import RandomDance
+    from negmas_negolog.agents.agent_buyog import AgentBuyog
+    from negmas_negolog.agents.kawaii import Kawaii
+    from negmas_negolog.agents.caduceus2015 import Caduceus2015
+    from negmas_negolog.agents.caduceus import Caduceus
+    from negmas_negolog.agents.hardheaded import HardHeaded
+    from negmas_negolog.agents.iamhaggler import IAMhaggler
+    from negmas_negolog.agents.lucky2022 import LuckyAgent2022
+    from negmas_negolog.agents.hybrid import HybridAgent
+
+# Wrapper class name -> module (in this package) that defines it
+_AGENT_MODULES = {
+    "BoulwareAgent": "boulware",
+    "ConcederAgent": "conceder",
+    "LinearAgent": "linear",
+    "MICROAgent": "micro",
+    "Atlas3Agent": "atlas3",
+    "NiceTitForTat": "nice_tit_for_tat",
+    "YXAgent": "yx",
+    "ParsCatAgent": "parscat",
+    "PonPokoAgent": "ponpoko",
+    "AgentGG": "agent_gg",
+    "SAGAAgent": "saga",
+    "CUHKAgent": "cuhk",
+    "AgentKN": "agent_kn",
+    "Rubick": "rubick",
+    "AhBuNeAgent": "ahbune",
+    "ParsAgent": "pars",
+    "RandomDance": "random_dance",
+    "AgentBuyog": "agent_buyog",
+    "Kawaii": "kawaii",
+    "Caduceus2015": "caduceus2015",
+    "Caduceus": "caduceus",
+    "HardHeaded": "hardheaded",
+    "IAMhaggler": "iamhaggler",
+    "LuckyAgent2022": "lucky2022",
+    "HybridAgent": "hybrid",
+}
 
 __all__ = [
     # Time-based agents
@@ -60,3 +99,17 @@ __all__ = [
     "LuckyAgent2022",
     "HybridAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the wrapper module defining ``name`` on first access."""
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
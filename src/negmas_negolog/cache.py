@@ -0,0 +1,350 @@
+"""
+Caches used by NegologPreferenceAdapter.
+
+- ``BidSpaceCache``: process-wide cache of sorted bid spaces
+- ``UtilityCache``: per-adapter memoization of ufun evaluations
+- ``AgentStateCache``: process-wide snapshots of initiated NegoLog agents
+
+Tournaments replay the same scenarios against many opponents. Every wrapped
+negotiator builds its own NegologPreferenceAdapter, and sorting the bid space is
+the dominant part of its startup cost. This module keeps the sorted value-index
+matrix and utility array of recently used bid spaces, keyed by a fingerprint of
+the outcome space and the utility function, so repeated negotiations on the same
+ufun skip enumeration and sorting entirely.
+
+Only NumPy arrays are cached (marked read-only). Bid objects are never shared
+between negotiations because agents are free to mutate them.
+
+Non-additive ufuns are evaluated bid by bid during the negotiation as well. An
+adapter created with ``utility_cache_size > 0`` memoizes those evaluations in a
+``UtilityCache`` keyed by the bid's value indices.
+
+Several agents (CUHKAgent, AgentGG, Atlas3, Kawaii, AgentKN, ...) do heavy
+per-domain precomputation in ``initiate()``. Wrappers created with
+``reuse_agent_state=True`` store a snapshot of the freshly initiated agent in
+``agent_state_cache`` and start later negotiations on the same ufun from a copy.
+
+Example:
+    >>> from negmas_negolog import bid_space_cache
+    >>> bid_space_cache.configure(max_bytes=64 * 1024 * 1024)
+    >>> # ... run negotiations ...
+    >>> bid_space_cache.stats["hit_rate"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+__all__ = [
+    "AgentStateCache",
+    "BidSpaceCache",
+    "UtilityCache",
+    "agent_state_cache",
+    "bid_space_cache",
+    "fingerprint",
+]
+
+# Default memory cap for the process-wide cache (256 MiB)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Default number of agent snapshots kept by the process-wide agent-state cache
+DEFAULT_MAX_AGENTS = 64
+
+
+def fingerprint(*parts: Iterable[Any] | np.ndarray | Any) -> str:
+    """
+    Compute a stable hex digest over the given parts.
+
+    NumPy arrays are hashed by dtype, shape and raw bytes; everything else by its
+    ``repr``, so the digest is stable across processes.
+
+    Args:
+        *parts: Values describing the object to fingerprint
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(str((part.dtype.str, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class _LRUCache:
+    """
+    Bounded, thread-safe LRU mapping with hit, miss and eviction statistics.
+
+    Entries are evicted least-recently-used first once the total size of the
+    entries exceeds the limit. Subclasses define the size of an entry and the
+    name of the limit in ``stats``; by default each entry counts as one.
+    """
+
+    #: Key of the limit in ``stats``
+    _limit_name = "max_entries"
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: Maximum total size of the entries. 0 disables caching.
+        """
+        if limit < 0:
+            raise ValueError(f"{self._limit_name} must be non-negative")
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._limit = limit
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self._limit > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _size_of(self, value: Any) -> int:
+        """Size of an entry, counted against the limit."""
+        return 1
+
+    def _configure(self, limit: Optional[int]) -> None:
+        """Change the limit (if given), evicting entries if needed."""
+        with self._lock:
+            if limit is not None:
+                if limit < 0:
+                    raise ValueError(f"{self._limit_name} must be non-negative")
+                self._limit = limit
+            self._evict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        """Store an entry unless it is larger than the whole cache."""
+        size = self._size_of(value)
+        if size > self._limit:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= self._size_of(previous)
+            self._entries[key] = value
+            self._size += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries and the
+            limit
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            self._limit_name: self._limit,
+        }
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the limit is respected."""
+        while self._entries and self._size > self._limit:
+            _, value = self._entries.popitem(last=False)
+            self._size -= self._size_of(value)
+            self.evictions += 1
+
+
+class BidSpaceCache(_LRUCache):
+    """
+    Bounded, thread-safe LRU cache of sorted bid spaces.
+
+    Each entry is a ``(indices, utilities)`` pair: the value-index matrix of all
+    bids (one row per bid) and their utilities, both sorted by descending utility.
+    Entries are evicted least-recently-used first once the total size of the
+    cached arrays exceeds ``max_bytes``.
+    """
+
+    _limit_name = "max_bytes"
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes: Memory cap for the cached arrays in bytes. 0 disables caching.
+        """
+        super().__init__(max_bytes)
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory cap for the cached arrays in bytes."""
+        return self._limit
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached arrays in bytes."""
+        return self._size
+
+    def _size_of(self, value: Tuple[np.ndarray, np.ndarray]) -> int:
+        return value[0].nbytes + value[1].nbytes
+
+    def configure(self, max_bytes: Optional[int] = None) -> None:
+        """
+        Change the cache limits, evicting entries if needed.
+
+        Args:
+            max_bytes: New memory cap in bytes. 0 disables caching.
+        """
+        self._configure(max_bytes)
+
+    def put(self, key: Hashable, indices: np.ndarray, utilities: np.ndarray) -> None:
+        """
+        Store a sorted bid space. The arrays are marked read-only.
+
+        Entries larger than the whole cache are not stored.
+
+        Args:
+            key: Bid-space fingerprint
+            indices: Sorted value-index matrix
+            utilities: Sorted utilities
+        """
+        indices.setflags(write=False)
+        utilities.setflags(write=False)
+        self._put(key, (indices, utilities))
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries,
+            size_bytes and max_bytes
+        """
+        return {**super().stats, "size_bytes": self._size}
+
+
+class UtilityCache(_LRUCache):
+    """
+    Bounded LRU memoization of utility values, keyed by value-index tuples.
+
+    Agents such as Atlas3, Kawaii and AgentKN evaluate the same bids many times
+    inside their search loops. When the wrapped ufun is expensive (hyper-rectangle,
+    nonlinear, ...) every evaluation is a call into NegMAS, so the adapter can
+    keep the most recently used utilities here. Only use it with stationary ufuns.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries: Maximum number of cached utilities. 0 disables caching.
+        """
+        super().__init__(max_entries)
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached utilities."""
+        return self._limit
+
+    def put(self, key: Tuple[int, ...], utility: float) -> None:
+        """
+        Store a utility, evicting the least-recently-used one if full.
+
+        Args:
+            key: Value index of each issue
+            utility: Utility of the outcome
+        """
+        self._put(key, utility)
+
+
+# Process-wide instance shared by all NegologPreferenceAdapter objects
+bid_space_cache = BidSpaceCache()
+
+
+class AgentStateCache(_LRUCache):
+    """
+    Bounded, thread-safe LRU cache of initiated NegoLog agents.
+
+    Each entry is a snapshot of an agent taken right after ``initiate()``, keyed
+    by the agent class, the session time and the bid-space fingerprint of its
+    ufun. Snapshots are never handed out directly: callers copy them (see
+    ``NegologNegotiatorWrapper``) so every negotiation gets its own agent.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_AGENTS):
+        """
+        Args:
+            max_entries: Maximum number of snapshots. 0 disables caching.
+        """
+        super().__init__(max_entries)
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of snapshots."""
+        return self._limit
+
+    def configure(self, max_entries: Optional[int] = None) -> None:
+        """
+        Change the cache limits, evicting entries if needed.
+
+        Args:
+            max_entries: New maximum number of snapshots. 0 disables caching.
+        """
+        self._configure(max_entries)
+
+    def put(self, key: Hashable, snapshot: Any) -> None:
+        """
+        Store an agent snapshot. The snapshot must not be used afterwards.
+
+        Args:
+            key: Agent-state key
+            snapshot: Agent copied right after ``initiate()``
+        """
+        self._put(key, snapshot)
+
+
+# Process-wide instance shared by all wrappers created with reuse_agent_state=True
+agent_state_cache = AgentStateCache()
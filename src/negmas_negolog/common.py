@@ -2,16 +2,35 @@
 Common classes and utilities for bridging NegoLog agents to NegMAS.
 
 This module provides:
+- OutcomeBidCodec: Index-based conversion between NegMAS outcomes and NegoLog bids
 - NegologPreferenceAdapter: Adapts NegMAS utility functions to NegoLog Preference interface
 - NegologNegotiatorWrapper: Base class for all NegoLog agent wrappers
 """
 
 from __future__ import annotations
 
+import copy
+import random
 import sys
 from abc import ABC
+from concurrent.futures import Future, wait
+from contextlib import nullcontext
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
 
 # Add vendored NegoLog to the path BEFORE any imports that depend on it.
 # The NegoLog framework (top-level ``nenv`` and ``agents`` packages) is bundled
@@ -23,9 +42,20 @@ if str(NEGOLOG_PATH) not in sys.path:
 
 # Import NegoLog types (must be after path is added)
 from nenv import Bid, Issue, Preference, Accept  # noqa: E402
+from nenv.Action import Action  # noqa: E402
+from nenv.Bid import BidDomain  # noqa: E402
+from nenv.BidList import BidList, cartesian_indices  # noqa: E402
 from nenv.Agent import AbstractAgent  # noqa: E402
 from nenv.OpponentModel.EstimatedPreference import EstimatedPreference  # noqa: E402
 
+from negmas_negolog.cache import (  # noqa: E402
+    UtilityCache,
+    agent_state_cache,
+    bid_space_cache,
+    fingerprint,
+)
+from negmas_negolog.instrumentation import LatencyRecorder  # noqa: E402
+
 # Monkey-patch EstimatedPreference to handle preferences without JSON files
 _original_estimated_preference_init = EstimatedPreference.__init__
 
@@ -45,7 +75,7 @@ def _patched_estimated_preference_init(self, reference: Preference):
         Preference.__init__(self, profile_json_path=None, generate_bids=False)
 
         # Copy issues from reference
-        self._issues = reference.issues.copy() if hasattr(reference, "_issues") else []
+        self._issues = list(reference.issues) if hasattr(reference, "_issues") else []
 
         # Copy and invert weights from reference
         ref_issue_weights = reference.issue_weights
@@ -74,24 +104,170 @@ EstimatedPreference.__init__ = _patched_estimated_preference_init
 
 from negmas.outcomes import Outcome  # noqa: E402
 from negmas.preferences import BaseUtilityFunction  # noqa: E402
-from negmas.sao.common import ResponseType, SAOState  # noqa: E402
+from negmas.sao.common import ResponseType, SAOResponse, SAOState  # noqa: E402
 from negmas.sao.negotiators.base import SAONegotiator  # noqa: E402
 
 if TYPE_CHECKING:
     from negmas.situated import Agent
     from negmas.negotiators import Controller
 
+    from negmas_negolog.remote import AgentHostPool
+
+# Shared no-op context used when latency instrumentation is disabled
+_NOT_TIMED = nullcontext()
+
 __all__ = [
+    "OutcomeBidCodec",
     "NegologPreferenceAdapter",
     "NegologNegotiatorWrapper",
 ]
 
 
+class OutcomeBidCodec:
+    """
+    Precomputed, index-based conversion between NegMAS outcomes and NegoLog bids.
+
+    Every issue gets a value-index table in both directions (NegMAS value -> index
+    and NegoLog value -> index), so each conversion costs one dictionary lookup
+    per issue instead of scanning issue names. Outcomes produced by the codec
+    always carry the original NegMAS values, even when the NegoLog issue holds
+    their string representation.
+    """
+
+    def __init__(
+        self,
+        issues: List[Issue],
+        values: Optional[Sequence[Sequence[Any]]] = None,
+    ):
+        """
+        Build the value-index tables.
+
+        Args:
+            issues: NegoLog Issue objects, in outcome-space order
+            values: Original NegMAS values of each issue, aligned with
+                ``issue.values``. Defaults to the NegoLog values themselves.
+        """
+        self._issues: Tuple[Issue, ...] = tuple(issues)
+        self._bid_values: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(issue.values) for issue in self._issues
+        )
+        if values is None:
+            self._outcome_values = self._bid_values
+        else:
+            self._outcome_values = tuple(tuple(v) for v in values)
+
+        if len(self._outcome_values) != len(self._issues):
+            raise ValueError("Expected one list of values per issue")
+        for issue, bid_values, outcome_values in zip(
+            self._issues, self._bid_values, self._outcome_values
+        ):
+            if len(bid_values) != len(outcome_values):
+                raise ValueError(
+                    f"Issue {issue.name} has {len(bid_values)} values but "
+                    f"{len(outcome_values)} NegMAS values were given"
+                )
+
+        self._bid_tables = tuple(
+            {value: i for i, value in enumerate(vals)} for vals in self._bid_values
+        )
+        self._cardinalities = tuple(len(vals) for vals in self._bid_values)
+        # Bids created by the codec share one descriptor, whose value indices
+        # are the codec's (``BidDomain`` only ever appends unknown values)
+        self._domain = BidDomain.of(self._issues)
+        self._outcome_tables = tuple(
+            {value: i for i, value in enumerate(vals)} for vals in self._outcome_values
+        )
+
+    @classmethod
+    def from_outcome_values(
+        cls, issue_names: Sequence[str], values: Sequence[Sequence[Any]]
+    ) -> "OutcomeBidCodec":
+        """
+        Build the NegoLog issues and the codec from NegMAS issue values.
+
+        NegoLog issues hold the string representation of non-string values.
+
+        Args:
+            issue_names: Name of each issue, in outcome-space order
+            values: NegMAS values of each issue
+        """
+        issues = [
+            Issue(name, [v if isinstance(v, str) else str(v) for v in vals])
+            for name, vals in zip(issue_names, values)
+        ]
+        return cls(issues, values)
+
+    @property
+    def issues(self) -> Tuple[Issue, ...]:
+        """NegoLog issues in outcome-space order."""
+        return self._issues
+
+    @property
+    def domain(self) -> BidDomain:
+        """Shared NegoLog descriptor of the bids created by the codec."""
+        return self._domain
+
+    @property
+    def outcome_values(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Original NegMAS values of each issue, indexed like the bid values."""
+        return self._outcome_values
+
+    @property
+    def cardinalities(self) -> Tuple[int, ...]:
+        """Number of values of each issue."""
+        return self._cardinalities
+
+    def outcome_to_indices(self, outcome: Outcome) -> Tuple[int, ...]:
+        """Convert a NegMAS Outcome to a tuple of per-issue value indices."""
+        try:
+            return tuple(
+                table[value] for table, value in zip(self._outcome_tables, outcome)
+            )
+        except KeyError as e:
+            raise ValueError(f"{outcome} is not in the outcome space") from e
+
+    def bid_to_indices(self, bid: Bid) -> Tuple[int, ...]:
+        """Convert a NegoLog Bid to a tuple of per-issue value indices."""
+        if bid.domain is self._domain:
+            indices = bid.indices
+            if all(i < n for i, n in zip(indices, self._cardinalities)):
+                return indices
+            raise ValueError(f"{bid} is not in the bid space")
+        content = bid.content
+        try:
+            return tuple(
+                table[content[issue]]
+                for issue, table in zip(self._issues, self._bid_tables)
+            )
+        except KeyError as e:
+            raise ValueError(f"{bid} is not in the bid space") from e
+
+    def indices_to_outcome(self, indices: Sequence[int]) -> Outcome:
+        """Convert per-issue value indices to a NegMAS Outcome."""
+        return tuple(vals[i] for vals, i in zip(self._outcome_values, indices))
+
+    def indices_to_bid(self, indices: Sequence[int], utility: float = -1) -> Bid:
+        """Convert per-issue value indices to a NegoLog Bid."""
+        return Bid.from_indices(self._domain, tuple(map(int, indices)), utility)
+
+    def outcome_to_bid(self, outcome: Outcome, utility: float = -1) -> Bid:
+        """Convert a NegMAS Outcome to a NegoLog Bid."""
+        return self.indices_to_bid(self.outcome_to_indices(outcome), utility)
+
+    def bid_to_outcome(self, bid: Bid) -> Outcome:
+        """Convert a NegoLog Bid to a NegMAS Outcome."""
+        return self.indices_to_outcome(self.bid_to_indices(bid))
+
+
 class NegologPreferenceAdapter(Preference):
     """
     Adapter that wraps a NegMAS utility function to provide NegoLog Preference interface.
 
     This allows NegoLog agents to use NegMAS utility functions transparently.
+
+    Set ``utility_cache_size`` to memoize ufun evaluations of stationary ufuns in
+    a bounded ``UtilityCache``. This pays off for expensive (non-linear) ufuns
+    evaluated repeatedly by search-based agents.
     """
 
     def __init__(
@@ -100,6 +276,8 @@ class NegologPreferenceAdapter(Preference):
         issues: List[Issue],
         issue_names: List[str],
         reservation_value: float = 0.0,
+        codec: Optional[OutcomeBidCodec] = None,
+        utility_cache_size: int = 0,
     ):
         """
         Initialize the preference adapter.
@@ -109,6 +287,10 @@ class NegologPreferenceAdapter(Preference):
             issues: List of NegoLog Issue objects
             issue_names: List of issue names (for mapping)
             reservation_value: Reservation value (utility if negotiation fails)
+            codec: Outcome/bid codec for ``issues``. Built from the issues'
+                own values if not given.
+            utility_cache_size: Maximum number of memoized utilities. 0 (default)
+                disables memoization. Ignored for non-stationary ufuns.
         """
         # Initialize parent without loading from JSON
         super().__init__(profile_json_path=None, generate_bids=False)
@@ -122,6 +304,12 @@ class NegologPreferenceAdapter(Preference):
         self._issues = issues
         self._reservation_value = reservation_value
         self._issue_names = issue_names
+        self._codec = codec if codec is not None else OutcomeBidCodec(issues)
+        self._utility_cache: Optional[UtilityCache] = (
+            UtilityCache(utility_cache_size)
+            if utility_cache_size > 0 and self._is_stationary()
+            else None
+        )
 
         # Build issue weights from the NegMAS ufun if it's a LinearAdditive type
         # This is needed for opponent models that use these weights
@@ -132,6 +320,7 @@ class NegologPreferenceAdapter(Preference):
         if hasattr(ufun, "weights") and hasattr(ufun, "values"):
             ufun_weights = ufun.weights
             ufun_values = ufun.values
+            outcome_values = self._codec.outcome_values
             for i, issue in enumerate(issues):
                 self._issue_weights[issue] = float(ufun_weights[i])
                 self._value_weights[issue] = {}
@@ -141,11 +330,11 @@ class NegologPreferenceAdapter(Preference):
                     mapping = val_fun.mapping
                 elif callable(val_fun):
                     # Try to call it for each value
-                    mapping = {v: val_fun(v) for v in issue.values}
+                    mapping = {v: val_fun(v) for v in outcome_values[i]}
                 else:
                     mapping = {}
-                for value in issue.values:
-                    val_weight = mapping.get(value, 0.5)
+                for value, negmas_value in zip(issue.values, outcome_values[i]):
+                    val_weight = mapping.get(negmas_value, 0.5)
                     self._value_weights[issue][value] = float(val_weight)
         else:
             # Fall back to equal weights
@@ -165,61 +354,354 @@ class NegologPreferenceAdapter(Preference):
         Returns:
             Utility value from the NegMAS ufun
         """
-        # Convert NegoLog Bid to NegMAS Outcome (tuple)
-        outcome = self._bid_to_outcome(bid)
-        return float(self._ufun(outcome))
+        if self._utility_cache is None:
+            # Convert NegoLog Bid to NegMAS Outcome (tuple)
+            outcome = self._bid_to_outcome(bid)
+            return float(self._ufun(outcome))
+        return self._indices_utility(self._codec.bid_to_indices(bid))
+
+    def _indices_utility(self, indices: Tuple[int, ...]) -> float:
+        """Utility of the outcome with the given value indices, memoized if enabled."""
+        cache = self._utility_cache
+        if cache is None:
+            return float(self._ufun(self._codec.indices_to_outcome(indices)))
+
+        utility = cache.get(indices)
+        if utility is None:
+            utility = float(self._ufun(self._codec.indices_to_outcome(indices)))
+            cache.put(indices, utility)
+        return utility
+
+    def _is_stationary(self) -> bool:
+        """Whether the ufun always returns the same utility for the same outcome."""
+        try:
+            return not self._ufun.is_volatile() and self._ufun.is_stationary()
+        except AttributeError:
+            return False
+
+    @property
+    def codec(self) -> OutcomeBidCodec:
+        """The outcome/bid codec used by this adapter."""
+        return self._codec
+
+    @property
+    def utility_cache(self) -> Optional[UtilityCache]:
+        """The utility memoization cache, or None if disabled."""
+        return self._utility_cache
 
     def _bid_to_outcome(self, bid: Bid) -> Outcome:
         """Convert a NegoLog Bid to a NegMAS Outcome tuple."""
-        values = []
-        for issue_name in self._issue_names:
-            # Find the issue by name
-            for issue in self._issues:
-                if issue.name == issue_name:
-                    values.append(bid[issue])
-                    break
-        return tuple(values)
+        return self._codec.bid_to_outcome(bid)
 
     def _outcome_to_bid(self, outcome: Outcome) -> Bid:
         """Convert a NegMAS Outcome tuple to a NegoLog Bid."""
-        content = {}
-        for i, issue in enumerate(self._issues):
-            content[issue] = outcome[i]
-        bid = Bid(content)
-        bid.utility = self.get_utility(bid)
-        return bid
+        if self._utility_cache is None:
+            bid = self._codec.outcome_to_bid(outcome)
+            bid.utility = float(self._ufun(outcome))
+            return bid
+        indices = self._codec.outcome_to_indices(outcome)
+        return self._codec.indices_to_bid(indices, self._indices_utility(indices))
+
+    def _value_utility_tables(self) -> Optional[List[np.ndarray]]:
+        """
+        Per-issue value utilities for batched evaluation of additive ufuns.
+
+        Returns:
+            One array of (unweighted) value utilities per issue, indexed like the
+            codec's value tables, or None if the ufun cannot be evaluated in batch
+            (not additive, constrained, or a value function fails).
+        """
+        ufun = self._ufun
+        if not (hasattr(ufun, "weights") and hasattr(ufun, "values")):
+            return None
+        if getattr(ufun, "_constraints", None):
+            return None
+
+        value_funs = ufun.values
+        if len(value_funs) != len(self._issues) or len(ufun.weights) != len(
+            self._issues
+        ):
+            return None
+
+        tables = []
+        try:
+            for val_fun, values in zip(value_funs, self._codec.outcome_values):
+                utils = [val_fun(v) for v in values]
+                if any(u is None for u in utils):
+                    return None
+                tables.append(np.asarray(utils, dtype=float))
+        except Exception:
+            return None
+
+        return tables
+
+    def _index_matrix(self) -> np.ndarray:
+        """
+        Enumerate the cartesian product of the issues as a value-index matrix.
+
+        Rows follow NegoLog's enumeration order (the first issue varies fastest),
+        so a stable sort reproduces the tie order of the original bid list.
+        """
+        return cartesian_indices(list(self._codec.cardinalities))
+
+    def _batch_utilities(
+        self, matrix: np.ndarray, tables: Optional[List[np.ndarray]]
+    ) -> np.ndarray:
+        """
+        Utilities of every row of ``matrix`` (value indices, one column per issue).
+
+        Additive ufuns are evaluated as one weighted sum over the per-issue value
+        tables, accumulated in the same order as NegMAS so the results match
+        ``ufun(outcome)`` exactly. Any other ufun is called once per outcome.
+
+        Args:
+            matrix: Value-index matrix
+            tables: Result of ``_value_utility_tables()``
+        """
+        if tables is not None:
+            utilities = np.full(len(matrix), float(getattr(self._ufun, "_bias", 0.0)))
+            for i, (weight, table) in enumerate(zip(self._ufun.weights, tables)):
+                utilities += weight * table[matrix[:, i]]
+
+            # Guard against ufuns that expose weights/values but evaluate differently
+            probes = {0, len(matrix) - 1, len(matrix) // 2}
+            if all(
+                np.isclose(
+                    utilities[j],
+                    float(self._ufun(self._codec.indices_to_outcome(matrix[j]))),
+                )
+                for j in probes
+            ):
+                return utilities
+
+        codec = self._codec
+        return np.fromiter(
+            (float(self._ufun(codec.indices_to_outcome(row))) for row in matrix),
+            dtype=float,
+            count=len(matrix),
+        )
+
+    def get_utilities(self, index_matrix: np.ndarray) -> np.ndarray:
+        """
+        Utilities of many bids, given as a value-index matrix.
+
+        Args:
+            index_matrix: Value indices, one row per bid and one column per issue
+
+        Returns:
+            Utility of each row, as ``ufun(outcome)`` would give it
+        """
+        matrix = np.asarray(index_matrix, dtype=np.intp).reshape(-1, len(self._issues))
+        if len(matrix) == 0:
+            return np.zeros(0)
+        return self._batch_utilities(matrix, self._value_utility_tables())
+
+    def _additive_model(self) -> Optional[Tuple[List[List[float]], float]]:
+        """
+        Additive utility model of the ufun for lazy bid enumeration on huge domains.
+
+        Returns:
+            Weighted value utilities per issue and the ufun's bias, or None if the
+            ufun is not additive
+        """
+        tables = self._value_utility_tables()
+        if tables is None:
+            return None
+
+        contributions = [
+            [weight * float(u) for u in table]
+            for weight, table in zip(self._ufun.weights, tables)
+        ]
+        offset = float(getattr(self._ufun, "_bias", 0.0))
+
+        # Guard against ufuns that expose weights/values but evaluate differently
+        first = self._codec.indices_to_outcome([0] * len(tables))
+        if not np.isclose(
+            offset + sum(values[0] for values in contributions),
+            float(self._ufun(first)),
+        ):
+            return None
+
+        return contributions, offset
+
+    def _bid_space_key(self, tables: Optional[List[np.ndarray]]) -> Optional[str]:
+        """
+        Fingerprint of the outcome space and the ufun for the bid-space cache.
+
+        Additive ufuns are identified by their content (weights, value tables,
+        bias and reserved value). Other ufuns are identified by their NegMAS id,
+        and only if they are stationary. Returns None if the bid space must not
+        be cached.
+        """
+        ufun = self._ufun
+        domain = (
+            tuple(issue.name for issue in self._issues),
+            self._codec.outcome_values,
+            self._reservation_value,
+        )
+
+        if tables is not None:
+            return fingerprint(
+                "additive",
+                domain,
+                np.asarray(ufun.weights, dtype=float),
+                float(getattr(ufun, "_bias", 0.0)),
+                *tables,
+            )
+
+        ufun_id = getattr(ufun, "id", None)
+        if ufun_id is None or not self._is_stationary():
+            return None
+
+        return fingerprint("ufun", domain, type(ufun).__qualname__, ufun_id)
 
     @property
-    def bids(self) -> List[Bid]:
+    def bids(self) -> Sequence[Bid]:
         """
-        Generate all possible bids lazily.
+        All possible bids, sorted in descending order of utility.
+
+        The bid space is enumerated as a value-index matrix, scored in one batch
+        and sorted with a single stable argsort. Sorted bid spaces are shared
+        across negotiations through the process-wide ``bid_space_cache``. Bid
+        objects are only created when an agent accesses them.
 
         Returns:
-            Sorted list of all possible bids (descending by utility)
+            Lazily materialized sequence of all bids (descending by utility)
         """
         if len(self._bids) > 0:
             return self._bids
 
-        # Generate all bid combinations
-        bids = [Bid({}, -1)]
+        tables = self._value_utility_tables()
+        key = self._bid_space_key(tables) if bid_space_cache.enabled else None
+        cached = bid_space_cache.get(key) if key is not None else None
 
-        for issue in self._issues:
-            new_bids = []
-            for value_name in issue.values:
-                for bid in bids:
-                    _bid = bid.copy()
-                    _bid[issue] = value_name
-                    new_bids.append(_bid)
-            bids = new_bids
+        if cached is not None:
+            indices, utilities = cached
+        else:
+            matrix = self._index_matrix()
+            utilities = self._batch_utilities(matrix, tables)
+            order = np.argsort(-utilities, kind="stable")
+            indices, utilities = matrix[order], utilities[order]
+            if key is not None:
+                bid_space_cache.put(key, indices, utilities)
+
+        self._bids = LazyBidList(self._codec, indices, utilities)
+
+        return self._bids
+
+
+class LazyBidList(BidList):
+    """
+    NegoLog ``BidList`` over the bid space of an ``OutcomeBidCodec``.
+
+    Bid objects are created on first access and then reused, so agents that only
+    look at a handful of bids never pay for the rest of the bid space.
+    """
+
+    def __init__(
+        self, codec: OutcomeBidCodec, indices: np.ndarray, utilities: np.ndarray
+    ):
+        """
+        Args:
+            codec: Codec used to turn value indices into bids
+            indices: Value-index matrix, one row per bid
+            utilities: Utility of each row of ``indices``
+        """
+        super().__init__(codec.domain, indices, utilities)
+        self._codec = codec
 
-        # Assign utilities and sort
-        for bid in bids:
-            bid.utility = self.get_utility(bid)
 
-        bids = sorted(bids, reverse=True)
-        self._bids = bids
+def _copy_agent(
+    agent: AbstractAgent, adapter: NegologPreferenceAdapter
+) -> AbstractAgent:
+    """
+    Deep-copy an initiated agent, rebinding it to ``adapter``.
 
-        return bids
+    The agent's preference, its issues and its codec are replaced by those of
+    ``adapter`` instead of being copied. Both must describe the same domain.
+    """
+    preference = agent.preference
+    memo = {id(preference): adapter}
+    if isinstance(preference, NegologPreferenceAdapter):
+        memo[id(preference.codec)] = adapter.codec
+        memo[id(preference._issues)] = adapter._issues
+        for old, new in zip(preference._issues, adapter._issues):
+            memo[id(old)] = new
+    return copy.deepcopy(agent, memo)
+
+
+def _reseed(agent: AbstractAgent, seed: str) -> None:
+    """
+    Seed the random generators of a copied agent for its negotiation.
+
+    Each generator is seeded from ``seed`` and its attribute name, so copies in
+    different negotiations draw different numbers and a negotiation started
+    with the same seed draws the same ones.
+    """
+    for name, value in vars(agent).items():
+        if isinstance(value, random.Random):
+            value.seed(f"{seed}:{name}")
+
+
+def _agent_state_key(
+    agent_class: Type[AbstractAgent],
+    adapter: NegologPreferenceAdapter,
+    session_time: int,
+) -> Optional[Tuple[str, int, str]]:
+    """
+    Key of an initiated agent in ``agent_state_cache``.
+
+    Returns:
+        Agent class, session time and bid-space fingerprint of the ufun, or
+        None if the ufun cannot be fingerprinted (e.g., non-stationary)
+    """
+    ufun_key = adapter._bid_space_key(adapter._value_utility_tables())
+    if ufun_key is None:
+        return None
+    return (
+        f"{agent_class.__module__}.{agent_class.__qualname__}",
+        session_time,
+        ufun_key,
+    )
+
+
+def _start_agent(
+    agent_class: Type[AbstractAgent],
+    adapter: NegologPreferenceAdapter,
+    session_time: int,
+    reuse_agent_state: bool = False,
+    seed: str = "",
+) -> AbstractAgent:
+    """
+    Create and initiate a NegoLog agent on ``adapter``.
+
+    With ``reuse_agent_state``, the agent is copied from a snapshot of an agent
+    initiated on the same ufun, if ``agent_state_cache`` has one, and a
+    snapshot of a freshly initiated agent is stored otherwise. The random
+    generators of a copy are seeded from ``seed``.
+    """
+    key = (
+        _agent_state_key(agent_class, adapter, session_time)
+        if reuse_agent_state
+        else None
+    )
+    snapshot = agent_state_cache.get(key) if key is not None else None
+
+    if snapshot is not None:
+        agent = _copy_agent(snapshot, adapter)
+        _reseed(agent, seed)
+        return agent
+
+    agent = agent_class(
+        preference=adapter,
+        session_time=session_time,
+        estimators=[],  # No opponent models by default
+    )
+    agent.initiate(opponent_name=None)
+
+    if key is not None:
+        agent_state_cache.put(key, _copy_agent(agent, adapter))
+    return agent
 
 
 class NegologNegotiatorWrapper(SAONegotiator, ABC):
@@ -233,11 +715,35 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
 
     Subclasses should set the `negolog_agent_class` class attribute to the
     NegoLog agent class they wrap.
+
+    With ``instrument=True`` (or a ``latency_sink``), the wall and CPU time of
+    agent initialization, ``propose``, ``respond``, the agent's ``act`` and
+    ``receive_bid`` and the outcome/bid conversions are recorded per
+    negotiation and exposed through ``latency_stats``.
+
+    With ``reuse_agent_state=True``, the state of the NegoLog agent right after
+    ``initiate()`` is kept in the process-wide ``agent_state_cache``. Later
+    negotiations on an identical ufun start from a copy of it, skipping the
+    agent's per-domain precomputation.
+
+    With ``remote=True`` (or an ``AgentHostPool``), the NegoLog agent lives in a
+    worker process of a shared pool. Only value indices and the relative time
+    cross the process boundary, and a received bid is sent together with the
+    following ``act`` call in a single round trip. While the worker computes,
+    ``respond`` answers ``ResponseType.WAIT`` so that the controller can step
+    other negotiations (see ``negmas_negolog.remote``).
     """
 
     # Subclasses must set this to the NegoLog agent class
     negolog_agent_class: Type[AbstractAgent]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Attach the class to its deferred negmas registry entries, if any
+        from negmas_negolog.registry_init import _bind_class
+
+        _bind_class(cls)
+
     def __init__(
         self,
         preferences: BaseUtilityFunction | None = None,
@@ -248,6 +754,12 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         id: str | None = None,
         type_name: str | None = None,
         session_time: int = 180,  # Default 3 minutes
+        utility_cache_size: int = 0,
+        reuse_agent_state: bool = False,
+        instrument: bool = False,
+        latency_sink: Union[str, Path, IO[str], None] = None,
+        remote: Union[bool, "AgentHostPool"] = False,
+        remote_poll_interval: Optional[float] = 0.001,
         **kwargs,
     ):
         """
@@ -262,6 +774,21 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
             id: Unique identifier
             type_name: Type name for serialization
             session_time: Session time in seconds for NegoLog agent
+            utility_cache_size: Maximum number of utilities memoized by the
+                preference adapter (0 disables memoization)
+            reuse_agent_state: Start from a copy of an agent already initiated
+                on an identical ufun (see ``agent_state_cache``) instead of
+                calling ``initiate()`` again
+            instrument: Record per-call wall and CPU time of the wrapped agent
+            latency_sink: JSON-lines file (path or file object) receiving the
+                latency stats of each negotiation when it ends. Implies
+                ``instrument``.
+            remote: Run the NegoLog agent in a worker process. True uses the
+                shared ``default_host_pool()``; an ``AgentHostPool`` uses that
+                pool. The ufun must be picklable.
+            remote_poll_interval: Seconds ``respond`` waits for the remote
+                agent's action before answering ``ResponseType.WAIT``. None
+                blocks until the action arrives.
             **kwargs: Additional arguments passed to parent
         """
         super().__init__(
@@ -276,10 +803,23 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         )
 
         self._session_time = session_time
+        self._utility_cache_size = utility_cache_size
+        self._reuse_agent_state = reuse_agent_state
+        self._remote = remote if remote is not False else None
+        self._remote_poll_interval = remote_poll_interval
+        # Action requested from the remote agent: (step, future)
+        self._pending_action: Optional[Tuple[int, Future]] = None
+        self._utility_cache_stats: Optional[dict] = None
+        self._latency: Optional[LatencyRecorder] = (
+            LatencyRecorder(latency_sink)
+            if instrument or latency_sink is not None
+            else None
+        )
         self._negolog_agent: Optional[AbstractAgent] = None
         self._preference_adapter: Optional[NegologPreferenceAdapter] = None
         self._issues: List[Issue] = []
         self._issue_names: List[str] = []
+        self._codec: Optional[OutcomeBidCodec] = None
         self._initialized = False
         # Track the current negotiation step and cache act() results
         # This prevents calling act() multiple times per step (which corrupts
@@ -302,6 +842,15 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         if self._initialized:
             return
 
+        # Latency stats are per negotiation
+        if self._latency is not None:
+            self._latency.reset()
+
+        with self._timed("initialize"):
+            self._create_negolog_agent()
+
+    def _create_negolog_agent(self) -> None:
+        """Build the issues, codec, preference adapter and the NegoLog agent."""
         if not self.ufun:
             raise ValueError("Utility function must be set before negotiation starts")
 
@@ -315,8 +864,8 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         else:
             raise ValueError("Outcome space must have issues defined")
 
-        self._issues = []
         self._issue_names = []
+        negmas_values = []
 
         for i, negmas_issue in enumerate(negmas_issues):
             issue_name = getattr(negmas_issue, "name", f"issue_{i}")
@@ -330,12 +879,14 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
             else:
                 # Try to enumerate
                 values = list(negmas_issue)
+            negmas_values.append(values)
 
-            # Convert values to strings if needed
-            values = [str(v) if not isinstance(v, str) else v for v in values]
-
-            negolog_issue = Issue(issue_name, values)
-            self._issues.append(negolog_issue)
+        # NegoLog issues and the value-index tables used for every
+        # outcome <-> bid conversion
+        self._codec = OutcomeBidCodec.from_outcome_values(
+            self._issue_names, negmas_values
+        )
+        self._issues = list(self._codec.issues)
 
         # Create preference adapter
         reservation_value = getattr(self.ufun, "reserved_value", 0.0)
@@ -347,21 +898,78 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
             issues=self._issues,
             issue_names=self._issue_names,
             reservation_value=reservation_value,
+            codec=self._codec,
+            utility_cache_size=self._utility_cache_size,
         )
 
-        # Create the NegoLog agent
-        self._negolog_agent = self.negolog_agent_class(
-            preference=self._preference_adapter,
-            session_time=self._session_time,
-            estimators=[],  # No opponent models by default
-        )
+        # Seed of the random generators of agents copied from a snapshot
+        seed = f"{self.nmi.id}:{self.id}"
+
+        if self._remote is not None:
+            # The agent lives in a worker process; the local adapter is only
+            # used for outcome <-> bid conversion
+            from negmas_negolog.remote import RemoteAgent
+
+            self._negolog_agent = RemoteAgent(
+                self._remote,
+                self.negolog_agent_class,
+                ufun=self.ufun,
+                codec=self._codec,
+                issue_names=self._issue_names,
+                reservation_value=reservation_value,
+                session_time=self._session_time,
+                utility_cache_size=self._utility_cache_size,
+                reuse_agent_state=self._reuse_agent_state,
+                seed=seed,
+            )
+        else:
+            self._negolog_agent = _start_agent(
+                self.negolog_agent_class,
+                self._preference_adapter,
+                self._session_time,
+                self._reuse_agent_state,
+                seed,
+            )
 
-        # Initialize the agent
-        self._negolog_agent.initiate(opponent_name=None)
         self._initialized = True
         self._current_step = -1
         self._cached_action = None
 
+    def _timed(self, name: str) -> ContextManager[None]:
+        """Context manager timing ``name`` if instrumentation is enabled."""
+        if self._latency is None:
+            return _NOT_TIMED
+        return self._latency.measure(name)
+
+    @property
+    def latency_stats(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Latency summary of the current (or last) negotiation.
+
+        Returns:
+            Mapping from operation (``initialize``, ``propose``, ``respond``,
+            ``act``, ``receive_bid``, ``outcome_to_bid``, ``bid_to_outcome``) to
+            count, p50, p95 and max of wall and CPU time in seconds, or None if
+            instrumentation is disabled
+        """
+        if self._latency is None:
+            return None
+        return self._latency.stats
+
+    @property
+    def utility_cache_stats(self) -> Optional[dict]:
+        """
+        Statistics of the utility memoization cache.
+
+        Returns:
+            Stats of the current negotiation's cache (or of the last one, after
+            ``on_negotiation_end``), or None if memoization is disabled
+        """
+        if self._preference_adapter is not None:
+            cache = self._preference_adapter.utility_cache
+            return cache.stats if cache is not None else None
+        return self._utility_cache_stats
+
     def _get_relative_time(self, state: SAOState) -> float:
         """
         Get the relative time (0 to 1) for the NegoLog agent.
@@ -393,20 +1001,47 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
             # New step - call act() and cache the result
             self._current_step = current_step
             t = self._get_relative_time(state)
-            self._cached_action = self._negolog_agent.act(t)
+            with self._timed("act"):
+                self._cached_action = self._negolog_agent.act(t)
         return self._cached_action
 
     def _outcome_to_bid(self, outcome: Outcome) -> Bid:
-        """Convert a NegMAS Outcome to a NegoLog Bid."""
+        """Convert a NegMAS Outcome to a NegoLog Bid (with its utility)."""
         if self._preference_adapter is None:
             raise ValueError("Preference adapter not initialized")
-        return self._preference_adapter._outcome_to_bid(outcome)
+        with self._timed("outcome_to_bid"):
+            return self._preference_adapter._outcome_to_bid(outcome)
 
     def _bid_to_outcome(self, bid: Bid) -> Outcome:
         """Convert a NegoLog Bid to a NegMAS Outcome."""
-        if self._preference_adapter is None:
+        if self._codec is None:
             raise ValueError("Preference adapter not initialized")
-        return self._preference_adapter._bid_to_outcome(bid)
+        with self._timed("bid_to_outcome"):
+            return self._codec.bid_to_outcome(bid)
+
+    def __call__(self, state: SAOState, dest: str | None = None) -> SAOResponse:
+        """
+        Counter the current offer, or make the first offer.
+
+        For a remote agent, the first offer is requested without waiting too:
+        the negotiator answers ``ResponseType.WAIT`` until it is ready.
+        """
+        if (
+            state.current_offer is None
+            and self._acts_asynchronously
+            and self._current_step != state.step
+        ):
+            if not self._initialized:
+                self._initialize_negolog_agent()
+            if self._negolog_agent is not None:
+                if self._pending_action is None:
+                    self._request_remote_action(state, self._get_relative_time(state))
+                if self._pending_action[0] != state.step:
+                    self._poll_remote_action(state, store=False)
+                    return SAOResponse(ResponseType.WAIT, None)
+                if not self._poll_remote_action(state):
+                    return SAOResponse(ResponseType.WAIT, None)
+        return super().__call__(state, dest)
 
     def propose(self, state: SAOState, dest: str | None = None) -> Outcome | None:
         """
@@ -419,6 +1054,11 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         Returns:
             Outcome tuple to propose, or None
         """
+        with self._timed("propose"):
+            return self._propose(state)
+
+    def _propose(self, state: SAOState) -> Outcome | None:
+        """Untimed body of ``propose``."""
         if not self._initialized:
             self._initialize_negolog_agent()
 
@@ -445,6 +1085,11 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         Returns:
             ResponseType indicating acceptance/rejection
         """
+        with self._timed("respond"):
+            return self._respond(state)
+
+    def _respond(self, state: SAOState) -> ResponseType:
+        """Untimed body of ``respond``."""
         if not self._initialized:
             self._initialize_negolog_agent()
 
@@ -455,20 +1100,79 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         if offer is None:
             return ResponseType.REJECT_OFFER
 
+        if self._pending_action is not None:
+            if self._pending_action[0] == state.step:
+                # Called again while waiting for the remote agent's action
+                return self._response_to_remote(state)
+            # A request of an earlier step is still running. Finish it before
+            # sending another, so the agent is never asked to act twice at once.
+            if not self._poll_remote_action(state, store=False):
+                return ResponseType.WAIT
+
         t = self._get_relative_time(state)
 
         # Convert offer to NegoLog bid and notify agent
         bid = self._outcome_to_bid(offer)
-        self._negolog_agent.receive_bid(bid, t)
+        with self._timed("receive_bid"):
+            self._negolog_agent.receive_bid(bid, t)
 
         # Invalidate the cached action since we received a new bid
         # The agent may now decide differently (e.g., to accept)
         self._current_step = -1
         self._cached_action = None
 
+        if self._acts_asynchronously:
+            self._request_remote_action(state, t)
+            return self._response_to_remote(state)
+
         # Get action from NegoLog agent (will be cached for this step)
         action = self._get_action_for_step(state)
+        return self._response_to(action)
 
+    @property
+    def _acts_asynchronously(self) -> bool:
+        """Whether the agent's actions are requested without waiting."""
+        return self._remote is not None and self._remote_poll_interval is not None
+
+    def _request_remote_action(self, state: SAOState, t: float) -> None:
+        """Ask the remote agent for its action of this step, without waiting."""
+        with self._timed("act"):
+            future = self._negolog_agent.act_async(t)
+        self._pending_action = (state.step, future)
+
+    def _poll_remote_action(self, state: SAOState, store: bool = True) -> bool:
+        """
+        Wait up to ``remote_poll_interval`` for the requested remote action.
+
+        Args:
+            state: Current negotiation state
+            store: Cache the action for this step (False discards it)
+
+        Returns:
+            True if the request is finished
+        """
+        _, future = self._pending_action
+        done, _ = wait([future], timeout=self._remote_poll_interval)
+        if not done:
+            return False
+
+        self._pending_action = None
+        action = future.result()
+        if store:
+            # Cache the action for the ``propose`` call of this step
+            self._current_step = state.step
+            self._cached_action = action
+        return True
+
+    def _response_to_remote(self, state: SAOState) -> ResponseType:
+        """Answer WAIT until the requested remote action is ready."""
+        if not self._poll_remote_action(state):
+            return ResponseType.WAIT
+        return self._response_to(self._cached_action)
+
+    @staticmethod
+    def _response_to(action: Optional[Action]) -> ResponseType:
+        """Response to the current offer, given the agent's action."""
         if action is None:
             return ResponseType.REJECT_OFFER
 
@@ -490,9 +1194,29 @@ class NegologNegotiatorWrapper(SAONegotiator, ABC):
         if self._negolog_agent is not None:
             is_accept = state.agreement is not None
             t = self._get_relative_time(state)
-            self._negolog_agent.terminate(is_accept, "opponent", t)
+            try:
+                self._negolog_agent.terminate(is_accept, "opponent", t)
+            finally:
+                # Free the worker even if the agent fails to terminate
+                close = getattr(self._negolog_agent, "close", None)
+                if close is not None:
+                    close()
+
+        if self._preference_adapter is not None:
+            cache = self._preference_adapter.utility_cache
+            if cache is not None:
+                self._utility_cache_stats = cache.stats
+
+        if self._latency is not None:
+            self._latency.dump(
+                negotiator=self.name,
+                negotiator_type=type(self).__name__,
+                negotiation=getattr(self.nmi, "id", None),
+            )
 
         # Reset state
+        self._pending_action = None
         self._negolog_agent = None
         self._preference_adapter = None
+        self._codec = None
         self._initialized = False
@@ -0,0 +1,125 @@
+"""
+Per-call latency instrumentation for wrapped NegoLog agents.
+
+A ``LatencyRecorder`` collects the wall-clock and CPU time of every timed call
+made during one negotiation (agent initialization, ``propose``, ``respond``, the
+wrapped agent's ``act`` and ``receive_bid``, and outcome/bid conversions) and
+summarizes them as count, p50, p95 and max per operation.
+
+Example:
+    >>> from negmas_negolog import BoulwareAgent
+    >>> negotiator = BoulwareAgent(name="b", instrument=True)
+    >>> # ... run the negotiation ...
+    >>> negotiator.latency_stats["propose"]["wall_p95"]
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+
+__all__ = [
+    "LatencyRecorder",
+]
+
+
+class LatencyRecorder:
+    """
+    Wall and CPU time samples of named operations for one negotiation.
+
+    Samples are kept in memory until ``reset`` so exact percentiles can be
+    reported. CPU time is measured with ``time.thread_time`` because NegMAS may
+    run negotiators of several negotiations in the same process.
+    """
+
+    def __init__(self, sink: Union[str, Path, IO[str], None] = None):
+        """
+        Args:
+            sink: Optional JSON-lines destination for ``dump``. A path is opened
+                in append mode on every dump; a file-like object is written to
+                and flushed.
+        """
+        self._sink = sink
+        self._samples: Dict[str, List[Tuple[float, float]]] = {}
+
+    @property
+    def sink(self) -> Union[str, Path, IO[str], None]:
+        """JSON-lines destination used by ``dump``."""
+        return self._sink
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Time the body of a ``with`` block as one call of ``name``.
+
+        Args:
+            name: Operation name
+        """
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        """
+        Add one sample.
+
+        Args:
+            name: Operation name
+            wall: Wall-clock duration in seconds
+            cpu: CPU duration in seconds
+        """
+        self._samples.setdefault(name, []).append((wall, cpu))
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._samples = {}
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency summary of each operation.
+
+        Returns:
+            Mapping from operation name to a dictionary with ``count`` and the
+            ``p50``, ``p95`` and ``max`` of wall (``wall_*``) and CPU (``cpu_*``)
+            time in seconds
+        """
+        summary = {}
+        for name, samples in self._samples.items():
+            values = np.asarray(samples, dtype=float)
+            p50, p95 = np.percentile(values, [50, 95], axis=0)
+            maximum = values.max(axis=0)
+            summary[name] = {
+                "count": len(samples),
+                "wall_p50": float(p50[0]),
+                "wall_p95": float(p95[0]),
+                "wall_max": float(maximum[0]),
+                "cpu_p50": float(p50[1]),
+                "cpu_p95": float(p95[1]),
+                "cpu_max": float(maximum[1]),
+            }
+        return summary
+
+    def dump(self, **metadata: Any) -> None:
+        """
+        Write the current stats as one JSON line to the sink, if any.
+
+        Args:
+            **metadata: Extra fields of the record (negotiator, negotiation, ...)
+        """
+        if self._sink is None:
+            return
+        line = json.dumps({**metadata, "stats": self.stats}) + "\n"
+        if isinstance(self._sink, (str, Path)):
+            with open(self._sink, "a") as f:
+                f.write(line)
+        else:
+            self._sink.write(line)
+            self._sink.flush()
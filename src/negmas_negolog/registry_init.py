@@ -4,7 +4,12 @@ This module registers all negmas-negolog agent wrappers in the negmas registry s
 allowing them to be discovered and queried alongside built-in negmas negotiators.
 
 The registration happens automatically when negmas_negolog is imported (if negmas
-registry is available).
+registry is available). Only metadata is registered at import time: names, tags and
+descriptions live in a static table, and each registry entry imports its wrapper
+class on first access (``get_class``, ``create``, ``info.cls``). Registry queries
+therefore never import the agents or their dependencies. On NegMAS versions whose
+registry does not allow such deferred entries, all classes are imported and
+registered eagerly.
 
 Naming Convention:
     Agents that have the same name as Genius agents are prefixed with "NL" (NegoLog)
@@ -34,13 +39,20 @@ Example:
 
 from __future__ import annotations
 
-from typing import Any
+import dataclasses
+import importlib
+import sys
+import uuid
+from typing import Any, NamedTuple
 
 __all__: list[str] = []
 
 # Source identifier for all negolog registrations
 _SOURCE = "negolog"
 
+# Package holding one wrapper module per agent (see agents._AGENT_MODULES)
+_AGENTS_PACKAGE = "negmas_negolog.agents"
+
 # Agents that conflict with Genius agent names - use "NL" prefix
 # These are agents that exist in both Genius and NegoLog
 _GENIUS_CONFLICTING_NAMES = {
@@ -61,445 +73,506 @@ _GENIUS_CONFLICTING_NAMES = {
 }
 
 
-def _get_short_name(class_name: str) -> str:
-    """Get the short name for registration, adding NL prefix if needed."""
-    if class_name in _GENIUS_CONFLICTING_NAMES:
-        return f"NL{class_name}"
-    return class_name
-
-
-def _register_negotiator(
-    registry: Any,
-    cls: type,
-    short_name: str,
-    tags: set[str],
-    description: str | None = None,
-) -> None:
-    """Register a negotiator with backward compatibility.
-
-    Tries to register with the new API (source parameter and tags for booleans).
-    If that fails due to unexpected keyword argument, falls back to the old API.
-
-    Args:
-        registry: The negotiator registry to register with.
-        cls: The negotiator class to register.
-        short_name: The short name for registration.
-        tags: Set of tags for the negotiator.
-        description: Short, human-readable summary of the negotiator's strategy.
-    """
-    try:
-        # New API: use source parameter and pass boolean features as tags
-        registry.register(
-            cls,
-            short_name=short_name,
-            source=_SOURCE,
-            tags=tags,
-            description=description,
-        )
-    except TypeError:
-        # Old API: no source parameter, use bilateral_only as keyword arg
-        # Extract anac_year from tags if present
-        anac_year = None
-        for tag in tags:
-            if tag.startswith("anac-") and tag != "anac":
-                try:
-                    anac_year = int(tag.split("-")[1])
-                except (ValueError, IndexError):
-                    pass
-
-        registry.register(
-            cls,
-            short_name=short_name,
-            bilateral_only=True,
-            anac_year=anac_year,
-            tags=tags,
-        )
-
-
-def _register_negolog_agents() -> None:
-    """Register all negmas-negolog agents in the negmas registry.
-
-    This function registers all NegoLog agent wrappers with appropriate metadata
-    including:
-    - short_name: The class name (with "NL" prefix for Genius conflicts)
-    - source: "negolog" to identify the origin of these agents
-    - description: A short, human-readable summary of the agent's strategy
-    - tags: Set of tags for categorization and filtering
-
-    Tags used:
-    - "negolog": All agents from this package
-    - "sao": Works with SAO protocol
-    - "propose": Can propose offers
-    - "respond": Can respond to offers
-    - "bilateral-only": Only works in bilateral negotiations
-    - "time-based": Time-based concession strategy (Boulware, Conceder, Linear)
-    - "anac": Competed in ANAC competition
-    - "anac-YYYY": Specific ANAC year
-    - "learning": Uses opponent modeling/learning
-    - "frequency": Uses frequency-based opponent model
-    - "bayesian": Uses Bayesian opponent model
-    - "tit-for-tat": Uses tit-for-tat strategy
-    """
-    try:
-        from negmas.registry import negotiator_registry
-    except ImportError:
-        # negmas registry not available, skip registration
-        return
-
-    # Import all agent classes
-    from negmas_negolog.agents import (
-        # Time-based agents
-        BoulwareAgent,
-        ConcederAgent,
-        LinearAgent,
-        # Competition agents
-        MICROAgent,
-        Atlas3Agent,
-        NiceTitForTat,
-        YXAgent,
-        ParsCatAgent,
-        PonPokoAgent,
-        AgentGG,
-        SAGAAgent,
-        CUHKAgent,
-        AgentKN,
-        Rubick,
-        AhBuNeAgent,
-        ParsAgent,
-        RandomDance,
-        AgentBuyog,
-        Kawaii,
-        Caduceus2015,
-        Caduceus,
-        HardHeaded,
-        IAMhaggler,
-        LuckyAgent2022,
-        HybridAgent,
-    )
-
-    # Base tags for all negolog agents
-    base_tags = {"negolog", "sao", "propose", "respond", "bilateral-only"}
-
+class _AgentEntry(NamedTuple):
+    """Registration metadata of one wrapper class."""
+
+    class_name: str
+    tags: set[str]
+    description: str
+
+
+# Base tags for all negolog agents
+_BASE_TAGS = {"negolog", "sao", "propose", "respond", "bilateral-only"}
+
+# Registration metadata of all agents. Tags are added to _BASE_TAGS.
+#
+# Tags used:
+# - "negolog": All agents from this package
+# - "sao": Works with SAO protocol
+# - "propose": Can propose offers
+# - "respond": Can respond to offers
+# - "bilateral-only": Only works in bilateral negotiations
+# - "time-based": Time-based concession strategy (Boulware, Conceder, Linear)
+# - "anac": Competed in ANAC competition
+# - "anac-YYYY": Specific ANAC year
+# - "learning": Uses opponent modeling/learning
+# - "frequency": Uses frequency-based opponent model
+# - "bayesian": Uses Bayesian opponent model
+# - "tit-for-tat": Uses tit-for-tat strategy
+_NEGOLOG_AGENTS: tuple[_AgentEntry, ...] = (
     # =========================================================================
     # Time-based agents (no specific ANAC year)
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        BoulwareAgent,
-        short_name="BoulwareAgent",
-        tags=base_tags | {"time-based", "boulware"},
-        description=(
+    _AgentEntry(
+        "BoulwareAgent",
+        {"time-based", "boulware"},
+        (
             "Tough time-based concession: slowly (sub-linearly) lowers a Bezier "
             "target-utility curve, holding high demands until near the deadline; "
             "no opponent modeling."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        ConcederAgent,
-        short_name="ConcederAgent",
-        tags=base_tags | {"time-based", "conceder"},
-        description=(
+    ),
+    _AgentEntry(
+        "ConcederAgent",
+        {"time-based", "conceder"},
+        (
             "Soft time-based concession: quickly (super-linearly) lowers a Bezier "
             "target-utility curve, prioritizing agreement over utility; "
             "no opponent modeling."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        LinearAgent,
-        short_name="LinearAgent",
-        tags=base_tags | {"time-based", "linear"},
-        description=(
+    ),
+    _AgentEntry(
+        "LinearAgent",
+        {"time-based", "linear"},
+        (
             "Balanced time-based concession: lowers a Bezier target-utility curve "
             "linearly, midway between Boulware and Conceder; no opponent modeling."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2010 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        IAMhaggler,
-        short_name=_get_short_name("IAMhaggler"),
-        tags=base_tags | {"anac", "anac-2010", "learning", "bayesian"},
-        description=(
+    _AgentEntry(
+        "IAMhaggler",
+        {"anac", "anac-2010", "learning", "bayesian"},
+        (
             "Uses Gaussian Process regression to predict opponent behavior and "
             "optimize the timing of its time-based concession."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2011 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        HardHeaded,
-        short_name=_get_short_name("HardHeaded"),
-        tags=base_tags | {"anac", "anac-2011", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "HardHeaded",
+        {"anac", "anac-2011", "learning", "frequency"},
+        (
             "Aggressive frequency-modeling agent that holds high demands via "
             "monotonic concession and yields only near the deadline."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        NiceTitForTat,
-        short_name=_get_short_name("NiceTitForTat"),
-        tags=base_tags | {"anac", "anac-2011", "tit-for-tat"},
-        description=(
+    ),
+    _AgentEntry(
+        "NiceTitForTat",
+        {"anac", "anac-2011", "tit-for-tat"},
+        (
             "Cooperative tit-for-tat in utility space, reciprocating opponent "
             "concessions while aiming for the Nash bargaining solution."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2012 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        CUHKAgent,
-        short_name=_get_short_name("CUHKAgent"),
-        tags=base_tags | {"anac", "anac-2012", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "CUHKAgent",
+        {"anac", "anac-2012", "learning", "frequency"},
+        (
             "Adaptive time-dependent conceder with frequency-based opponent "
             "modeling that adjusts its threshold to opponent behavior and time "
             "pressure."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2015 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        Atlas3Agent,
-        short_name="Atlas3Agent",
-        tags=base_tags | {"anac", "anac-2015", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "Atlas3Agent",
+        {"anac", "anac-2015", "learning", "frequency"},
+        (
             "Adaptive agent using frequency-based opponent modeling and "
             "game-theoretic bid search driven by opponent-behavior analysis."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        ParsAgent,
-        short_name=_get_short_name("ParsAgent"),
-        tags=base_tags | {"anac", "anac-2015", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "ParsAgent",
+        {"anac", "anac-2015", "learning"},
+        (
             "Hybrid time-dependent, random, and frequency-based bidding that "
             "offers high-utility bids close to opponent preferences to encourage "
             "early agreement."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        RandomDance,
-        short_name=_get_short_name("RandomDance"),
-        tags=base_tags | {"anac", "anac-2015", "random"},
-        description=(
+    ),
+    _AgentEntry(
+        "RandomDance",
+        {"anac", "anac-2015", "random"},
+        (
             "Opponent modeling with several weighted utility-estimation functions "
             "chosen at random for unpredictable yet responsive bidding."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        AgentBuyog,
-        short_name=_get_short_name("AgentBuyog"),
-        tags=base_tags | {"anac", "anac-2015", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "AgentBuyog",
+        {"anac", "anac-2015", "learning"},
+        (
             "Regression-estimates the opponent's concession function and "
             "preferences to target Kalai-point bids and set optimal acceptance "
             "thresholds."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        Kawaii,
-        short_name=_get_short_name("Kawaii"),
-        tags=base_tags | {"anac", "anac-2015", "learning", "frequency"},
-        description=(
+    ),
+    _AgentEntry(
+        "Kawaii",
+        {"anac", "anac-2015", "learning", "frequency"},
+        (
             "Simulated-Annealing bid search with time-dependent concession and "
             "acceptance that adapts to the number of accepting opponents."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        Caduceus2015,
-        short_name="Caduceus2015",
-        tags=base_tags | {"anac", "anac-2015", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "Caduceus2015",
+        {"anac", "anac-2015", "learning"},
+        (
             "Nash-product optimization with frequency-based opponent modeling to "
             "find mutually beneficial outcomes."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2016 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        YXAgent,
-        short_name=_get_short_name("YXAgent"),
-        tags=base_tags | {"anac", "anac-2016", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "YXAgent",
+        {"anac", "anac-2016", "learning", "frequency"},
+        (
             "Frequency-based opponent modeling with threshold-based bidding and "
             "acceptance, focusing on the toughest opponent."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        ParsCatAgent,
-        short_name="ParsCatAgent",
-        tags=base_tags | {"anac", "anac-2016", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "ParsCatAgent",
+        {"anac", "anac-2016", "learning"},
+        (
             "Time-dependent bidding with a piecewise, phase-dependent acceptance "
             "function informed by opponent-bid history."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        Caduceus,
-        short_name=_get_short_name("Caduceus"),
-        tags=base_tags | {"anac", "anac-2016", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "Caduceus",
+        {"anac", "anac-2016", "learning"},
+        (
             "Algorithm-portfolio / mixture-of-experts that combines five expert "
             "agents to make collective bidding decisions."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2017 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        PonPokoAgent,
-        short_name=_get_short_name("PonPokoAgent"),
-        tags=base_tags | {"anac", "anac-2017", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "PonPokoAgent",
+        {"anac", "anac-2017", "learning", "frequency"},
+        (
             "Randomized multi-strategy agent that picks one of five distinct "
             "bidding patterns per session to stay unpredictable."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        AgentKN,
-        short_name=_get_short_name("AgentKN"),
-        tags=base_tags | {"anac", "anac-2017", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "AgentKN",
+        {"anac", "anac-2017", "learning"},
+        (
             "Simulated-Annealing bid search with opponent modeling of the "
             "opponent's likely maximum offer, balancing self-utility and value "
             "frequency."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        Rubick,
-        short_name=_get_short_name("Rubick"),
-        tags=base_tags | {"anac", "anac-2017", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "Rubick",
+        {"anac", "anac-2017", "learning"},
+        (
             "Frequency-modeling time-based conceder using randomized "
             "Boulware-style concession floored at the best utility ever received."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2019 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        AgentGG,
-        short_name=_get_short_name("AgentGG"),
-        tags=base_tags | {"anac", "anac-2019", "learning", "frequency"},
-        description=(
+    _AgentEntry(
+        "AgentGG",
+        {"anac", "anac-2019", "learning", "frequency"},
+        (
             "Frequentist importance maps estimate self and opponent preferences, "
             "driving time-based concession over importance thresholds."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        SAGAAgent,
-        short_name="SAGAAgent",
-        tags=base_tags | {"anac", "anac-2019", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "SAGAAgent",
+        {"anac", "anac-2019", "learning"},
+        (
             "Genetic-Algorithm preference estimation (Spearman-correlation "
             "fitness) combined with time-based bidding and acceptance."
         ),
-    )
-
+    ),
     # =========================================================================
     # ANAC 2022 agents
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        LuckyAgent2022,
-        short_name="LuckyAgent2022",
-        tags=base_tags | {"anac", "anac-2022", "learning"},
-        description=(
+    _AgentEntry(
+        "LuckyAgent2022",
+        {"anac", "anac-2022", "learning"},
+        (
             "BOA-component agent with a multi-armed-bandit-inspired Stop-Learning "
             "Mechanism to prevent opponent-model overfitting."
         ),
-    )
-
+    ),
     # =========================================================================
     # Other competition agents (year uncertain or multi-year)
     # =========================================================================
-
-    _register_negotiator(
-        negotiator_registry,
-        MICROAgent,
-        short_name="MICROAgent",
-        tags=base_tags | {"micro", "learning"},
-        description=(
+    _AgentEntry(
+        "MICROAgent",
+        {"micro", "learning"},
+        (
             "MiCRO benchmark: monotonic concession with reciprocal offers, "
             "conceding only when the opponent proposes new unique bids."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        AhBuNeAgent,
-        short_name="AhBuNeAgent",
-        tags=base_tags | {"learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "AhBuNeAgent",
+        {"learning"},
+        (
             "Similarity maps and linear ordering estimate preferences, balancing "
             "preference elicitation against utility maximization."
         ),
-    )
-
-    _register_negotiator(
-        negotiator_registry,
-        HybridAgent,
-        short_name="HybridAgent",
-        tags=base_tags | {"hybrid", "learning"},
-        description=(
+    ),
+    _AgentEntry(
+        "HybridAgent",
+        {"hybrid", "learning"},
+        (
             "Blends time-based Bezier concession with behavior-based mirroring of "
             "opponent moves using time-varying weights."
         ),
+    ),
+)
+
+# Lazy registry entries whose class has not been imported yet, by full type name
+_PENDING: dict[str, list[Any]] = {}
+
+
+def _get_short_name(class_name: str) -> str:
+    """Get the short name for registration, adding NL prefix if needed."""
+    if class_name in _GENIUS_CONFLICTING_NAMES:
+        return f"NL{class_name}"
+    return class_name
+
+
+def _register_negotiator(
+    registry: Any,
+    cls: type,
+    short_name: str,
+    tags: set[str],
+    description: str | None = None,
+) -> None:
+    """Register a negotiator with backward compatibility.
+
+    Tries to register with the new API (source parameter and tags for booleans).
+    If that fails due to unexpected keyword argument, falls back to the old API.
+
+    Args:
+        registry: The negotiator registry to register with.
+        cls: The negotiator class to register.
+        short_name: The short name for registration.
+        tags: Set of tags for the negotiator.
+        description: Short, human-readable summary of the negotiator's strategy.
+    """
+    try:
+        # New API: use source parameter and pass boolean features as tags
+        registry.register(
+            cls,
+            short_name=short_name,
+            source=_SOURCE,
+            tags=tags,
+            description=description,
+        )
+    except TypeError:
+        # Old API: no source parameter, use bilateral_only as keyword arg
+        # Extract anac_year from tags if present
+        anac_year = None
+        for tag in tags:
+            if tag.startswith("anac-") and tag != "anac":
+                try:
+                    anac_year = int(tag.split("-")[1])
+                except (ValueError, IndexError):
+                    pass
+
+        registry.register(
+            cls,
+            short_name=short_name,
+            bilateral_only=True,
+            anac_year=anac_year,
+            tags=tags,
+        )
+
+
+def _full_type_name(class_name: str) -> str:
+    """Full type name of a wrapper class, without importing it."""
+    from negmas_negolog.agents import _AGENT_MODULES
+
+    return f"{_AGENTS_PACKAGE}.{_AGENT_MODULES[class_name]}.{class_name}"
+
+
+def _load_class(class_name: str) -> type:
+    """Import the module defining a wrapper class and return the class."""
+    from negmas_negolog.agents import _AGENT_MODULES
+
+    module = importlib.import_module(f"{_AGENTS_PACKAGE}.{_AGENT_MODULES[class_name]}")
+    return getattr(module, class_name)
+
+
+def _supports_lazy_entries(registry: Any) -> bool:
+    """Whether registry entries can be added without their class object.
+
+    Lazy entries rely on internals of the dataclass-based registry of NegMAS:
+    entries are ``RegistryInfo`` dataclasses with the fields set by
+    ``_register_lazy``, stored with ``registry[key] = info`` and indexed by
+    class in ``_by_class``. Other registries are populated eagerly through the
+    public ``register``.
+    """
+    info_class = getattr(registry, "_info_class", None)
+    if not isinstance(getattr(registry, "_by_class", None), dict):
+        return False
+    if not hasattr(type(registry), "__setitem__"):
+        return False
+    if info_class is None or not dataclasses.is_dataclass(info_class):
+        return False
+    return _LAZY_INFO_FIELDS <= {f.name for f in dataclasses.fields(info_class)}
+
+
+# Registry info fields set by _register_lazy
+_LAZY_INFO_FIELDS = {
+    "key",
+    "short_name",
+    "full_type_name",
+    "cls",
+    "source",
+    "description",
+    "params",
+    "tags",
+    "extra",
+}
+
+_LAZY_INFO_CLASSES: dict[type, type] = {}
+
+
+def _lazy_info_class(info_class: type) -> type:
+    """Subclass of a registry info class whose ``cls`` is imported on first access."""
+    lazy_class = _LAZY_INFO_CLASSES.get(info_class)
+    if lazy_class is not None:
+        return lazy_class
+
+    def get_cls(self) -> type:
+        cls = self.__dict__.get("_cls")
+        if cls is None:
+            # Importing the module binds the class through _bind_class()
+            cls = self._loader()
+            _bind_class(cls)
+        return self.__dict__["_cls"]
+
+    def set_cls(self, value: type | None) -> None:
+        self.__dict__["_cls"] = value
+
+    lazy_class = type(
+        f"Lazy{info_class.__name__}",
+        (info_class,),
+        {"cls": property(get_cls, set_cls), "__module__": __name__},
+    )
+    _LAZY_INFO_CLASSES[info_class] = lazy_class
+    return lazy_class
+
+
+def _register_lazy(
+    registry: Any,
+    class_name: str,
+    short_name: str,
+    tags: set[str],
+    description: str,
+) -> str:
+    """Add a registry entry that imports its class on first access.
+
+    Mirrors ``Registry.register`` (key format and fields) without resolving
+    the class.
+
+    Returns:
+        The unique key of the entry.
+    """
+    full_type_name = _full_type_name(class_name)
+    key = f"{short_name}#{uuid.uuid4().hex[:8]}"
+    info = _lazy_info_class(registry._info_class)(
+        key=key,
+        short_name=short_name,
+        full_type_name=full_type_name,
+        cls=None,
+        source=_SOURCE,
+        description=description,
+        params={},
+        tags=set(tags),
+        extra={},
     )
+    info._loader = lambda: _load_class(class_name)
+    info._registry = registry
+    registry[key] = info
+    _PENDING.setdefault(full_type_name, []).append(info)
+
+    # Bind right away if the wrapper module was already imported
+    module = sys.modules.get(full_type_name.rsplit(".", 1)[0])
+    if module is not None and hasattr(module, class_name):
+        _bind_class(getattr(module, class_name))
+    return key
+
+
+def _bind_class(cls: type) -> None:
+    """Attach an imported wrapper class to its pending lazy registry entries.
+
+    Called by ``NegologNegotiatorWrapper.__init_subclass__`` so that class-based
+    lookups (``is_registered``, ``get_by_class``) work as soon as a wrapper
+    module is imported, however it was imported.
+    """
+    for info in _PENDING.pop(f"{cls.__module__}.{cls.__qualname__}", []):
+        info.cls = cls
+        registry = info._registry
+        # Skip entries removed from the registry in the meantime
+        if registry.get(info.key) is info:
+            registry._by_class.setdefault(cls, []).append(info.key)
+
+
+def _register_negolog_agents(lazy: bool = True) -> None:
+    """Register all negmas-negolog agents in the negmas registry.
+
+    Every entry of ``_NEGOLOG_AGENTS`` is registered with:
+    - short_name: The class name (with "NL" prefix for Genius conflicts)
+    - source: "negolog" to identify the origin of these agents
+    - description: A short, human-readable summary of the agent's strategy
+    - tags: ``_BASE_TAGS`` plus the agent's own tags
+
+    Args:
+        lazy: Register metadata only and import each class on first access, if
+            the registry supports it. Otherwise import and register all classes.
+    """
+    try:
+        from negmas.registry import negotiator_registry
+    except ImportError:
+        # negmas registry not available, skip registration
+        return
+
+    lazy = lazy and _supports_lazy_entries(negotiator_registry)
+
+    for entry in _NEGOLOG_AGENTS:
+        short_name = _get_short_name(entry.class_name)
+        tags = _BASE_TAGS | entry.tags
+        if lazy:
+            try:
+                _register_lazy(
+                    negotiator_registry,
+                    entry.class_name,
+                    short_name=short_name,
+                    tags=tags,
+                    description=entry.description,
+                )
+                continue
+            except (AttributeError, TypeError):
+                # The registry internals changed: register this and the
+                # remaining agents through the public API
+                lazy = False
+        _register_negotiator(
+            negotiator_registry,
+            _load_class(entry.class_name),
+            short_name=short_name,
+            tags=tags,
+            description=entry.description,
+        )
 
 
 # Auto-register when this module is imported
@@ -0,0 +1,394 @@
+"""
+Out-of-process hosting of NegoLog agents.
+
+Some NegoLog agents spend seconds of CPU in ``initiate()`` or ``act()``. When
+many negotiations run in one process (e.g., a NegMAS tournament), running those
+agents in worker processes keeps the negotiating process responsive and lets
+agents of concurrent negotiations use several cores.
+
+The wrapper does not block on the worker: it sends the received bid with an
+``act`` request and, if the action is not ready within ``remote_poll_interval``,
+answers ``ResponseType.WAIT``. The mechanism then returns without advancing its
+step, so a controller stepping several mechanisms in turn (e.g.,
+``SAOMechanism.runall(method="ordered")`` or a NegMAS world) keeps the other
+negotiations going while the workers compute. The first offer of a negotiation
+is requested the same way.
+
+A wrapper created with ``remote=True`` (or ``remote=<AgentHostPool>``) creates
+its NegoLog agent in a worker of an ``AgentHostPool``. The agent stays in that
+worker for the whole negotiation. Messages are kept compact:
+
+- bids travel as tuples of value indices (see ``OutcomeBidCodec``) with their
+  utility, which the wrapper has already computed
+- the relative time is the only other per-call argument
+- a received bid is not sent on its own; it is queued and sent together with
+  the next ``act`` (or ``terminate``), so a ``respond`` costs one round trip
+
+Example:
+    >>> from negmas_negolog import AgentHostPool, BoulwareAgent
+    >>> with AgentHostPool(n_workers=4) as pool:
+    ...     negotiator = BoulwareAgent(name="b", remote=pool)
+    ...     # ... run negotiations ...
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import importlib
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# negmas_negolog.common puts the vendored NegoLog on sys.path
+from negmas_negolog.common import (
+    NegologPreferenceAdapter,
+    OutcomeBidCodec,
+    _start_agent,
+)
+
+from nenv import Accept, Offer  # noqa: E402
+from nenv.Action import Action  # noqa: E402
+from nenv.Agent import AbstractAgent  # noqa: E402
+from nenv.Bid import Bid  # noqa: E402
+
+__all__ = [
+    "AgentHostPool",
+    "RemoteAgent",
+    "default_host_pool",
+]
+
+# Reply of a worker to ``act``: (is_accept, value indices, utility), or None
+_ActionMessage = Optional[Tuple[bool, Tuple[int, ...], float]]
+
+# Received bids not yet delivered to the worker:
+# (value indices, utility computed by the local adapter, relative time)
+_BidMessage = Tuple[Tuple[int, ...], float, float]
+
+
+class AgentHostPool:
+    """
+    Pool of worker processes hosting NegoLog agents.
+
+    Every worker is a single-process executor, so all calls for one agent go
+    to the process that holds it. New agents are placed on the worker hosting
+    the fewest live agents.
+
+    An agent is removed from its worker by ``RemoteAgent.terminate`` or
+    ``RemoteAgent.close``, which the wrapper calls when its negotiation ends.
+    """
+
+    def __init__(self, n_workers: Optional[int] = None, mp_context: Any = None):
+        """
+        Args:
+            n_workers: Number of worker processes (defaults to the CPU count)
+            mp_context: ``multiprocessing`` context used to start the workers
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+            for _ in range(n_workers)
+        ]
+        self._load = [0] * n_workers
+        self._lock = threading.Lock()
+
+    @property
+    def n_workers(self) -> int:
+        """Number of worker processes."""
+        return len(self._executors)
+
+    @property
+    def load(self) -> List[int]:
+        """Number of live agents hosted by each worker."""
+        with self._lock:
+            return list(self._load)
+
+    def _acquire(self) -> int:
+        """Reserve a slot on the least loaded worker and return its index."""
+        with self._lock:
+            worker = min(range(len(self._load)), key=self._load.__getitem__)
+            self._load[worker] += 1
+            return worker
+
+    def _release(self, worker: int) -> None:
+        with self._lock:
+            self._load[worker] = max(self._load[worker] - 1, 0)
+
+    @property
+    def hosted(self) -> List[int]:
+        """Number of agents held by each worker process (asks every worker)."""
+        return [self._call(worker, _host_count) for worker in range(self.n_workers)]
+
+    def _submit(self, worker: int, fn, *args) -> Future:
+        """Run ``fn(*args)`` on ``worker`` without waiting for its result."""
+        return self._executors[worker].submit(fn, *args)
+
+    def _call(self, worker: int, fn, *args) -> Any:
+        """Run ``fn(*args)`` on ``worker`` and wait for its result."""
+        return self._submit(worker, fn, *args).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop all workers. Agents still hosted by them are discarded.
+
+        Args:
+            wait: Wait for the workers to exit
+        """
+        for executor in self._executors:
+            executor.shutdown(wait=wait)
+        with self._lock:
+            self._load = [0] * len(self._load)
+
+    def __enter__(self) -> "AgentHostPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+_default_pool: Optional[AgentHostPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_host_pool() -> AgentHostPool:
+    """
+    Shared pool used by wrappers created with ``remote=True``.
+
+    The pool is started on first use, with one worker per CPU, and shut down
+    when the interpreter exits.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = AgentHostPool()
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
+
+
+class RemoteAgent:
+    """
+    Local proxy of a NegoLog agent running in an ``AgentHostPool`` worker.
+
+    Implements the part of the ``AbstractAgent`` interface used by
+    ``NegologNegotiatorWrapper``: ``act``, ``receive_bid`` and ``terminate``,
+    plus ``act_async`` which does not wait for the worker.
+    """
+
+    def __init__(
+        self,
+        pool: Union[bool, AgentHostPool],
+        agent_class: Type[AbstractAgent],
+        ufun: Any,
+        codec: OutcomeBidCodec,
+        issue_names: Sequence[str],
+        reservation_value: float,
+        session_time: int,
+        utility_cache_size: int = 0,
+        reuse_agent_state: bool = False,
+        seed: str = "",
+    ):
+        """
+        Create and initiate the agent in a worker.
+
+        Args:
+            pool: Hosting pool, or True for ``default_host_pool()``
+            agent_class: NegoLog agent class
+            ufun: NegMAS utility function (pickled to the worker)
+            codec: Local codec used to decode the worker's bids
+            issue_names: Name of each issue, in outcome-space order
+            reservation_value: Reservation value of the preference
+            session_time: Session time in seconds for the NegoLog agent
+            utility_cache_size: Memoization size of the worker's adapter
+            reuse_agent_state: Reuse agent snapshots cached by the worker
+            seed: Seed of the random generators of an agent copied from a
+                snapshot
+        """
+        self._pool = default_host_pool() if pool is True else pool
+        self._codec = codec
+        self._pending: List[_BidMessage] = []
+        self._id = uuid.uuid4().hex
+        self._worker: Optional[int] = self._pool._acquire()
+        try:
+            self._pool._call(
+                self._worker,
+                _host_create,
+                self._id,
+                f"{agent_class.__module__}:{agent_class.__qualname__}",
+                _detached(ufun),
+                list(issue_names),
+                codec.outcome_values,
+                reservation_value,
+                session_time,
+                utility_cache_size,
+                reuse_agent_state,
+                seed,
+            )
+        except BaseException:
+            self._pool._release(self._worker)
+            self._worker = None
+            raise
+
+    def receive_bid(self, bid: Bid, t: float) -> None:
+        """Queue the opponent's bid; it is delivered with the next call."""
+        self._pending.append((self._codec.bid_to_indices(bid), bid.utility, t))
+
+    def act_async(self, t: float) -> "Future[Optional[Action]]":
+        """
+        Deliver queued bids and ask the agent for its action without waiting.
+
+        Args:
+            t: Relative time of the action
+
+        Returns:
+            Future of the agent's action
+        """
+        pending, self._pending = self._pending, []
+        reply = self._pool._submit(self._worker, _host_act, self._id, pending, t)
+        action: Future = Future()
+
+        def decode(reply: Future) -> None:
+            try:
+                action.set_result(self._decode(reply.result()))
+            except BaseException as e:
+                action.set_exception(e)
+
+        reply.add_done_callback(decode)
+        return action
+
+    def act(self, t: float) -> Optional[Action]:
+        """Deliver queued bids and wait for the agent's action."""
+        return self.act_async(t).result()
+
+    def _decode(self, message: _ActionMessage) -> Optional[Action]:
+        if message is None:
+            return None
+        is_accept, indices, utility = message
+        bid = self._codec.indices_to_bid(indices, utility)
+        return Accept(bid) if is_accept else Offer(bid)
+
+    def terminate(self, is_accept: bool, opponent_name: str, t: float) -> None:
+        """Deliver queued bids, terminate the agent and free its worker slot."""
+        if self._worker is None:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            self._pool._call(
+                self._worker,
+                _host_terminate,
+                self._id,
+                pending,
+                is_accept,
+                opponent_name,
+                t,
+            )
+        finally:
+            self._pool._release(self._worker)
+            self._worker = None
+
+    def close(self) -> None:
+        """Discard the agent without terminating it and free its worker slot."""
+        worker = getattr(self, "_worker", None)
+        if worker is None:
+            return
+        self._worker = None
+        try:
+            self._pool._submit(worker, _host_discard, self._id)
+        except Exception:
+            # The pool is shut down or broken, the agent went with it
+            pass
+        finally:
+            self._pool._release(worker)
+
+
+def _detached(ufun: Any) -> Any:
+    """Shallow copy of ``ufun`` without its owner, which is not picklable."""
+    if getattr(ufun, "_owner", None) is None:
+        return ufun
+    ufun = copy.copy(ufun)
+    ufun._owner = None
+    return ufun
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+# Agents hosted by this worker process: id -> (agent, codec)
+_HOSTED: Dict[str, Tuple[AbstractAgent, OutcomeBidCodec]] = {}
+
+
+def _host_create(
+    agent_id: str,
+    agent_class: str,
+    ufun: Any,
+    issue_names: List[str],
+    values: Sequence[Sequence[Any]],
+    reservation_value: float,
+    session_time: int,
+    utility_cache_size: int,
+    reuse_agent_state: bool,
+    seed: str,
+) -> None:
+    module_name, _, qualname = agent_class.partition(":")
+    cls: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+
+    codec = OutcomeBidCodec.from_outcome_values(issue_names, values)
+    adapter = NegologPreferenceAdapter(
+        ufun=ufun,
+        issues=list(codec.issues),
+        issue_names=issue_names,
+        reservation_value=reservation_value,
+        codec=codec,
+        utility_cache_size=utility_cache_size,
+    )
+    _HOSTED[agent_id] = (
+        _start_agent(cls, adapter, session_time, reuse_agent_state, seed),
+        codec,
+    )
+
+
+def _deliver(
+    agent: AbstractAgent, codec: OutcomeBidCodec, pending: List[_BidMessage]
+) -> None:
+    for indices, utility, t in pending:
+        agent.receive_bid(codec.indices_to_bid(indices, utility), t)
+
+
+def _host_act(agent_id: str, pending: List[_BidMessage], t: float) -> _ActionMessage:
+    agent, codec = _HOSTED[agent_id]
+    _deliver(agent, codec, pending)
+    action = agent.act(t)
+    if action is None:
+        return None
+    return (
+        isinstance(action, Accept),
+        codec.bid_to_indices(action.bid),
+        action.bid.utility,
+    )
+
+
+def _host_discard(agent_id: str) -> None:
+    _HOSTED.pop(agent_id, None)
+
+
+def _host_count() -> int:
+    return len(_HOSTED)
+
+
+def _host_terminate(
+    agent_id: str,
+    pending: List[_BidMessage],
+    is_accept: bool,
+    opponent_name: str,
+    t: float,
+) -> None:
+    agent, codec = _HOSTED.pop(agent_id)
+    _deliver(agent, codec, pending)
+    agent.terminate(is_accept, opponent_name, t)
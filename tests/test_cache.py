@@ -0,0 +1,320 @@
+"""
+Tests for the process-wide bid-space cache.
+
+These tests verify that:
+1. Adapters built for the same ufun share one sorted bid space
+2. Different ufuns or reserved values do not collide
+3. The memory cap is enforced with LRU eviction
+4. Cached bid spaces give the same negotiation results
+5. Utility memoization evicts, counts hits and preserves utilities
+6. Initiated agents are snapshotted and reused across negotiations
+"""
+
+import numpy as np
+import pytest
+from negmas.outcomes import make_issue, make_os
+from negmas.preferences import LinearAdditiveUtilityFunction
+from negmas.sao import SAOMechanism
+
+from negmas_negolog import (
+    AgentGG,
+    BidSpaceCache,
+    ConcederAgent,
+    CUHKAgent,
+    NegologPreferenceAdapter,
+    UtilityCache,
+    agent_state_cache,
+    bid_space_cache,
+)
+
+# Importing negmas_negolog puts the vendored NegoLog on the path
+from nenv import Issue  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test from an empty cache with the default limits."""
+    max_bytes = bid_space_cache.max_bytes
+    bid_space_cache.clear()
+    yield
+    bid_space_cache.configure(max_bytes=max_bytes)
+    bid_space_cache.clear()
+
+
+@pytest.fixture
+def issues():
+    return [
+        make_issue(values=["low", "medium", "high"], name="price"),
+        make_issue(values=["1", "2", "3"], name="quantity"),
+    ]
+
+
+def make_ufun(issues, reserved_value=0.0, price_weight=0.6, buyer=True):
+    low, high = (1.0, 0.0) if buyer else (0.0, 1.0)
+    return LinearAdditiveUtilityFunction(
+        values={
+            "price": {"low": low, "medium": 0.5, "high": high},
+            "quantity": {"1": high, "2": 0.5, "3": low},
+        },
+        weights={"price": price_weight, "quantity": 1.0 - price_weight},
+        outcome_space=make_os(issues),
+        reserved_value=reserved_value,
+    )
+
+
+def make_adapter(issues, ufun):
+    negolog_issues = [Issue(i.name, list(i.all)) for i in issues]
+    return NegologPreferenceAdapter(
+        ufun=ufun,
+        issues=negolog_issues,
+        issue_names=[i.name for i in issues],
+        reservation_value=ufun.reserved_value,
+    )
+
+
+class TestSharing:
+    """Test that equal ufuns share a cached bid space."""
+
+    def test_second_adapter_hits(self, issues):
+        first = make_adapter(issues, make_ufun(issues)).bids
+        # A distinct but equal ufun object has the same fingerprint
+        second = make_adapter(issues, make_ufun(issues)).bids
+
+        assert bid_space_cache.stats["misses"] == 1
+        assert bid_space_cache.stats["hits"] == 1
+        assert second.indices is first.indices
+        # Bid objects themselves are never shared
+        assert second[0] is not first[0]
+        assert second[0] == first[0]
+
+    def test_different_ufuns_do_not_collide(self, issues):
+        _ = make_adapter(issues, make_ufun(issues)).bids
+        _ = make_adapter(issues, make_ufun(issues, price_weight=0.2)).bids
+        _ = make_adapter(issues, make_ufun(issues, reserved_value=0.3)).bids
+
+        assert bid_space_cache.stats["misses"] == 3
+        assert len(bid_space_cache) == 3
+
+    def test_cached_arrays_are_read_only(self, issues):
+        bids = make_adapter(issues, make_ufun(issues)).bids
+
+        with pytest.raises(ValueError):
+            bids.utilities[0] = 0.0
+
+    def test_negotiation_unchanged_by_cache(self, issues):
+        def run():
+            mechanism = SAOMechanism(issues=issues, n_steps=50)
+            mechanism.add(ConcederAgent(name="a", ufun=make_ufun(issues)))
+            mechanism.add(ConcederAgent(name="b", ufun=make_ufun(issues, buyer=False)))
+            return mechanism.run().agreement
+
+        bid_space_cache.configure(max_bytes=0)
+        uncached = run()
+        bid_space_cache.configure(max_bytes=1024 * 1024)
+        run()
+        assert bid_space_cache.stats["misses"] == 2
+        assert run() == uncached
+        assert bid_space_cache.stats["hits"] == 2
+
+
+class TestLimits:
+    """Test eviction and configuration of BidSpaceCache."""
+
+    def test_lru_eviction(self):
+        cache = BidSpaceCache(max_bytes=2 * 16)
+        for key in "abc":
+            cache.put(key, np.zeros(1, dtype=np.int64), np.zeros(1))
+
+        assert "a" not in cache
+        assert cache.get("b") is not None
+        assert cache.stats["evictions"] == 1
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_oversized_entries_are_skipped(self):
+        cache = BidSpaceCache(max_bytes=8)
+        cache.put("a", np.zeros(4, dtype=np.int64), np.zeros(4))
+
+        assert len(cache) == 0
+
+    def test_disabled_cache(self, issues):
+        bid_space_cache.configure(max_bytes=0)
+        _ = make_adapter(issues, make_ufun(issues)).bids
+
+        assert not bid_space_cache.enabled
+        assert bid_space_cache.stats["misses"] == 0
+        assert len(bid_space_cache) == 0
+
+
+class TestUtilityCache:
+    """Test memoization of ufun evaluations in NegologPreferenceAdapter."""
+
+    @pytest.fixture
+    def counting_ufun(self, issues):
+        from negmas.preferences import MappingUtilityFunction
+
+        os = make_os(issues)
+        outcomes = list(os.enumerate())
+        calls = []
+
+        def evaluate(outcome):
+            calls.append(outcome)
+            return outcomes.index(outcome) / len(outcomes)
+
+        ufun = MappingUtilityFunction(mapping=evaluate, outcome_space=os)
+        return ufun, calls
+
+    def make_memo_adapter(self, issues, ufun, size):
+        negolog_issues = [Issue(i.name, list(i.all)) for i in issues]
+        return NegologPreferenceAdapter(
+            ufun=ufun,
+            issues=negolog_issues,
+            issue_names=[i.name for i in issues],
+            utility_cache_size=size,
+        )
+
+    def test_disabled_by_default(self, issues, counting_ufun):
+        ufun, calls = counting_ufun
+        adapter = make_adapter(issues, ufun)
+        bid = adapter._outcome_to_bid(("low", "1"))
+        adapter.get_utility(bid)
+        adapter.get_utility(bid)
+
+        assert adapter.utility_cache is None
+        assert len(calls) == 3
+
+    def test_repeated_bids_hit(self, issues, counting_ufun):
+        ufun, calls = counting_ufun
+        adapter = self.make_memo_adapter(issues, ufun, size=16)
+        bid = adapter._outcome_to_bid(("low", "1"))
+        utilities = [adapter.get_utility(bid) for _ in range(5)]
+
+        assert len(calls) == 1
+        assert utilities == [bid.utility] * 5
+        assert adapter.utility_cache.stats["hits"] == 5
+        assert adapter.utility_cache.stats["hit_rate"] == pytest.approx(5 / 6)
+
+    def test_lru_eviction(self):
+        cache = UtilityCache(max_entries=2)
+        cache.put((0,), 0.0)
+        cache.put((1,), 1.0)
+        cache.get((0,))
+        cache.put((2,), 2.0)
+
+        assert (1,) not in cache
+        assert cache.get((0,)) == 0.0
+        assert cache.stats["evictions"] == 1
+        assert len(cache) == 2
+
+    def test_wrapper_reports_stats(self, issues):
+        mechanism = SAOMechanism(issues=issues, n_steps=20)
+        negotiator = ConcederAgent(
+            name="a", ufun=make_ufun(issues), utility_cache_size=8
+        )
+        mechanism.add(negotiator)
+        mechanism.add(ConcederAgent(name="b", ufun=make_ufun(issues, buyer=False)))
+        mechanism.run()
+
+        stats = negotiator.utility_cache_stats
+        assert stats is not None
+        assert stats["max_entries"] == 8
+        assert stats["entries"] <= 8
+        assert stats["hits"] + stats["misses"] > 0
+
+
+class TestAgentStateCache:
+    """Test reuse of initiated agents across negotiations."""
+
+    @pytest.fixture(autouse=True)
+    def clean_agent_cache(self):
+        agent_state_cache.clear()
+        yield
+        agent_state_cache.clear()
+
+    def run(self, issues, agent_class, **kwargs):
+        mechanism = SAOMechanism(issues=issues, n_steps=30)
+        negotiator = agent_class(name="a", ufun=make_ufun(issues), **kwargs)
+        mechanism.add(negotiator)
+        mechanism.add(ConcederAgent(name="b", ufun=make_ufun(issues, buyer=False)))
+        mechanism.run()
+        return mechanism
+
+    def test_initiate_runs_once(self, issues, monkeypatch):
+        calls = []
+        original = AgentGG.negolog_agent_class.initiate
+
+        def initiate(agent, opponent_name):
+            calls.append(agent)
+            original(agent, opponent_name)
+
+        monkeypatch.setattr(AgentGG.negolog_agent_class, "initiate", initiate)
+        for _ in range(3):
+            self.run(issues, AgentGG, reuse_agent_state=True)
+
+        assert len(calls) == 1
+        assert agent_state_cache.stats["hits"] == 2
+        assert agent_state_cache.stats["misses"] == 1
+
+    def test_copy_is_bound_to_new_adapter(self, issues):
+        self.run(issues, AgentGG, reuse_agent_state=True)
+
+        mechanism = SAOMechanism(issues=issues, n_steps=30)
+        negotiator = AgentGG(name="a", ufun=make_ufun(issues), reuse_agent_state=True)
+        mechanism.add(negotiator)
+        mechanism.add(ConcederAgent(name="b", ufun=make_ufun(issues, buyer=False)))
+        negotiator._initialize_negolog_agent()
+
+        agent = negotiator._negolog_agent
+        snapshot = next(iter(agent_state_cache._entries.values()))
+        assert agent is not snapshot
+        assert agent.preference is negotiator._preference_adapter
+        assert list(agent.preference.issues) == negotiator._issues
+
+    def test_same_results_with_reuse(self, issues):
+        def agreement(**kwargs):
+            return self.run(issues, ConcederAgent, **kwargs).agreement
+
+        baseline = agreement()
+        assert agreement(reuse_agent_state=True) == baseline
+        assert agreement(reuse_agent_state=True) == baseline
+        assert agent_state_cache.stats["hits"] == 1
+
+    def test_different_ufuns_do_not_share(self, issues):
+        self.run(issues, AgentGG, reuse_agent_state=True)
+        mechanism = SAOMechanism(issues=issues, n_steps=30)
+        mechanism.add(
+            AgentGG(
+                name="a",
+                ufun=make_ufun(issues, price_weight=0.2),
+                reuse_agent_state=True,
+            )
+        )
+        mechanism.add(ConcederAgent(name="b", ufun=make_ufun(issues, buyer=False)))
+        mechanism.run()
+
+        assert agent_state_cache.stats["hits"] == 0
+        assert len(agent_state_cache) == 2
+
+    def test_copies_are_seeded_by_negotiation(self, issues):
+        from negmas_negolog.common import _start_agent
+
+        def draw(seed):
+            agent = _start_agent(
+                CUHKAgent.negolog_agent_class,
+                make_adapter(issues, make_ufun(issues)),
+                180,
+                reuse_agent_state=True,
+                seed=seed,
+            )
+            return [agent.rnd.random() for _ in range(3)]
+
+        draw("first")
+        same, again, other = draw("n1:a"), draw("n1:a"), draw("n2:a")
+
+        assert agent_state_cache.stats["hits"] == 3
+        assert same == again
+        assert same != other
+
+    def test_disabled_by_default(self, issues):
+        self.run(issues, AgentGG)
+
+        assert len(agent_state_cache) == 0
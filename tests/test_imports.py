@@ -0,0 +1,71 @@
+"""
+Tests for the lazy public API of negmas_negolog.
+
+These tests verify that:
+1. Every public name resolves through the lazy module ``__getattr__``
+2. Lazily resolved names are the same objects as in their defining modules
+3. Unknown names still raise AttributeError
+4. Importing one agent does not import the other agents or NegoLog's plotting
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import negmas_negolog
+import negmas_negolog.agents
+
+
+class TestLazyImports:
+    """Test PEP 562 lazy loading in negmas_negolog and negmas_negolog.agents."""
+
+    @pytest.mark.parametrize("name", negmas_negolog.__all__)
+    def test_public_names_resolve(self, name):
+        assert getattr(negmas_negolog, name) is not None
+        assert name in dir(negmas_negolog)
+
+    @pytest.mark.parametrize("name", negmas_negolog.agents.__all__)
+    def test_agents_match_defining_module(self, name):
+        module = importlib.import_module(
+            f"negmas_negolog.agents.{negmas_negolog.agents._AGENT_MODULES[name]}"
+        )
+        cls = getattr(negmas_negolog.agents, name)
+
+        assert cls is getattr(module, name)
+        assert getattr(negmas_negolog, name) is cls
+
+    def test_unknown_names_raise(self):
+        with pytest.raises(AttributeError):
+            _ = negmas_negolog.NotAnAgent
+        with pytest.raises(AttributeError):
+            _ = negmas_negolog.agents.NotAnAgent
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from negmas_negolog.agents import *", namespace)
+
+        assert set(negmas_negolog.agents.__all__) <= set(namespace)
+
+    def test_single_agent_import_loads_only_that_agent(self):
+        """A fresh interpreter importing one agent skips the others and plotting."""
+        code = (
+            "import sys\nfrom negmas_negolog import BoulwareAgent\nprint(*sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = set(result.stdout.split())
+
+        assert {
+            m for m in modules if m.startswith(("agents.", "negmas_negolog.agents."))
+        } == {
+            "agents.boulware",
+            "agents.boulware.Boulware",
+            "negmas_negolog.agents.boulware",
+        }
+        assert not modules & {"matplotlib.pyplot", "seaborn"}
@@ -6,6 +6,7 @@ These tests verify that:
 2. Agents can be queried by tags and properties
 3. NL-prefixed names correctly avoid conflicts with Genius agents
 4. Registry metadata is accurate
+5. Registration is metadata-only: classes are imported on first access
 """
 
 import pytest
@@ -86,16 +87,16 @@ class TestRegistration:
         ]
 
         for agent_cls in agents:
-            assert negotiator_registry.is_registered(
-                agent_cls
-            ), f"{agent_cls.__name__} is not registered"
+            assert negotiator_registry.is_registered(agent_cls), (
+                f"{agent_cls.__name__} is not registered"
+            )
 
     def test_negolog_tag_count(self):
         """Verify the correct number of agents have the 'negolog' tag."""
         negolog_agents = negotiator_registry.query_by_tag("negolog")
-        assert (
-            len(negolog_agents) == 25
-        ), f"Expected 25 agents, got {len(negolog_agents)}"
+        assert len(negolog_agents) == 25, (
+            f"Expected 25 agents, got {len(negolog_agents)}"
+        )
 
 
 class TestNamingConvention:
@@ -164,17 +165,17 @@ class TestNamingConvention:
             # At minimum, negolog should exist
             assert len(negolog_infos) > 0, f"NegoLog {negolog_name} not found"
             negolog_info = negolog_infos[0]
-            assert negolog_info.has_tag(
-                "negolog"
-            ), f"{negolog_name} missing 'negolog' tag"
+            assert negolog_info.has_tag("negolog"), (
+                f"{negolog_name} missing 'negolog' tag"
+            )
 
             # If genius version exists, they should be different classes
             if len(genius_infos) > 0:
                 genius_info = genius_infos[0]
                 assert genius_info.cls is not negolog_info.cls
-                assert genius_info.has_tag(
-                    "genius"
-                ), f"{genius_name} missing 'genius' tag"
+                assert genius_info.has_tag("genius"), (
+                    f"{genius_name} missing 'genius' tag"
+                )
 
 
 class TestMetadata:
@@ -185,9 +186,9 @@ class TestMetadata:
         negolog_agents = negotiator_registry.query_by_tag("negolog")
 
         for name, info in negolog_agents.items():
-            assert info.has_tag(
-                "bilateral-only"
-            ), f"{name} should have 'bilateral-only' tag"
+            assert info.has_tag("bilateral-only"), (
+                f"{name} should have 'bilateral-only' tag"
+            )
 
     def test_base_tags_present(self):
         """All negolog agents should have the base tags."""
@@ -220,9 +221,9 @@ class TestMetadata:
             infos = negotiator_registry.get_by_short_name(name)
             assert len(infos) > 0, f"{name} not found"
             info = infos[0]
-            assert info.has_tag(
-                expected_tag
-            ), f"{name} should have tag '{expected_tag}', got tags: {info.tags}"
+            assert info.has_tag(expected_tag), (
+                f"{name} should have tag '{expected_tag}', got tags: {info.tags}"
+            )
 
     def test_time_based_agents_tagged(self):
         """Time-based agents should have the 'time-based' tag."""
@@ -239,9 +240,9 @@ class TestMetadata:
         negolog_agents = negotiator_registry.query_by_tag("negolog")
 
         for name, info in negolog_agents.items():
-            assert (
-                info.source == "negolog"
-            ), f"{name} should have source='negolog', got '{info.source}'"
+            assert info.source == "negolog", (
+                f"{name} should have source='negolog', got '{info.source}'"
+            )
 
 
 class TestQueries:
@@ -284,9 +285,9 @@ class TestQueries:
 
         found_names = [info.short_name for info in freq_agents.values()]
         for name in expected_freq_agents:
-            assert (
-                name in found_names
-            ), f"{name} should be in frequency-based agents query"
+            assert name in found_names, (
+                f"{name} should be in frequency-based agents query"
+            )
 
     def test_exclude_genius_query(self):
         """Query negolog agents excluding genius."""
@@ -337,3 +338,68 @@ class TestGetClass:
         assert info.has_tag("negolog")
         assert info.has_tag("time-based")
         assert info.source == "negolog"
+
+
+class TestLazyRegistration:
+    """Test that registration does not import the agent wrappers."""
+
+    def test_query_does_not_import_agents(self):
+        """Querying the registry in a fresh interpreter imports no agent module."""
+        import subprocess
+        import sys
+        import textwrap
+
+        code = textwrap.dedent(
+            """
+            import sys
+            import negmas_negolog
+            from negmas.registry import negotiator_registry
+
+            agents = negotiator_registry.query(tags={"negolog"})
+            assert len(agents) == 25, len(agents)
+            loaded = [m for m in sys.modules if m.startswith("negmas_negolog.agents.")]
+            assert not loaded, loaded
+            assert "nenv" not in sys.modules
+
+            cls = negotiator_registry.get_class("NLIAMhaggler")
+            assert cls.__name__ == "IAMhaggler"
+            assert "negmas_negolog.agents.iamhaggler" in sys.modules
+            assert negotiator_registry.is_registered(cls)
+            """
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_fresh_registry(self, monkeypatch, lazy):
+        """Lazy and eager registration produce the same entries."""
+        import negmas.registry
+        from negmas.registry import NegotiatorInfo, Registry
+
+        from negmas_negolog import HardHeaded, registry_init
+
+        registry = Registry(NegotiatorInfo)
+        monkeypatch.setattr(negmas.registry, "negotiator_registry", registry)
+        registry_init._register_negolog_agents(lazy=lazy)
+
+        assert len(registry.query(tags={"negolog"})) == 25
+        assert registry.is_registered(HardHeaded)
+        assert registry.get_class("NLHardHeaded") is HardHeaded
+        assert registry.create("NLHardHeaded").__class__ is HardHeaded
+
+    def test_falls_back_to_eager_registration(self, monkeypatch):
+        """Registry internals unusable for lazy entries fall back to register."""
+        import negmas.registry
+        from negmas.registry import NegotiatorInfo, Registry
+
+        from negmas_negolog import HardHeaded, registry_init
+
+        def unsupported(info_class):
+            raise TypeError("unexpected registry info fields")
+
+        registry = Registry(NegotiatorInfo)
+        monkeypatch.setattr(negmas.registry, "negotiator_registry", registry)
+        monkeypatch.setattr(registry_init, "_lazy_info_class", unsupported)
+        registry_init._register_negolog_agents()
+
+        assert len(registry.query(tags={"negolog"})) == 25
+        assert registry.get_class("NLHardHeaded") is HardHeaded
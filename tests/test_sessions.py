@@ -0,0 +1,356 @@
+"""
+Tests for running native NegoLog sessions.
+
+These tests verify that:
+1. Every timeout backend returns values, reports timeouts and exceptions
+2. Sessions give the same results with every timeout backend
+3. Inline sessions account for errors and timeouts like the other modes
+4. Virtual clocks make time-based deadlines independent of the wall clock
+5. Parallel tournaments log the same results as sequential ones
+6. Resumed tournaments skip the sessions in the journal
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add vendored NegoLog to path (bundled inside the package so it ships in the wheel)
+NEGOLOG_PATH = (
+    Path(__file__).parent.parent / "src" / "negmas_negolog" / "_vendor" / "NegoLog"
+)
+if str(NEGOLOG_PATH) not in sys.path:
+    sys.path.insert(0, str(NEGOLOG_PATH))
+
+from nenv import EditablePreference, Session  # noqa: E402
+from nenv.utils import (  # noqa: E402
+    TIMEOUT_BACKENDS,
+    ProcessManager,
+    TimeoutBackend,
+    VirtualClock,
+    session_operation,
+)
+
+from agents.boulware.Boulware import BoulwareAgent  # noqa: E402
+from agents.conceder.Conceder import ConcederAgent  # noqa: E402
+from agents.RandomDance.RandomDance import RandomDance  # noqa: E402
+
+
+def make_preferences():
+    issues = {
+        "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+        "b": {"x": 0.0, "y": 0.4, "z": 1.0},
+    }
+    pref_a = EditablePreference({"a": 0.6, "b": 0.4}, issues)
+    pref_b = EditablePreference(
+        {"a": 0.4, "b": 0.6},
+        {name: dict(zip(v, reversed(list(v.values())))) for name, v in issues.items()},
+    )
+    return pref_a, pref_b
+
+
+def make_session(
+    tmp_path,
+    agent_b_class=ConcederAgent,
+    deadline_time=None,
+    deadline_round=50,
+    **kwargs,
+):
+    pref_a, pref_b = make_preferences()
+    deadline = deadline_round if deadline_time is None else deadline_time
+    return Session(
+        BoulwareAgent(pref_a, deadline, []),
+        agent_b_class(pref_b, deadline, []),
+        str(tmp_path / "session.xlsx"),
+        deadline_time,
+        deadline_round,
+        [],
+        **kwargs,
+    )
+
+
+def run_session(tmp_path, **kwargs):
+    return make_session(tmp_path, **kwargs).start()["TournamentResults"]
+
+
+class FailingAgent(ConcederAgent):
+    def act(self, t):
+        raise RuntimeError("agent failure")
+
+
+class SlowAgent(ConcederAgent):
+    def act(self, t):
+        time.sleep(0.05)
+        return super().act(t)
+
+
+class BusyAgent:
+    def act(self, t):
+        end = time.thread_time() + 0.05
+        while time.thread_time() < end:
+            pass
+
+
+def add(values, value):
+    values.append(value)
+    return sum(values)
+
+
+def fail():
+    raise ValueError("failed")
+
+
+def spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestTimeoutBackends:
+    """Test the ways the process manager enforces timeouts."""
+
+    @pytest.mark.parametrize("backend", sorted(TIMEOUT_BACKENDS))
+    def test_returns_value_and_arguments(self, backend):
+        manager = ProcessManager(backend)
+        try:
+            assert manager.run(add, 5.0, {"values": [1, 2], "value": 3}) == 6
+            assert manager.args["values"] == [1, 2, 3]
+            assert not manager.time_outed and not manager.has_exception
+        finally:
+            manager.close()
+
+    @pytest.mark.parametrize("backend", ["thread", "signal", "process"])
+    def test_reports_exceptions(self, backend):
+        manager = ProcessManager(backend)
+        try:
+            assert manager.run(fail, 5.0) is None
+            assert manager.has_exception
+            assert isinstance(manager.exception, ValueError)
+        finally:
+            manager.close()
+
+    @pytest.mark.parametrize("backend", sorted(TIMEOUT_BACKENDS))
+    def test_reports_timeouts(self, backend):
+        manager = ProcessManager(backend)
+        try:
+            start = time.perf_counter()
+            # A timed-out call keeps running under the "thread" backend
+            manager.run(spin, 0.2, [0.5] if backend == "thread" else [30])
+            assert manager.time_outed
+            assert time.perf_counter() - start < 10
+        finally:
+            manager.close()
+
+    def test_backends_must_implement_run(self):
+        class Incomplete(TimeoutBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    @pytest.mark.parametrize("backend", ["thread", "signal", "process"])
+    def test_session_results_match(self, backend, tmp_path):
+        expected = run_session(tmp_path)
+        result = run_session(tmp_path, timeout_backend=backend)
+
+        for key in ["Result", "Round", "AgentAUtility", "AgentBUtility"]:
+            assert result[key] == expected[key]
+
+
+class TestInlineSessions:
+    """Test sessions calling the agents without the process manager."""
+
+    def test_results_match(self, tmp_path):
+        expected = run_session(tmp_path)
+        result = run_session(tmp_path, timeout_backend="inline")
+
+        for key in ["Result", "Round", "AgentAUtility", "AgentBUtility"]:
+            assert result[key] == expected[key]
+
+    def test_exceptions_end_the_session(self, tmp_path):
+        session = make_session(tmp_path, FailingAgent, timeout_backend="inline")
+        result = session.start()["TournamentResults"]
+
+        assert result["Result"] == "Error"
+        assert result["Who"] == "B"
+
+    def test_slow_calls_time_out(self, tmp_path):
+        session = make_session(tmp_path, SlowAgent, timeout_backend="inline")
+        session.time_out = 0.01
+        result = session.start()["TournamentResults"]
+
+        assert result["Result"] == "TimedOut"
+        assert result["Who"] == "B"
+
+
+class TestVirtualClock:
+    """Test time-based deadlines measured by a virtual clock."""
+
+    def test_fixed_costs_are_reproducible(self, tmp_path):
+        results = [
+            make_session(
+                tmp_path,
+                deadline_time=1,
+                deadline_round=None,
+                clock=VirtualClock({"Act": 0.01}),
+            ).start()["TournamentResults"]
+            for _ in range(2)
+        ]
+
+        for key in ["Result", "Round", "AgentAUtility", "AgentBUtility", "ElapsedTime"]:
+            assert results[0][key] == results[1][key]
+        # Each action advances the clock by 10ms, so at most 50 rounds fit in 1s
+        assert results[0]["Round"] <= 50
+        assert round(results[0]["ElapsedTime"] / 0.01, 6).is_integer()
+
+    def test_cpu_time_ignores_waiting(self, tmp_path):
+        session = make_session(
+            tmp_path,
+            SlowAgent,
+            deadline_time=1,
+            deadline_round=30,
+            timeout_backend="inline",
+            clock="virtual",
+        )
+        start = time.perf_counter()
+        result = session.start()["TournamentResults"]
+        wall_time = time.perf_counter() - start
+
+        # The agent sleeps longer than the time-based deadline, without using the CPU
+        assert wall_time > 1
+        assert result["ElapsedTime"] < wall_time / 2
+        assert result["Result"] != "TimedOut"
+
+    def test_unknown_clock(self, tmp_path):
+        with pytest.raises(AssertionError):
+            make_session(tmp_path, clock="sundial")
+
+    @pytest.mark.parametrize("backend", sorted(TIMEOUT_BACKENDS))
+    def test_measures_cpu_time_in_the_running_thread(self, backend):
+        manager = ProcessManager(backend)
+        args = {"agent": BusyAgent(), "process_name": "Act", "cpu_time": [], "t": 0.0}
+        try:
+            manager.run(session_operation, 5.0, args)
+        finally:
+            manager.close()
+
+        # Also measured when the operation runs in a child process
+        (cpu_time,) = manager.args["cpu_time"]
+        assert 0.05 <= cpu_time < 1
+
+
+@pytest.fixture
+def domains(tmp_path, monkeypatch):
+    for name, weight in [("0", 0.7), ("1", 0.4)]:
+        domain_dir = tmp_path / "domains" / f"domain{name}"
+        domain_dir.mkdir(parents=True)
+        for profile, profile_weight in [("profileA", weight), ("profileB", 1 - weight)]:
+            (domain_dir / f"{profile}.json").write_text(
+                json.dumps(
+                    {
+                        "reservationValue": 0.0,
+                        "issueWeights": {"a": profile_weight, "b": 1 - profile_weight},
+                        "issues": {
+                            "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+                            "b": {"x": 0.0, "y": 0.4, "z": 1.0},
+                        },
+                    }
+                )
+            )
+    pd.DataFrame({"DomainName": ["0", "1"], "Size": [9, 9]}).to_excel(
+        tmp_path / "domains" / "domains.xlsx", sheet_name="domains"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys.modules["nenv.Tournament"], "open_folder", lambda path: None
+    )
+
+
+def run_tournament(result_dir, **kwargs):
+    from nenv.Tournament import Tournament
+
+    tournament = Tournament(
+        [BoulwareAgent, ConcederAgent, RandomDance],
+        ["0", "1"],
+        [],
+        [],
+        None,
+        30,
+        result_dir=result_dir,
+        seed=11,
+        **kwargs,
+    )
+    tournament.run()
+    results = pd.read_excel(
+        f"{result_dir}/results.xlsx", sheet_name="TournamentResults"
+    )
+    return tournament, results.drop(
+        columns=["SessionRealTime", "FilePath", "ElapsedTime"]
+    )
+
+
+class TestParallelTournament:
+    """Test tournaments running the sessions in worker processes."""
+
+    def test_results_do_not_depend_on_workers(self, domains):
+        _, sequential = run_tournament("sequential/")
+        tournament, parallel = run_tournament("parallel/", workers=2)
+
+        assert len(parallel) == 12
+        pd.testing.assert_frame_equal(sequential, parallel)
+        assert tournament.tournament_process.completed_number_of_sessions == 12
+        assert tournament.tournament_process.number_of_workers == 2
+
+
+class TestResumableTournament:
+    """Test resuming tournaments from the journal of completed sessions."""
+
+    def test_resume_skips_journaled_sessions(self, domains, monkeypatch):
+        _, expected = run_tournament("results/")
+
+        # Keep five sessions and a partially written line, as after a crash
+        journal = Path("results/journal.jsonl")
+        lines = journal.read_text().splitlines(keepends=True)
+        assert len(lines) == 12
+        journal.write_text("".join(lines[:5]) + lines[5][:20])
+
+        module = sys.modules["nenv.Tournament"]
+        run_session = module.run_session
+        calls = []
+
+        def counting_run_session(task, domain_cache=None):
+            calls.append(task[0])
+            return run_session(task, domain_cache)
+
+        monkeypatch.setattr(module, "run_session", counting_run_session)
+        _, resumed = run_tournament("results/", resume=True)
+
+        assert calls == list(range(5, 12))
+        pd.testing.assert_frame_equal(expected, resumed)
+        assert len(journal.read_text().splitlines()) == 12
+
+    def test_journal_rebuilds_bids(self, tmp_path):
+        """Bids in a journaled log row are loaded back as equal Bid objects."""
+        from nenv import Bid, Issue
+        from nenv.utils.TournamentJournal import TournamentJournal
+
+        issue = Issue("Color", ["Red", "Blue"])
+        bid = Bid({issue: "Blue"}, 0.75)
+        journal = TournamentJournal(str(tmp_path / "journal.jsonl"))
+        journal.append(("A", "B", "Domain1", 0), {"Offer": bid}, ["A", "B"], [], 1.0)
+
+        loaded = journal.load()[("A", "B", "Domain1", 0)]["log"]["Offer"]
+
+        assert isinstance(loaded, Bid)
+        assert loaded == bid
+        assert loaded.utility == 0.75
+        assert str(loaded) == str(bid)
+
+    def test_without_resume_the_journal_is_reset(self, domains):
+        run_tournament("results/")
+        run_tournament("results/")
+
+        assert len(Path("results/journal.jsonl").read_text().splitlines()) == 12
@@ -8,16 +8,20 @@ These tests verify that:
 4. Preference adapter correctly evaluates utilities
 """
 
+import random
+
+import numpy as np
 import pytest
 from negmas.outcomes import make_issue, make_os
 from negmas.preferences import LinearAdditiveUtilityFunction
-from negmas.sao import SAOMechanism
+from negmas.sao import ResponseType, SAOMechanism
 
 from negmas_negolog import (
     BoulwareAgent,
     ConcederAgent,
     LinearAgent,
     NiceTitForTat,
+    OutcomeBidCodec,
 )
 
 
@@ -406,3 +410,955 @@ class TestNegoLogVsNegMAS:
         assert state is not None
         assert state.started
         assert state.ended
+
+
+class TestOutcomeBidCodec:
+    """Test the index-based outcome/bid codec."""
+
+    def test_round_trip(self, simple_issues, buyer_ufun):
+        """Outcomes survive an outcome -> bid -> outcome round trip."""
+        from nenv import Issue
+
+        issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+        codec = OutcomeBidCodec(issues)
+
+        for outcome in make_os(simple_issues).enumerate():
+            bid = codec.outcome_to_bid(outcome)
+            assert codec.bid_to_outcome(bid) == outcome
+            assert codec.indices_to_outcome(codec.bid_to_indices(bid)) == outcome
+
+    def test_non_string_values_are_restored(self):
+        """Bids hold strings, but outcomes keep the original NegMAS values."""
+        from nenv import Issue
+
+        issues = [Issue("quantity", ["1", "2", "3"]), Issue("color", ["red", "blue"])]
+        codec = OutcomeBidCodec(issues, [[1, 2, 3], ["red", "blue"]])
+
+        bid = codec.outcome_to_bid((3, "blue"))
+        assert bid[issues[0]] == "3"
+        assert codec.bid_to_outcome(bid) == (3, "blue")
+        assert codec.outcome_to_indices((3, "blue")) == (2, 1)
+
+    def test_unknown_value_raises(self):
+        """Values outside the outcome space are reported clearly."""
+        from nenv import Issue
+
+        codec = OutcomeBidCodec([Issue("color", ["red", "blue"])])
+        with pytest.raises(ValueError):
+            codec.outcome_to_indices(("green",))
+
+    def test_integer_issues_negotiation(self):
+        """Wrappers propose valid outcomes on integer-valued issues."""
+        issues = [
+            make_issue(values=[1, 2, 3], name="quantity"),
+            make_issue(values=[10, 20], name="price"),
+        ]
+        os = make_os(issues)
+        ufun_a = LinearAdditiveUtilityFunction(
+            values={"quantity": {1: 0.0, 2: 0.5, 3: 1.0}, "price": {10: 0.0, 20: 1.0}},
+            weights={"quantity": 0.5, "price": 0.5},
+            outcome_space=os,
+        )
+        ufun_b = LinearAdditiveUtilityFunction(
+            values={"quantity": {1: 1.0, 2: 0.5, 3: 0.0}, "price": {10: 1.0, 20: 0.0}},
+            weights={"quantity": 0.5, "price": 0.5},
+            outcome_space=os,
+        )
+
+        mechanism = SAOMechanism(issues=issues, n_steps=50)
+        mechanism.add(ConcederAgent(name="a", ufun=ufun_a))
+        mechanism.add(ConcederAgent(name="b", ufun=ufun_b))
+        state = mechanism.run()
+
+        assert state.ended
+        for _, _, offer in mechanism.extended_trace:
+            assert offer in list(os.enumerate())
+
+
+class TestPreferenceAdapterBids:
+    """Test the vectorized bid space of NegologPreferenceAdapter."""
+
+    @pytest.fixture
+    def adapter(self, simple_issues, buyer_ufun):
+        from nenv import Issue
+
+        from negmas_negolog import NegologPreferenceAdapter
+
+        issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+        return NegologPreferenceAdapter(
+            ufun=buyer_ufun, issues=issues, issue_names=[i.name for i in issues]
+        )
+
+    def test_bids_sorted_and_complete(self, adapter, simple_issues):
+        """All outcomes are present, sorted by descending utility."""
+        bids = adapter.bids
+
+        assert len(bids) == make_os(simple_issues).cardinality
+        utilities = [bid.utility for bid in bids]
+        assert utilities == sorted(utilities, reverse=True)
+        assert len({str(bid) for bid in bids}) == len(bids)
+
+    def test_batched_utilities_match_ufun(self, adapter, buyer_ufun):
+        """Batched utilities are identical to calling the NegMAS ufun."""
+        for bid in adapter.bids:
+            assert bid.utility == float(buyer_ufun(adapter._bid_to_outcome(bid)))
+
+    def test_bids_are_materialized_lazily(self, adapter):
+        """Only the accessed bids are turned into Bid objects."""
+        bids = adapter.bids
+        _ = bids[0], bids[-1]
+
+        assert sum(bid is not None for bid in bids._bids) == 2
+        assert bids[0] is bids[0]
+
+    def test_non_additive_ufun_falls_back(self, simple_issues, outcome_space):
+        """Ufuns without weights/values are evaluated outcome by outcome."""
+        from negmas.preferences import MappingUtilityFunction
+        from nenv import Issue
+
+        from negmas_negolog import NegologPreferenceAdapter
+
+        mapping = {o: float(i) for i, o in enumerate(outcome_space.enumerate())}
+        ufun = MappingUtilityFunction(mapping=mapping, outcome_space=outcome_space)
+        issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+        adapter = NegologPreferenceAdapter(
+            ufun=ufun, issues=issues, issue_names=[i.name for i in issues]
+        )
+
+        assert adapter.bids[0].utility == max(mapping.values())
+        assert adapter._bid_to_outcome(adapter.bids[-1]) == min(
+            mapping, key=mapping.get
+        )
+
+
+class TestCompactBid:
+    """Test the index-encoded NegoLog Bid and its dictionary view."""
+
+    @pytest.fixture
+    def issues(self):
+        from nenv import Issue
+
+        return [Issue("price", ["low", "high"]), Issue("color", ["red", "blue"])]
+
+    def test_equal_bids_share_encoding_and_hash(self, issues):
+        from nenv import Bid
+
+        a = Bid({issues[0]: "low", issues[1]: "blue"})
+        b = Bid({issues[0]: "low", issues[1]: "blue"}, 0.5)
+
+        assert a.domain is b.domain
+        assert a.indices == b.indices == (0, 1)
+        assert a == b and hash(a) == hash(b)
+        assert len({a, b}) == 1
+        assert a == {issues[0]: "low", issues[1]: "blue"}
+
+    def test_content_view_behaves_like_dict(self, issues):
+        from nenv import Bid
+
+        bid = Bid({issues[0]: "low", issues[1]: "blue"})
+        content = bid.content
+
+        assert content["price"] == bid["price"] == "low"
+        assert list(content.keys()) == issues
+        assert content.copy() == {issues[0]: "low", issues[1]: "blue"}
+        assert str(bid) == str({issues[0]: "low", issues[1]: "blue"})
+        assert list(bid) == [(issues[0], "low"), (issues[1], "blue")]
+
+        old_hash = hash(bid)
+        content[issues[0]] = "high"
+        assert bid.indices == (1, 1)
+        assert hash(bid) != old_hash
+        assert bid == Bid({issues[0]: "high", issues[1]: "blue"})
+
+    def test_unknown_values_and_issues(self, issues):
+        from nenv import Bid
+
+        bid = Bid({issues[0]: "free", issues[1]: "red"})
+        assert bid["price"] == "free"
+
+        bid["size"] = "large"
+        assert len(bid.content) == 3
+        assert bid["size"] == "large"
+
+    def test_copy_and_pickle(self, issues):
+        import copy
+        import pickle
+
+        from nenv import Bid
+
+        bid = Bid({issues[0]: "high", issues[1]: "red"}, 0.3)
+        for clone in [bid.copy(), copy.deepcopy(bid), pickle.loads(pickle.dumps(bid))]:
+            assert clone == bid and hash(clone) == hash(bid)
+            assert clone.utility == 0.3
+        assert bid.copy_without_utility().utility == -1
+
+
+class TestBatchUtilities:
+    """Test the array-backed utility engine of NegoLog preferences."""
+
+    @pytest.fixture
+    def preference(self):
+        import random
+
+        from nenv import EditablePreference
+
+        rng = random.Random(7)
+        return EditablePreference(
+            issue_weights={f"i{i}": rng.random() for i in range(4)},
+            issues={
+                f"i{i}": {f"v{j}": rng.random() for j in range(2 + i)} for i in range(4)
+            },
+        )
+
+    def test_matches_scalar_utilities(self, preference):
+        from nenv.OpponentModel import EstimatedPreference
+
+        for pref in [preference, EstimatedPreference(preference)]:
+            expected = [pref.get_utility(bid) for bid in preference.bids]
+            assert pref.get_utilities(preference.bid_indices).tolist() == expected
+
+        assert preference.bid_utilities.tolist() == [
+            bid.utility for bid in preference.bids
+        ]
+        assert preference.get_index_matrix(preference.bids[:3]).tolist() == [
+            list(bid.indices) for bid in preference.bids[:3]
+        ]
+
+    def test_bids_generated_in_batch(self, preference):
+        import itertools
+
+        from nenv import Bid
+
+        issues = preference.issues
+        # Original generation order (first issue varies fastest), stably sorted
+        expected = [
+            Bid(dict(zip(issues, values[::-1])))
+            for values in itertools.product(*[i.values for i in reversed(issues)])
+        ]
+        for bid in expected:
+            bid.utility = preference.get_utility(bid)
+        expected = sorted(expected, reverse=True)
+
+        bids = preference.bids
+        assert len(bids) == len(expected) == 2 * 3 * 4 * 5
+        assert [bid.content.copy() for bid in bids] == [
+            bid.content.copy() for bid in expected
+        ]
+        assert bids.utilities.tolist() == [bid.utility for bid in expected]
+
+    def test_weight_arrays_follow_updates(self, preference):
+        issue = preference.issues[1]
+        preference[issue, issue.values[0]] = 0.25
+
+        assert preference.value_weight_matrix[1, 0] == 0.25
+        assert preference.value_weight_matrix.shape == (4, 5)
+        assert preference.issue_weight_vector.tolist() == [
+            preference[i] for i in preference.issues
+        ]
+
+    def test_adapter_matches_ufun(self, simple_issues, buyer_ufun):
+        from nenv import Issue
+
+        from negmas_negolog import NegologPreferenceAdapter
+
+        issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+        adapter = NegologPreferenceAdapter(
+            ufun=buyer_ufun, issues=issues, issue_names=[i.name for i in issues]
+        )
+
+        assert np.array_equal(
+            adapter.get_utilities(adapter.bid_indices), adapter.bid_utilities
+        )
+
+    def test_range_queries_match_linear_search(self):
+        import random
+
+        from nenv import EditablePreference
+
+        # Coarse weights make many bids share a utility
+        preference = EditablePreference(
+            issue_weights={"a": 0.5, "b": 0.25, "c": 0.25},
+            issues={
+                "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+                "b": {"x": 1.0, "y": 0.5, "z": 0.5, "w": 0.0},
+                "c": {"x": 1.0, "y": 0.0},
+            },
+        )
+        utilities = [bid.utility for bid in preference.bids]
+
+        def closest(target):
+            # Binary search of the original implementation
+            if target >= utilities[0]:
+                return 0
+            if target <= utilities[-1]:
+                return len(utilities) - 1
+            low, high = 0, len(utilities) - 1
+            while low <= high:
+                mid = (high + low) // 2
+                if target < utilities[mid]:
+                    low = mid + 1
+                elif target > utilities[mid]:
+                    high = mid - 1
+                else:
+                    return mid
+            if abs(utilities[low] - target) < abs(utilities[high] - target):
+                return low
+            return high
+
+        rng = random.Random(3)
+        targets = sorted(set(utilities)) + [rng.random() for _ in range(50)]
+        for target in targets:
+            assert preference.get_bid_at(target) is preference.bids[closest(target)]
+
+        for lower, upper in [(0.0, 1.0), (0.25, 0.75), (0.5, 0.5), (0.3, 0.6)]:
+            low, up = closest(lower), closest(upper)
+            while up >= 1 and utilities[up] == utilities[up - 1]:
+                up -= 1
+            while low < len(utilities) - 2 and utilities[low] == utilities[low + 1]:
+                low += 1
+
+            bids = preference.get_bids_at_range(lower, upper)
+            assert list(bids) == preference.bids[up : low + 1]
+            assert bids[0] is preference.bids[up]
+            assert np.shares_memory(bids.utilities, preference.bids.utilities)
+
+
+class TestBidSpaceFileCache:
+    """Test the on-disk bid space cache of NegoLog preferences."""
+
+    @pytest.fixture
+    def profile_path(self, tmp_path):
+        import json
+
+        path = tmp_path / "profile.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "reservationValue": 0.1,
+                    "issueWeights": {"a": 0.5, "b": 0.3, "c": 0.2},
+                    "issues": {
+                        "a": {"x": 1.0, "y": 0.4, "z": 0.0},
+                        "b": {"x": 0.0, "y": 1.0},
+                        "c": {"x": 0.2, "y": 1.0, "z": 0.5, "w": 0.0},
+                    },
+                }
+            )
+        )
+        return str(path)
+
+    def test_cached_bids_are_memory_mapped(self, profile_path, tmp_path, monkeypatch):
+        from nenv import Preference
+
+        expected = Preference(profile_path)
+
+        monkeypatch.setattr(Preference, "bid_cache_dir", str(tmp_path / "cache"))
+        generated = Preference(profile_path)
+        loaded = Preference(profile_path)
+
+        assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+        for pref in [generated, loaded]:
+            assert isinstance(pref.bids.utilities, np.memmap)
+            assert not pref.bids.utilities.flags.writeable
+            assert np.array_equal(pref.bid_indices, expected.bid_indices)
+            assert pref.bid_utilities.tolist() == expected.bid_utilities.tolist()
+            assert pref.get_bid_at(0.5) == expected.get_bid_at(0.5)
+
+    def test_changed_profile_is_not_served_from_cache(
+        self, profile_path, tmp_path, monkeypatch
+    ):
+        import json
+
+        from nenv import Preference
+
+        monkeypatch.setattr(Preference, "bid_cache_dir", str(tmp_path / "cache"))
+        first = Preference(profile_path)
+
+        with open(profile_path) as f:
+            data = json.load(f)
+        data["issueWeights"] = {"a": 0.2, "b": 0.3, "c": 0.5}
+        with open(profile_path, "w") as f:
+            json.dump(data, f)
+        second = Preference(profile_path)
+
+        assert second.bid_utilities.tolist() == [
+            second.get_utility(bid) for bid in second.bids
+        ]
+        assert first.bid_utilities.tolist() != second.bid_utilities.tolist()
+        assert len(list((tmp_path / "cache").glob("*.npy"))) == 4
+
+
+class TestDomainCache:
+    """Test the parsed-domain cache of NegoLog sessions."""
+
+    @pytest.fixture
+    def domains(self, tmp_path, monkeypatch):
+        import json
+
+        for name in ["0", "1"]:
+            domain_dir = tmp_path / "domains" / f"domain{name}"
+            domain_dir.mkdir(parents=True)
+            for profile, weight in [("profileA", 0.7), ("profileB", 0.3)]:
+                (domain_dir / f"{profile}.json").write_text(
+                    json.dumps(
+                        {
+                            "reservationValue": 0.0,
+                            "issueWeights": {"a": weight, "b": 1.0 - weight},
+                            "issues": {
+                                "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+                                "b": {"x": 0.0, "y": 1.0},
+                            },
+                        }
+                    )
+                )
+        monkeypatch.chdir(tmp_path)
+
+    def test_sessions_get_isolated_copies(self, domains):
+        from nenv import domain_loader
+        from nenv.DomainCache import DomainCache
+
+        cache = DomainCache()
+        first_a, first_b = cache.load("0")
+        second_a, _ = cache.load("0")
+        expected_a, expected_b = domain_loader("0")
+
+        assert first_a is not second_a
+        assert np.shares_memory(first_a.bid_utilities, second_a.bid_utilities)
+        assert first_a.bids[0] is not second_a.bids[0]
+        assert first_a.bid_utilities.tolist() == expected_a.bid_utilities.tolist()
+        assert first_b.bid_utilities.tolist() == expected_b.bid_utilities.tolist()
+
+        issue = first_a.issues[0]
+        first_a._issue_weights[issue] = 0.0
+        first_a._value_weights[issue]["x"] = 0.0
+        first_a.bids[0].utility = -1.0
+
+        third_a, _ = cache.load("0")
+        assert third_a.issue_weights[issue] == 0.7
+        assert third_a.value_weights[issue]["x"] == 1.0
+        assert third_a.bids[0].utility == expected_a.bids[0].utility
+        assert not third_a.bid_utilities.flags.writeable
+
+    def test_cache_is_bounded(self, domains):
+        from nenv.DomainCache import DomainCache
+
+        cache = DomainCache(max_size=1)
+        cache.load("0")
+        cache.load("1")
+
+        assert len(cache) == 1
+        assert "1" in cache and "0" not in cache
+
+
+class TestSharedDomainObjects:
+    """Test the read-only domain accessors and the in-memory copy of preferences."""
+
+    @pytest.fixture
+    def preference(self):
+        from nenv import EditablePreference
+
+        return EditablePreference(
+            issue_weights={"a": 0.6, "b": 0.4},
+            issues={"a": {"x": 1.0, "y": 0.0}, "b": {"x": 0.3, "y": 1.0, "z": 0.6}},
+        )
+
+    def test_accessors_return_shared_views(self, preference):
+        issue = preference.issues[0]
+
+        assert preference.issues is preference.issues
+        assert issue.values is issue.values
+        assert isinstance(issue.values, tuple)
+        with pytest.raises(TypeError):
+            preference.issue_weights[issue] = 0.0
+        with pytest.raises(TypeError):
+            preference.value_weights[issue] = {}
+
+        preference[issue] = 0.5
+        assert preference.issue_weights[issue] == 0.5
+
+    def test_copy_is_in_memory_and_independent(self, preference):
+        import copy
+
+        clone = copy.copy(preference)
+        issue = clone.issues[0]
+        clone[issue] = 0.0
+        clone[issue, "x"] = 0.0
+
+        assert clone.profile_json_path == preference.profile_json_path == ""
+        assert preference[issue] == 0.6
+        assert preference[issue, "x"] == 1.0
+        assert np.shares_memory(clone.bid_utilities, preference.bid_utilities)
+        assert clone.bids[0] is not preference.bids[0]
+        assert clone.bids[0] == preference.bids[0]
+
+    def test_conflict_based_model_does_not_mutate_issue_values(self, preference):
+        from nenv import Bid
+        from nenv.OpponentModel.ConflictBasedOpponentModel import (
+            ConflictBasedOpponentModel,
+        )
+
+        issue_a, issue_b = preference.issues
+        values = [issue.values for issue in preference.issues]
+        model = ConflictBasedOpponentModel(preference)
+
+        # Consecutive bids which differ in a single issue are compared
+        model.update(Bid({issue_a: "x", issue_b: "y"}), 0.1)
+        model.update(Bid({issue_a: "y", issue_b: "y"}), 0.2)
+        model.update(Bid({issue_a: "y", issue_b: "z"}), 0.3)
+
+        assert [issue.values for issue in preference.issues] == values
+
+
+class TestParetoFrontier:
+    """Test the Pareto-frontier computation of NegoLog bid spaces."""
+
+    @staticmethod
+    def brute_force(points):
+        return [
+            not any(
+                np.all(other >= point) and np.any(other > point) for other in points
+            )
+            for point in points
+        ]
+
+    @pytest.mark.parametrize("n_agents", [2, 3, 4])
+    def test_matches_brute_force(self, n_agents):
+        from nenv.BidSpace import pareto_mask
+
+        rng = np.random.default_rng(n_agents)
+        for _ in range(20):
+            # Coarse utilities to have equal and partially equal points
+            points = rng.integers(0, 6, size=(60, n_agents)) / 5
+            assert pareto_mask(points).tolist() == self.brute_force(points)
+
+        assert pareto_mask(np.zeros((0, n_agents))).tolist() == []
+
+    def test_bid_space_pareto(self):
+        from nenv import BidSpace, EditablePreference
+
+        issues = {
+            "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+            "b": {"x": 0.0, "y": 0.5, "z": 1.0},
+            "c": {"x": 1.0, "y": 0.0},
+        }
+        pref_a = EditablePreference({"a": 0.5, "b": 0.25, "c": 0.25}, issues)
+        pref_b = EditablePreference(
+            {"a": 0.25, "b": 0.5, "c": 0.25},
+            {
+                name: dict(zip(v, reversed(list(v.values()))))
+                for name, v in issues.items()
+            },
+        )
+        bid_space = BidSpace(pref_a, pref_b)
+
+        points = np.array([(p.utility_a, p.utility_b) for p in bid_space.bid_points])
+        expected = [
+            point
+            for point, optimal in zip(bid_space.bid_points, self.brute_force(points))
+            if optimal
+        ]
+
+        assert [p.utility_a for p in bid_space.pareto] == [
+            p.utility_a for p in expected
+        ]
+        assert all(a is b for a, b in zip(bid_space.pareto, expected))
+
+
+class TestColumnarBidSpace:
+    """Test the array-backed metrics of NegoLog bid spaces."""
+
+    @pytest.fixture
+    def bid_space(self):
+        from nenv import BidSpace, EditablePreference
+
+        pref_a = EditablePreference(
+            {"a": 0.5, "b": 0.3, "c": 0.2},
+            {
+                "a": {"x": 1.0, "y": 0.5, "z": 0.0},
+                "b": {"x": 0.0, "y": 1.0},
+                "c": {"x": 1.0, "y": 0.3, "z": 0.6, "w": 0.0},
+            },
+        )
+        # Other issue and value order than AgentA
+        pref_b = EditablePreference(
+            {"c": 0.4, "b": 0.1, "a": 0.5},
+            {
+                "c": {"w": 1.0, "z": 0.2, "y": 0.7, "x": 0.0},
+                "b": {"y": 0.0, "x": 1.0},
+                "a": {"z": 1.0, "y": 0.6, "x": 0.1},
+            },
+        )
+        return BidSpace(pref_a, pref_b)
+
+    def test_utilities_match_preferences(self, bid_space):
+        bids = bid_space.prefA.bids
+
+        assert len(bid_space) == len(bids)
+        assert bid_space.utility_a.tolist() == [
+            bid_space.prefA.get_utility(bid) for bid in bids
+        ]
+        assert np.allclose(
+            bid_space.utility_b, [bid_space.prefB.get_utility(bid) for bid in bids]
+        )
+
+    def test_metrics_match_bid_points(self, bid_space):
+        from nenv import BidPoint
+
+        points = bid_space.bid_points
+
+        nash = max(points, key=lambda p: p.product_score)
+        kalai = max(points, key=lambda p: p.social_welfare)
+        assert bid_space.nash_point is points[points.index(nash)]
+        assert bid_space.kalai_point is points[points.index(kalai)]
+        assert list(bid_space) == points
+
+        bids_a, bids_b = bid_space.prefA.bids, bid_space.prefB.bids
+        balance = sum(a.utility - b.utility for a, b in zip(bids_a, bids_b))
+        assert bid_space.calculate_balance_score() == pytest.approx(
+            balance / len(bids_a)
+        )
+
+        nash_zero = nash - BidPoint(None, 0.0, 0.0)
+        normalized = sum(
+            (a.utility - b.utility)
+            * (nash - BidPoint(None, a.utility, b.utility))
+            / (nash_zero + 1e-12)
+            for a, b in zip(bids_a, bids_b)
+        )
+        assert bid_space.calculate_normalized_balance_score() == pytest.approx(
+            normalized
+        )
+
+
+class TestBidSpaceRegistry:
+    """Test the bid spaces shared by NegoLog sessions and loggers."""
+
+    @staticmethod
+    def make_preference(weight):
+        from nenv import EditablePreference
+
+        return EditablePreference(
+            {"a": weight, "b": 1.0 - weight},
+            {"a": {"x": 1.0, "y": 0.0}, "b": {"x": 0.2, "y": 1.0, "z": 0.5}},
+        )
+
+    def test_equal_profiles_share_bid_space(self):
+        from nenv.BidSpace import BidSpaceRegistry
+
+        registry = BidSpaceRegistry()
+        bid_space = registry.get(self.make_preference(0.3), self.make_preference(0.7))
+
+        assert (
+            registry.get(self.make_preference(0.3), self.make_preference(0.7))
+            is bid_space
+        )
+        assert (
+            registry.get(self.make_preference(0.3), self.make_preference(0.6))
+            is not bid_space
+        )
+        assert len(registry) == 2
+
+        changed = self.make_preference(0.3)
+        changed[changed.issues[0], "x"] = 0.5
+        assert registry.get(changed, self.make_preference(0.7)) is not bid_space
+
+    def test_registry_is_bounded(self):
+        from nenv.BidSpace import BidSpaceRegistry
+
+        registry = BidSpaceRegistry(max_size=2)
+        first = registry.get(self.make_preference(0.1), self.make_preference(0.2))
+        registry.get(self.make_preference(0.3), self.make_preference(0.4))
+        registry.get(self.make_preference(0.5), self.make_preference(0.6))
+
+        assert len(registry) == 2
+        assert (
+            registry.get(self.make_preference(0.1), self.make_preference(0.2))
+            is not first
+        )
+
+
+class TestLazyBidEnumeration:
+    """Test best-first bid enumeration for domains above lazy_threshold."""
+
+    @pytest.fixture
+    def adapters(self, simple_issues, buyer_ufun):
+        from nenv import Issue
+
+        from negmas_negolog import NegologPreferenceAdapter
+
+        def make():
+            issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+            return NegologPreferenceAdapter(
+                ufun=buyer_ufun, issues=issues, issue_names=[i.name for i in issues]
+            )
+
+        lazy, full = make(), make()
+        lazy.lazy_threshold = 0
+        return lazy, full
+
+    def test_enumerates_in_descending_order(self, adapters):
+        """The enumerator yields every bid once, best first."""
+        from nenv.BidEnumerator import BestFirstBidEnumerator
+
+        lazy, full = adapters
+        contributions, offset = lazy._additive_model()
+        enumerated = list(BestFirstBidEnumerator(contributions, offset))
+
+        assert len(enumerated) == len(full.bids)
+        assert len({indices for _, indices in enumerated}) == len(enumerated)
+        assert [u for u, _ in enumerated] == pytest.approx(
+            [bid.utility for bid in full.bids]
+        )
+
+    def test_queries_match_full_bid_space(self, adapters):
+        """get_bid_at and the extreme bids agree with the sorted bid list."""
+        lazy, full = adapters
+
+        assert lazy.max_util_bid == full.max_util_bid
+        assert lazy.min_util_bid == full.min_util_bid
+        for target in [0.0, 0.1, 0.33, 0.5, 0.72, 0.9, 1.0]:
+            assert lazy.get_bid_at(target).utility == pytest.approx(
+                full.get_bid_at(target).utility
+            )
+        assert [b.utility for b in lazy.get_bids_at_range(0.4, 0.8)] == pytest.approx(
+            [b.utility for b in full.get_bids_at_range(0.4, 0.8)]
+        )
+        # The full bid list is never generated
+        assert len(lazy._bids) == 0
+
+    def test_keeps_only_partial_utilities(self, adapters):
+        """A query keeps the partial utilities of both halves, not the bids."""
+        lazy, full = adapters
+        lazy.get_bid_at(0.5)
+
+        assert lazy._lazy_bids.number_of_partial_utilities < len(full.bids)
+
+    def test_huge_domain_loaded_lazily(self, tmp_path, monkeypatch):
+        """A 10^8-bid profile loads and answers mid-range queries lazily."""
+        import json
+
+        from nenv.Preference import domain_loader
+
+        rng = random.Random(0)
+        issues = {f"issue{i}": [f"v{j}" for j in range(10)] for i in range(8)}
+        domain = tmp_path / "domains" / "domainHuge"
+        domain.mkdir(parents=True)
+        for name in ("profileA.json", "profileB.json"):
+            profile = {
+                "reservationValue": 0.0,
+                "issueWeights": {issue: 1 / len(issues) for issue in issues},
+                "issues": {
+                    issue: {value: rng.random() for value in values}
+                    for issue, values in issues.items()
+                },
+            }
+            (domain / name).write_text(json.dumps(profile))
+        monkeypatch.chdir(tmp_path)
+
+        preference, _ = domain_loader("Huge")
+
+        assert preference.domain_size == 10**8
+        assert len(preference._bids) == 0
+        for target in (0.35, 0.5, 0.62):
+            bid = preference.get_bid_at(target)
+            assert bid.utility == pytest.approx(target, abs=1e-4)
+            assert bid.utility == pytest.approx(preference.get_utility(bid))
+            assert bid in preference.get_bids_at_range(bid.utility, bid.utility)
+        assert preference._lazy_bids.number_of_partial_utilities == 2 * 10**4
+        assert len(preference._bids) == 0
+
+    def test_non_additive_ufun_uses_bid_list(self, simple_issues, outcome_space):
+        """Non-additive ufuns fall back to the materialized bid list."""
+        from negmas.preferences import MappingUtilityFunction
+        from nenv import Issue
+
+        from negmas_negolog import NegologPreferenceAdapter
+
+        mapping = {o: float(i) for i, o in enumerate(outcome_space.enumerate())}
+        ufun = MappingUtilityFunction(mapping=mapping, outcome_space=outcome_space)
+        issues = [Issue(i.name, list(i.all)) for i in simple_issues]
+        adapter = NegologPreferenceAdapter(
+            ufun=ufun, issues=issues, issue_names=[i.name for i in issues]
+        )
+        adapter.lazy_threshold = 0
+
+        assert adapter.max_util_bid.utility == max(mapping.values())
+        assert adapter._lazy_bids is None
+
+
+class TestInstrumentation:
+    """Test per-call latency instrumentation of the wrapper."""
+
+    def test_disabled_by_default(self, outcome_space, buyer_ufun, seller_ufun):
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=20)
+        negotiator = BoulwareAgent(name="b")
+        mechanism.add(negotiator, ufun=buyer_ufun)
+        mechanism.add(ConcederAgent(name="c"), ufun=seller_ufun)
+        mechanism.run()
+
+        assert negotiator.latency_stats is None
+
+    def test_records_per_call_latency(
+        self, outcome_space, buyer_ufun, seller_ufun, tmp_path
+    ):
+        import json
+
+        sink = tmp_path / "latency.jsonl"
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=20)
+        negotiator = BoulwareAgent(name="b", latency_sink=sink)
+        mechanism.add(negotiator, ufun=buyer_ufun)
+        mechanism.add(ConcederAgent(name="c"), ufun=seller_ufun)
+        mechanism.run()
+
+        stats = negotiator.latency_stats
+        assert stats["initialize"]["count"] == 1
+        for name in ["propose", "respond", "act", "receive_bid", "bid_to_outcome"]:
+            assert stats[name]["count"] > 0
+            assert 0 <= stats[name]["wall_p50"] <= stats[name]["wall_p95"]
+            assert stats[name]["wall_p95"] <= stats[name]["wall_max"]
+
+        records = [json.loads(line) for line in sink.read_text().splitlines()]
+        assert len(records) == 1
+        assert records[0]["negotiator"] == "b"
+        assert records[0]["stats"]["propose"]["count"] == stats["propose"]["count"]
+
+
+class TestRemoteAgents:
+    """Test running the NegoLog agent in a worker process."""
+
+    @pytest.fixture(scope="class")
+    def pool(self):
+        from negmas_negolog import AgentHostPool
+
+        with AgentHostPool(n_workers=1) as pool:
+            yield pool
+
+    def _run(self, outcome_space, buyer_ufun, seller_ufun, remote):
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=50)
+        mechanism.add(ConcederAgent(name="c", remote=remote), ufun=buyer_ufun)
+        mechanism.add(BoulwareAgent(name="b", remote=remote), ufun=seller_ufun)
+        return mechanism.run()
+
+    def test_matches_local_agents(self, pool, outcome_space, buyer_ufun, seller_ufun):
+        local = self._run(outcome_space, buyer_ufun, seller_ufun, remote=False)
+        remote = self._run(outcome_space, buyer_ufun, seller_ufun, remote=pool)
+
+        assert remote.agreement == local.agreement
+        assert remote.step == local.step
+
+    def test_releases_workers(self, pool, outcome_space, buyer_ufun, seller_ufun):
+        self._run(outcome_space, buyer_ufun, seller_ufun, remote=pool)
+
+        assert pool.load == [0]
+        assert pool.hosted == [0]
+
+    @pytest.fixture
+    def gated_requests(self, monkeypatch):
+        """Hold every remote action until the test releases it."""
+        from concurrent.futures import Future
+
+        from negmas_negolog.remote import RemoteAgent
+
+        act_async = RemoteAgent.act_async
+        requests = []
+
+        def gated_act_async(self, t):
+            gate = Future()
+            requests.append((act_async(self, t), gate))
+            return gate
+
+        monkeypatch.setattr(RemoteAgent, "act_async", gated_act_async)
+        return requests
+
+    def test_waits_for_remote_actions(
+        self, pool, outcome_space, buyer_ufun, seller_ufun, gated_requests
+    ):
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=50)
+        mechanism.add(ConcederAgent(name="c", remote=pool), ufun=buyer_ufun)
+        mechanism.add(BoulwareAgent(name="b", remote=pool), ufun=seller_ufun)
+
+        # The first offer and the response to it are both awaited
+        for _ in range(2):
+            state = mechanism.step()
+            assert state.waiting and state.step == 0
+            assert mechanism.step().step == 0
+            assert len(gated_requests) == 1
+
+            reply, gate = gated_requests.pop()
+            gate.set_result(reply.result())
+
+        assert mechanism.step().step == 1
+
+        while mechanism.state.running:
+            for reply, gate in gated_requests:
+                gate.set_result(reply.result())
+            gated_requests.clear()
+            mechanism.step()
+        assert pool.load == [0]
+
+    def test_does_not_resend_a_running_action(
+        self, pool, outcome_space, buyer_ufun, seller_ufun, gated_requests
+    ):
+        import copy
+
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=50)
+        negotiator = ConcederAgent(name="c", remote=pool)
+        mechanism.add(negotiator, ufun=buyer_ufun)
+        mechanism.add(BoulwareAgent(name="b", remote=pool), ufun=seller_ufun)
+        assert mechanism.step().waiting
+        assert len(gated_requests) == 1
+
+        # The step changes while the first action is still running
+        later = copy.copy(mechanism.state)
+        later.step = 1
+        later.current_offer = next(iter(outcome_space.enumerate()))
+        assert negotiator.respond(later) == ResponseType.WAIT
+        assert len(gated_requests) == 1
+
+        # Once it finishes, the action of the new step is requested
+        reply, gate = gated_requests.pop()
+        gate.set_result(reply.result())
+        assert negotiator.respond(later) == ResponseType.WAIT
+        assert len(gated_requests) == 1
+
+        reply, gate = gated_requests.pop()
+        gate.set_result(reply.result())
+        assert negotiator.respond(later) != ResponseType.WAIT
+        assert gated_requests == []
+
+        mechanism.on_negotiation_end()
+        assert pool.load == [0]
+
+    def test_runall_matches_local_agents(
+        self, pool, outcome_space, buyer_ufun, seller_ufun
+    ):
+        def mechanisms(remote):
+            result = []
+            for first, second in [
+                (ConcederAgent, BoulwareAgent),
+                (LinearAgent, BoulwareAgent),
+            ]:
+                mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=50)
+                mechanism.add(first(name="a", remote=remote), ufun=buyer_ufun)
+                mechanism.add(second(name="b", remote=remote), ufun=seller_ufun)
+                result.append(mechanism)
+            return result
+
+        local = SAOMechanism.runall(mechanisms(False), method="ordered")
+        remote = SAOMechanism.runall(mechanisms(pool), method="ordered")
+
+        assert [s.agreement for s in remote] == [s.agreement for s in local]
+        assert [s.step for s in remote] == [s.step for s in local]
+
+    def test_frees_agents_when_negotiation_times_out_waiting(
+        self, pool, outcome_space, buyer_ufun, seller_ufun, gated_requests
+    ):
+        mechanism = SAOMechanism(outcome_space=outcome_space, n_steps=50, max_wait=2)
+        mechanism.add(ConcederAgent(name="c", remote=pool), ufun=buyer_ufun)
+        mechanism.add(BoulwareAgent(name="b", remote=pool), ufun=seller_ufun)
+
+        state = mechanism.run()
+
+        assert state.timedout
+        assert len(gated_requests) == 1
+        assert pool.load == [0]
+        assert pool.hosted == [0]